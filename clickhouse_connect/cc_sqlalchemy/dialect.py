@@ -2,7 +2,7 @@ from typing import Any, cast
 
 import sqlalchemy.schema as sa_schema
 from sqlalchemy import text
-from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.engine.default import DefaultDialect, DefaultExecutionContext
 from sqlalchemy.exc import NoResultFound, NoSuchTableError
 
 from clickhouse_connect import dbapi
@@ -21,6 +21,12 @@ from clickhouse_connect.dbapi.cursor import Cursor
 from clickhouse_connect.driver.binding import quote_identifier
 
 
+class ChExecutionContext(DefaultExecutionContext):
+    def create_server_side_cursor(self):
+        # Used for the stream_results execution option, which reads the result with a streaming DB-API cursor
+        return self._dbapi_connection.cursor(stream=True)
+
+
 class ClickHouseDialect(DefaultDialect):
     """
     See :py:class:`sqlalchemy.engine.interfaces`
@@ -37,6 +43,8 @@ class ClickHouseDialect(DefaultDialect):
     inline_comments = True
     returns_unicode_strings = True
     postfetch_lastrowid = False
+    supports_server_side_cursors = True
+    execution_ctx_cls = ChExecutionContext
     ddl_compiler = ChDDLCompiler
     statement_compiler = ChStatementCompiler
     preparer = ChIdentifierPreparer  # type: ignore[assignment]
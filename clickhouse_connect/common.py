@@ -92,3 +92,48 @@ _init_common("max_error_size", (), 1024)
 
 # HTTP raw data buffer for streaming queries.  This should not be reduced below 64KB to ensure compatibility with LZ4 compression
 _init_common("http_buffer_size", (), 10 * 1024 * 1024)
+
+# Number of threads used to decode the columns of each Native query block concurrently.  0 or 1 decodes every column
+# on the calling thread.  Fixed width and String columns are decoded by the worker threads, which is most effective
+# on free-threaded Python builds
+_init_common("decode_workers", (), 0)
+
+# Number of threads used to serialize and compress Native insert blocks concurrently.  0 or 1 serializes each block
+# on the thread that streams the insert body
+_init_common("encode_workers", (), 0)
+
+# Number of pooled connections used by DB-API executemany to run the queries for statements other than bulk inserts
+# concurrently, one query per parameter row with results kept in parameter order.  0 or 1 runs them one at a time.
+# Clients with a session ID always run them one at a time, since ClickHouse rejects concurrent queries in a session.
+# Synchronous clients generate a session ID unless created with autogenerate_session_id=False
+_init_common("executemany_workers", (), 0)
+
+# Number of pooled connections used by query_df_parallel, query_np_parallel and query_arrow_parallel to run the split
+# queries concurrently.  0 or 1 runs them one at a time.  Clients with a session ID always run them one at a time
+_init_common("parallel_query_workers", (), 4)
+
+# Number of pooled connections used by insert_parallel to upload the slices of an insert concurrently.  0 or 1 inserts
+# them one at a time.  Clients with a session ID always insert them one at a time
+_init_common("parallel_insert_workers", (), 4)
+
+# Return fixed width NumPy columns as read-only views over the received response chunks instead of copies.  A column
+# is only copied if it spans two chunks.  Each view keeps its whole chunk alive for the life of the array
+_init_common("numpy_zero_copy", (True, False), False)
+
+# Maximum number of DESCRIBE TABLE results each client caches for inserts that do not specify column types, and the
+# number of seconds each cached result is used.  0 disables the cache.  Applies to clients created after the change
+_init_common("schema_cache_size", (), 0)
+_init_common("schema_cache_ttl", (), 60)
+
+# Maximum total bytes of SELECT query responses each client caches, and the number of seconds each cached response is
+# used.  Cached responses are parsed again on each hit, so the cache skips only the round trip to the server.  0
+# disables the cache.  Applies to clients created after the change
+_init_common("result_cache_size", (), 0)
+_init_common("result_cache_ttl", (), 60)
+
+# Number of seconds the server version, timezone, settings definitions and protocol version retrieved when a client is
+# created are shared with later clients for the same server and user, which then skip the three initialization queries.
+# 0 disables the cache.  If server_info_cache_file is set, the cache is also stored in that JSON file so that it is
+# shared between processes.  Clients authenticated with an access token do not use the cache
+_init_common("server_info_cache_ttl", (), 0)
+_init_common("server_info_cache_file", (), "")
@@ -1,7 +1,7 @@
 import array
 import logging
 from abc import ABC
-from collections.abc import Collection, MutableSequence, Sequence
+from collections.abc import Callable, Collection, MutableSequence, Sequence
 from math import log
 from typing import Any, NamedTuple
 
@@ -10,6 +10,7 @@ from clickhouse_connect.driver import options
 from clickhouse_connect.driver.common import array_type, int_size, low_card_version, write_array, write_uint64
 from clickhouse_connect.driver.context import BaseQueryContext
 from clickhouse_connect.driver.ctypes import data_conv
+from clickhouse_connect.driver.errors import NONE_IN_NULLABLE_COLUMN, handle_error
 from clickhouse_connect.driver.exceptions import NotSupportedError
 from clickhouse_connect.driver.insert import InsertContext
 from clickhouse_connect.driver.query import QueryContext
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 ch_read_formats: dict[type, str] = {}
 ch_write_formats: dict[type, str] = {}
 
+# Reads one block of a column given the read buffer, the block row count, and the query context
+ColumnReader = Callable[[ByteSource, int, QueryContext], Sequence]
+
 
 class TypeDef(NamedTuple):
     """
@@ -164,6 +168,38 @@ class ClickHouseType(ABC):  # noqa: B024
         read_state = self.read_column_prefix(source, ctx)
         return self.read_column_data(source, num_rows, ctx, read_state)
 
+    def column_reader(self, ctx: QueryContext) -> ColumnReader:
+        """
+        Build the reader used for this column in every block of a query.  Called once per column, with ctx already
+        started on the column, so that types can resolve formats, encodings, timezones, and null values up front
+        instead of on every block.  The default reader resolves everything per block
+        :param ctx: QueryContext for query specific settings
+        :return: Callable that reads and finalizes one block of the column
+        """
+        return self.read_column
+
+    def fixed_column_size(self, num_rows: int) -> int:
+        """
+        Native byte size of a column that can be determined from the row count alone, without reading the data
+        :param num_rows: Number of rows in the column
+        :return: The column size in bytes, or 0 if the size depends on the column data
+        """
+        if self.low_card or not self.byte_size:
+            return 0
+        return self.byte_size * num_rows + (num_rows if self.nullable else 0)
+
+    def read_raw_column(self, source: ByteSource, num_rows: int) -> bytes | None:
+        """
+        Read the undecoded native bytes of a column so that it can be decoded later from a separate buffer
+        :param source: Native protocol binary read buffer
+        :param num_rows: Number of rows expected in the column
+        :return: The raw column bytes, or None if the column extent is only known by decoding it
+        """
+        size = self.fixed_column_size(num_rows)
+        if size:
+            return source.read_bytes(size)
+        return None
+
     def read_column_data(self, source: ByteSource, num_rows: int, ctx: QueryContext, read_state: Any) -> Sequence:
         """
         Public read method for all ClickHouseType data type columns
@@ -174,6 +210,8 @@ class ClickHouseType(ABC):  # noqa: B024
         :return: The decoded column
         """
         if self.low_card:
+            if ctx.as_pandas and num_rows and self.read_format(ctx) == "category":
+                return self._read_low_card_categorical(source, ctx, read_state)
             column = self._read_low_card_column(source, num_rows, ctx, read_state)
         elif self.nullable:
             column = self._read_nullable_column(source, num_rows, ctx, read_state)
@@ -245,15 +283,31 @@ class ClickHouseType(ABC):  # noqa: B024
     def _read_low_card_column(self, source: ByteSource, num_rows: int, ctx: QueryContext, read_state: Any):
         if num_rows == 0:
             return []
+        index, keys = self._read_low_card_parts(source, ctx, read_state)
+        if self.nullable:
+            return self._build_lc_nullable_column(index, keys, ctx)
+        return self._build_lc_column(index, keys, ctx)
+
+    def _read_low_card_parts(self, source: ByteSource, ctx: QueryContext, read_state: Any) -> tuple[Sequence, array.array]:
         key_data = source.read_uint64()
         key_sz = 2 ** (key_data & 0xFF)
         index_cnt = source.read_uint64()
         index = self._read_column_binary(source, index_cnt, ctx, read_state)
         key_cnt = source.read_uint64()
         keys = source.read_array(array_type(key_sz, False), key_cnt)
+        return index, keys
+
+    def _read_low_card_categorical(self, source: ByteSource, ctx: QueryContext, read_state: Any):
+        """
+        Build a Pandas Categorical directly from the block dictionary and keys, without expanding the column.  For
+        Nullable columns the first dictionary entry is the null placeholder, which maps to the Categorical -1 code
+        """
+        index, keys = self._read_low_card_parts(source, ctx, read_state)
+        codes = options.np.asarray(keys).astype(options.np.int32)
         if self.nullable:
-            return self._build_lc_nullable_column(index, keys, ctx)
-        return self._build_lc_column(index, keys, ctx)
+            codes -= 1
+            index = index[1:]
+        return options.pd.Categorical.from_codes(codes, categories=index)
 
     def _build_lc_column(self, index: Sequence, keys: array.array, _ctx: QueryContext):
         return [index[key] for key in keys]
@@ -264,42 +318,36 @@ class ClickHouseType(ABC):  # noqa: B024
     def _write_column_low_card(self, column: Sequence, dest: bytearray, ctx: InsertContext):
         if len(column) == 0:
             return
-        keys: list[int] = []
-        index: list[Any] = []
-        rev_map: dict[Any, int] = {}
-        rmg = rev_map.get
-        if self.nullable:
-            index.append(None)
-            key = 1
-            for x in column:
-                if x is None:
-                    keys.append(0)
-                else:
-                    ix = rmg(x)
-                    if ix is None:
-                        keys.append(key)
-                        index.append(x)
-                        rev_map[x] = key
-                        key += 1
-                    else:
-                        keys.append(ix)
+        if options.pd is not None and isinstance(getattr(column, "dtype", None), options.pd.CategoricalDtype):
+            index, keys = self._categorical_lc_keys(column, ctx)
         else:
-            key = 0
-            for x in column:
-                ix = rmg(x)
-                if ix is None:
-                    keys.append(key)
-                    index.append(x)
-                    rev_map[x] = key
-                    key += 1
-                else:
-                    keys.append(ix)
+            index, keys = data_conv.build_lc_keys(column, self.nullable)
         ix_type = int(log(len(index), 2)) >> 3  # power of two bytes needed to store the total number of keys
         write_uint64((1 << 9) | (1 << 10) | ix_type, dest)  # Index type plus new dictionary (9) and additional keys(10)
         write_uint64(len(index), dest)
         self._write_column_binary(index, dest, ctx)
         write_uint64(len(keys), dest)
-        write_array(array_type(1 << ix_type, False), keys, dest, ctx.column_name)
+        if options.np is None:
+            write_array(array_type(1 << ix_type, False), keys, dest, ctx.column_name)
+        else:
+            if isinstance(keys, array.array):
+                keys = options.np.frombuffer(keys, dtype=options.np.uintc)
+            dest += keys.astype(f"<u{1 << ix_type}").tobytes()
+
+    def _categorical_lc_keys(self, column: Sequence, ctx: InsertContext):
+        """
+        Reuse the categories and codes of a Pandas Categorical (or categorical Series) as the LowCardinality
+        dictionary and keys, so the column values are never hashed.  Missing values have the code -1
+        """
+        if isinstance(column, options.pd.Series):
+            column = column.array
+        codes = options.np.asarray(column.codes, dtype=options.np.int64)  # type: ignore[attr-defined]
+        index = column.categories.tolist()  # type: ignore[attr-defined]
+        if self.nullable:
+            return [None] + index, codes + 1
+        if (codes < 0).any():
+            handle_error(NONE_IN_NULLABLE_COLUMN, ctx)
+        return index, codes
 
     def _active_null(self, _ctx: QueryContext) -> Any:
         return None
@@ -321,7 +369,7 @@ class ArrayType(ClickHouseType, ABC, registered=False):
     _signed = True
     _array_type: str | None = None
     _struct_type: str | None = None
-    valid_formats = "string", "native"
+    valid_formats = "string", "native", "category"
     python_type: type = int
 
     def __init_subclass__(cls, registered: bool = True):
@@ -339,14 +387,31 @@ class ArrayType(ClickHouseType, ABC, registered=False):
         assert self._array_type is not None
         return source.read_array(self._array_type, num_rows)
 
+    def column_reader(self, ctx: QueryContext) -> ColumnReader:
+        # Plain native columns are returned exactly as read, unless a subclass decodes them differently
+        if (
+            self.nullable
+            or self.low_card
+            or self.read_format(ctx) != "native"
+            or type(self)._read_column_binary is not ArrayType._read_column_binary
+        ):
+            return self.read_column
+        if ctx.use_numpy:
+            read_numpy_array = driver_ctypes.numpy_conv.read_numpy_array
+            np_type = self.np_type
+            return lambda source, num_rows, _ctx: read_numpy_array(source, np_type, num_rows)
+        arr_type = self._array_type
+        assert arr_type is not None
+        return lambda source, num_rows, _ctx: source.read_array(arr_type, num_rows)
+
     def _read_nullable_column(self, source: ByteSource, num_rows: int, ctx: QueryContext, _read_state: Any) -> Sequence:
         assert self._array_type is not None
         return data_conv.read_nullable_array(source, self._array_type, num_rows, self._active_null(ctx))
 
     def _build_lc_column(self, index: Sequence, keys: array.array, ctx: QueryContext):
         if ctx.use_numpy:
-            # index is a numpy array when ctx.use_numpy is True
-            return options.np.fromiter((index[key] for key in keys), dtype=index.dtype, count=len(index))  # type: ignore[attr-defined]
+            # index is a numpy array when ctx.use_numpy is True, so the column is a single gather over the keys
+            return index[options.np.asarray(keys)]  # type: ignore[call-overload]
         return super()._build_lc_column(index, keys, ctx)
 
     def _finalize_column(self, column: Sequence, ctx: QueryContext) -> Sequence:
@@ -1,4 +1,3 @@
-import array
 import logging
 from collections.abc import Collection, Sequence
 from typing import Any
@@ -6,7 +5,8 @@ from typing import Any
 from clickhouse_connect.datatypes.base import ClickHouseType, TypeDef
 from clickhouse_connect.datatypes.registry import _canonicalize_variant_name, get_from_name
 from clickhouse_connect.driver.binding import _format_identifier
-from clickhouse_connect.driver.common import first_value, must_swap
+from clickhouse_connect.driver import options
+from clickhouse_connect.driver.common import first_value
 from clickhouse_connect.driver.ctypes import data_conv
 from clickhouse_connect.driver.insert import InsertContext
 from clickhouse_connect.driver.query import QueryContext
@@ -23,6 +23,48 @@ def _nested_identifier(name: str) -> str:
     return _format_identifier(name)
 
 
+def _is_arrow(column: Any) -> bool:
+    # Checked by module name so that pyarrow isn't imported just to test for it
+    return type(column).__module__.startswith("pyarrow")
+
+
+def _flat_array_column(column: Any):
+    """
+    Returns the UInt64 row end offsets and the flattened values of an Array column that is a multidimensional
+    NumPy array or a PyArrow list array without nulls, or None for any other column
+    """
+    np = options.np
+    if np is None:
+        return None
+    if isinstance(column, np.ndarray):
+        if column.ndim < 2:
+            return None
+        num_rows, row_size = column.shape[:2]
+        offsets = np.arange(1, num_rows + 1, dtype=np.uint64) * np.uint64(row_size)
+        return offsets, column.reshape((num_rows * row_size,) + column.shape[2:])
+    if not _is_arrow(column):
+        return None
+    pa = options.arrow
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    if column.null_count:
+        return None
+    if isinstance(column, pa.FixedSizeListArray):
+        offsets = np.arange(1, len(column) + 1, dtype=np.uint64) * np.uint64(column.type.list_size)
+    elif isinstance(column, (pa.ListArray, pa.LargeListArray)):
+        raw_offsets = column.offsets.to_numpy()
+        offsets = (raw_offsets[1:] - raw_offsets[0]).astype(np.uint64)
+    else:
+        return None
+    values = column.flatten()
+    value_type = values.type
+    if pa.types.is_list(value_type) or pa.types.is_large_list(value_type) or pa.types.is_fixed_size_list(value_type):
+        return offsets, values
+    if (pa.types.is_integer(value_type) or pa.types.is_floating(value_type)) and not values.null_count:
+        return offsets, values.to_numpy()
+    return offsets, values.to_pylist()
+
+
 class Array(ClickHouseType):
     __slots__ = ("element_type", "_insert_name")
     python_type = list
@@ -67,35 +109,28 @@ class Array(ClickHouseType):
             all_values = []
         column = all_values if isinstance(all_values, list) else list(all_values)
         for offset_range in reversed(offset_sizes):
-            data = []
-            last = 0
-            for x in offset_range:
-                data.append(column[last:x])
-                last = x
-            column = data
+            column = data_conv.unflatten_array_col(column, offset_range)
         return column
 
     def write_column_prefix(self, dest: bytearray):
         self.element_type.write_column_prefix(dest)
 
     def write_column_data(self, column: Sequence, dest: bytearray, ctx: InsertContext):
+        flat = _flat_array_column(column)
+        if flat is not None:
+            offsets, values = flat
+            dest += offsets.astype("<u8", copy=False).tobytes()
+            self.element_type.write_column_data(values, dest, ctx)
+            return
+        if _is_arrow(column):
+            column = column.to_pylist()  # type: ignore[attr-defined]
         final_type = self.element_type
         depth = 1
         while isinstance(final_type, Array):
             depth += 1
             final_type = final_type.element_type
         for _ in range(depth):
-            total = 0
-            data = []
-            offsets = array.array("Q")
-            for x in column:
-                total += len(x)
-                offsets.append(total)
-                data.extend(x)
-            if must_swap:
-                offsets.byteswap()
-            dest += offsets.tobytes()
-            column = data
+            column = data_conv.flatten_array_col(column, dest)
         final_type.write_column_data(column, dest, ctx)
 
 
@@ -10,6 +10,7 @@ from clickhouse_connect.driver import ctypes as driver_ctypes
 from clickhouse_connect.driver import options
 from clickhouse_connect.driver.common import array_type, decimal_prec, decimal_size, first_value, write_array
 from clickhouse_connect.driver.ctypes import data_conv
+from clickhouse_connect.driver.exceptions import DataError
 from clickhouse_connect.driver.insert import InsertContext
 from clickhouse_connect.driver.query import QueryContext
 from clickhouse_connect.driver.types import ByteSource
@@ -76,7 +77,7 @@ class Int64(IntBase):
 
 
 class UInt64(IntBase):
-    valid_formats = "signed", "native"
+    valid_formats = "signed", "native", "category"
     _array_type = "Q"
     np_type = "<u8"
     python_type = int
@@ -105,59 +106,61 @@ class UInt64(IntBase):
 
 class BigInt(ClickHouseType, registered=False):
     _signed = True
-    valid_formats = "string", "native"
+    valid_formats: tuple[str, ...] = "string", "native"
     python_type = int
 
     def _read_column_binary(self, source: ByteSource, num_rows: int, ctx: QueryContext, _read_state: Any):
-        signed = self._signed
-        sz = self.byte_size
-        column: list[Any] = []
-        app = column.append
-        ifb = int.from_bytes
-        if self.read_format(ctx) == "string":
-            for _ in range(num_rows):
-                app(str(ifb(source.read_bytes(sz), "little", signed=signed)))
-        else:
-            for _ in range(num_rows):
-                app(ifb(source.read_bytes(sz), "little", signed=signed))
+        if self.read_format(ctx) == "hilo":
+            return driver_ctypes.numpy_conv.read_numpy_array(source, "<u8", num_rows * 2).view(self._hilo_dtype())
+        return data_conv.read_bigint_col(source, num_rows, self.byte_size, self._signed)
+
+    def _read_nullable_column(self, source: ByteSource, num_rows: int, ctx: QueryContext, read_state: Any) -> Sequence:
+        if self.read_format(ctx) == "hilo":
+            # Null values are sent as zero, so the null map is not needed for the structured array
+            source.read_bytes(num_rows)
+            return self._read_column_binary(source, num_rows, ctx, read_state)
+        return super()._read_nullable_column(source, num_rows, ctx, read_state)
+
+    def _finalize_column(self, column: Sequence, ctx: QueryContext) -> Sequence:
+        fmt = self.read_format(ctx)
+        if fmt == "string":
+            return [None if x is None else str(x) for x in column]
+        if fmt == "native" and ctx.use_numpy:
+            return options.np.array(column, dtype=object)
         return column
 
+    def _hilo_dtype(self):
+        # Fields are in little endian memory order, so the wire bytes can be viewed without conversion
+        return options.check_numpy().dtype([("lo", "<u8"), ("hi", "<i8" if self._signed else "<u8")])
+
     def _write_column_binary(self, column: Sequence | MutableSequence, dest: bytearray, ctx: InsertContext):
         if len(column) == 0:
             return
-        first = first_value(column, self.nullable)
-        sz = self.byte_size
-        signed = self._signed
-        empty = bytes(b"\x00" * sz)
-        ext = dest.extend
-        if isinstance(first, str) or self.write_format(ctx) == "string":
-            if self.nullable:
-                for x in column:
-                    if x:
-                        ext(int(x).to_bytes(sz, "little", signed=signed))
-                    else:
-                        ext(empty)
-            else:
-                for x in column:
-                    ext(int(x).to_bytes(sz, "little", signed=signed))
-        else:
-            if self.nullable:
-                for x in column:
-                    if x:
-                        ext(x.to_bytes(sz, "little", signed=signed))
-                    else:
-                        ext(empty)
-            else:
-                for x in column:
-                    ext(x.to_bytes(sz, "little", signed=signed))
+        np = options.np
+        if (
+            self.byte_size == 16
+            and np is not None
+            and isinstance(column, np.ndarray)
+            and column.dtype.names
+            and {"hi", "lo"} <= set(column.dtype.names)
+        ):
+            # Structured casts match fields by position, so the halves are copied by name for any field order
+            out = np.empty(len(column), self._hilo_dtype())
+            out["lo"] = column["lo"]
+            out["hi"] = column["hi"]
+            dest += out.tobytes()
+            return
+        data_conv.write_bigint_col(column, self.nullable, self.byte_size, self._signed, dest)
 
 
 class Int128(BigInt):
+    valid_formats = "string", "native", "hilo"
     byte_size = 16
     _signed = True
 
 
 class UInt128(BigInt):
+    valid_formats = "string", "native", "hilo"
     byte_size = 16
     _signed = False
 
@@ -354,6 +357,7 @@ class Enum16(Enum):
 class Decimal(ClickHouseType):
     __slots__ = "prec", "scale", "_mult", "_zeros", "byte_size", "_array_type"
     python_type = decimal.Decimal
+    valid_formats = "native", "int", "float"
     dec_size = 0
 
     @classmethod
@@ -379,7 +383,21 @@ class Decimal(ClickHouseType):
         self._name_suffix = f"({prec}, {scale})"
         self._array_type = array_type(self.byte_size, True)
 
-    def _read_column_binary(self, source: ByteSource, num_rows: int, _ctx: QueryContext, _read_state: Any):
+    def _read_column_binary(self, source: ByteSource, num_rows: int, ctx: QueryContext, _read_state: Any):
+        fmt = self.read_format(ctx)
+        if fmt == "native":
+            return self._read_decimals(source, num_rows)
+        # The int format returns the unscaled integers as sent, and float divides them by the scale multiplier
+        if ctx.use_numpy and self.byte_size <= 8:
+            column = driver_ctypes.numpy_conv.read_numpy_array(source, f"<i{self.byte_size}", num_rows)
+            return column / self._mult if fmt == "float" else column
+        column = self._read_ints(source, num_rows)
+        if fmt == "float":
+            mult = self._mult
+            return [x / mult for x in column]
+        return column
+
+    def _read_decimals(self, source: ByteSource, num_rows: int) -> Sequence:
         column = source.read_array(self._array_type, num_rows)
         dec = decimal.Decimal
         scale = self.scale
@@ -387,7 +405,52 @@ class Decimal(ClickHouseType):
             return [dec(x) for x in column]
         return [dec(x).scaleb(-scale) for x in column]
 
+    def _read_ints(self, source: ByteSource, num_rows: int) -> Sequence:
+        return source.read_array(self._array_type, num_rows)
+
+    def _finalize_column(self, column: Sequence, ctx: QueryContext) -> Sequence:
+        fmt = self.read_format(ctx)
+        if fmt == "native" or not ctx.use_numpy or isinstance(column, options.np.ndarray):
+            return column
+        if fmt == "float":
+            return options.np.array(column, dtype=options.np.float64)
+        if self.byte_size <= 8 and not (self.nullable and ctx.use_none):
+            return options.np.array(column, dtype=options.np.int64)
+        return options.np.array(column, dtype=object)
+
     def _write_column_binary(self, column: Sequence | MutableSequence, dest: bytearray, ctx: InsertContext):
+        if self.write_format(ctx) == "int":
+            self._write_ints(column, dest, ctx)
+            return
+        np = options.np
+        if np is not None and isinstance(column, np.ndarray) and len(column):
+            # NumPy columns are scaled in bulk.  Integers of the 128 and 256 bit decimals are scaled as Python ints so the
+            # products can't overflow, and only floats of the 32 and 64 bit decimals are rounded to the nearest unit of the scale
+            kind = column.dtype.kind
+            if kind in ("i", "u") and self.byte_size <= 8:
+                # Checked before scaling so the int64 product can't overflow
+                self._check_range(column, 10 ** (self.prec - self.scale), ctx)
+                column = column.astype(np.int64) * self._mult
+            elif kind in ("i", "u"):
+                column = column.astype(object) * self._mult
+                self._check_range(column, 10**self.prec, ctx)
+            elif kind == "f" and self.byte_size <= 8:
+                if not np.isfinite(column).all():
+                    raise DataError(f"NaN or infinite value for {self.name} column `{ctx.column_name}`")
+                column = np.rint(column * self._mult)
+                self._check_range(column, 10**self.prec, ctx)
+            else:
+                self._write_decimals(column, dest, ctx)
+                return
+            self._write_ints(column, dest, ctx)
+            return
+        self._write_decimals(column, dest, ctx)
+
+    def _check_range(self, column, limit: int, ctx: InsertContext):
+        if column.max() >= limit or column.min() <= -limit:
+            raise DataError(f"Value out of range for {self.name} column `{ctx.column_name}`")
+
+    def _write_decimals(self, column: Sequence | MutableSequence, dest: bytearray, ctx: InsertContext):
         with decimal.localcontext() as dec_ctx:
             dec_ctx.prec = self.prec
             dec = decimal.Decimal
@@ -397,16 +460,30 @@ class Decimal(ClickHouseType):
             else:
                 write_array(self._array_type, [int(dec(str(x)) * mult) for x in column], dest, ctx.column_name)
 
+    def _write_ints(self, column: Sequence | MutableSequence, dest: bytearray, ctx: InsertContext):
+        np = options.np
+        if np is not None and isinstance(column, np.ndarray):
+            data_conv.write_native_col(self._array_type, column.astype(f"<i{self.byte_size}"), dest, ctx.column_name)
+            return
+        if self.nullable:
+            column = [0 if x is None else x for x in column]
+        data_conv.write_native_col(self._array_type, column, dest, ctx.column_name)
+
     def _active_null(self, ctx: QueryContext):
         if ctx.use_none:
             return None
+        fmt = self.read_format(ctx)
+        if fmt == "int":
+            return 0
+        if fmt == "float":
+            return nan if ctx.use_numpy else 0.0
         digits = "0".rjust(self.prec, "0")
         scale = self.scale
         return decimal.Decimal(f"{digits[:-scale]}.{digits[-scale:]}")
 
 
 class BigDecimal(Decimal, registered=False):
-    def _read_column_binary(self, source: ByteSource, num_rows: int, _ctx: QueryContext, _read_state: Any):
+    def _read_decimals(self, source: ByteSource, num_rows: int) -> Sequence:
         dec = decimal.Decimal
         scale = self.scale
         column: list[Any] = []
@@ -426,7 +503,10 @@ class BigDecimal(Decimal, registered=False):
                 app(dec(ifb(source.read_bytes(sz), "little", signed=True)).scaleb(-scale))
         return column
 
-    def _write_column_binary(self, column: Sequence | MutableSequence, dest: bytearray, _ctx):
+    def _read_ints(self, source: ByteSource, num_rows: int) -> Sequence:
+        return data_conv.read_bigint_col(source, num_rows, self.byte_size, True)
+
+    def _write_decimals(self, column: Sequence | MutableSequence, dest: bytearray, _ctx):
         with decimal.localcontext() as ctx:
             ctx.prec = self.prec
             mult = decimal.Decimal(f"{self._mult}.{'0' * self.scale}")
@@ -440,6 +520,12 @@ class BigDecimal(Decimal, registered=False):
                 for x in column:
                     dest += itb(int(decimal.Decimal(str(x)) * mult), sz, "little", signed=True)
 
+    def _write_ints(self, column: Sequence | MutableSequence, dest: bytearray, _ctx):
+        np = options.np
+        if np is not None and isinstance(column, np.ndarray):
+            column = column.tolist()
+        data_conv.write_bigint_col(column, self.nullable, self.byte_size, True, dest)
+
 
 class Decimal32(Decimal):
     dec_size = 32
@@ -102,6 +102,12 @@ class SimpleAggregateFunction(ClickHouseType):
     def _data_size(self, sample: Collection[Any]) -> int:
         return self.element_type.data_size(sample)
 
+    def fixed_column_size(self, num_rows: int) -> int:
+        return self.element_type.fixed_column_size(num_rows)
+
+    def read_raw_column(self, source: ByteSource, num_rows: int) -> bytes | None:
+        return self.element_type.read_raw_column(source, num_rows)
+
     def read_column_prefix(self, source: ByteSource, ctx: QueryContext):
         return self.element_type.read_column_prefix(source, ctx)
 
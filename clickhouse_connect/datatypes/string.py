@@ -1,7 +1,7 @@
 from collections.abc import Collection, MutableSequence, Sequence
 from typing import Any
 
-from clickhouse_connect.datatypes.base import ClickHouseType, TypeDef
+from clickhouse_connect.datatypes.base import ClickHouseType, ColumnReader, TypeDef
 from clickhouse_connect.driver import options
 from clickhouse_connect.driver.common import first_value
 from clickhouse_connect.driver.ctypes import data_conv
@@ -13,7 +13,7 @@ from clickhouse_connect.driver.types import ByteSource
 
 class String(ClickHouseType):
     python_type = str
-    valid_formats = "bytes", "native"
+    valid_formats = "bytes", "native", "category"
 
     def _active_encoding(self, ctx):
         if self.read_format(ctx) == "bytes":
@@ -37,8 +37,30 @@ class String(ClickHouseType):
     def _read_nullable_column(self, source: ByteSource, num_rows: int, ctx: QueryContext, read_state: Any) -> Sequence:
         return source.read_str_col(num_rows, self._active_encoding(ctx), True, self._active_null(ctx))
 
+    def column_reader(self, ctx: QueryContext) -> ColumnReader:
+        if (
+            self.low_card
+            or ctx.use_extended_dtypes
+            or (ctx.use_numpy and ctx.max_str_len)
+            or type(self)._read_column_binary is not String._read_column_binary
+        ):
+            return self.read_column
+        encoding = self._active_encoding(ctx)
+        if self.nullable:
+            null_obj = self._active_null(ctx)
+            return lambda source, num_rows, _ctx: source.read_str_col(num_rows, encoding, True, null_obj)
+        return lambda source, num_rows, _ctx: source.read_str_col(num_rows, encoding)
+
+    def read_raw_column(self, source: ByteSource, num_rows: int) -> bytes | None:
+        if self.low_card:
+            return None
+        if self.nullable:
+            null_map = source.read_bytes(num_rows)
+            return bytes(null_map) + source.read_str_col_raw(num_rows)
+        return source.read_str_col_raw(num_rows)
+
     def _finalize_column(self, column: Sequence, ctx: QueryContext) -> Sequence:
-        if ctx.use_extended_dtypes and self.read_format(ctx) == "native":
+        if ctx.use_extended_dtypes and self.read_format(ctx) != "bytes":
             return options.pd.array(column, dtype=options.pd.StringDtype())
         if ctx.use_numpy and ctx.max_str_len:
             return options.np.array(column, dtype=f"<U{ctx.max_str_len}")
@@ -60,7 +82,7 @@ class String(ClickHouseType):
 
 class FixedString(ClickHouseType):
     python_type = str
-    valid_formats = "string", "native"
+    valid_formats = "string", "native", "category"
 
     def __init__(self, type_def: TypeDef):
         super().__init__(type_def)
@@ -71,7 +93,7 @@ class FixedString(ClickHouseType):
     def _active_null(self, ctx: QueryContext):
         if ctx.use_none:
             return None
-        return self._empty_bytes if self.read_format(ctx) == "native" else ""
+        return "" if self.read_format(ctx) == "string" else self._empty_bytes
 
     @property
     def np_type(self):
@@ -6,14 +6,14 @@ import zoneinfo
 from abc import abstractmethod
 from collections.abc import Callable, MutableSequence, Sequence
 from datetime import date, datetime, time, timedelta, tzinfo
-from math import floor
+from functools import partial
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 if TYPE_CHECKING:
     import numpy
 
 from clickhouse_connect import common
-from clickhouse_connect.datatypes.base import ClickHouseType, TypeDef
+from clickhouse_connect.datatypes.base import ClickHouseType, ColumnReader, TypeDef
 from clickhouse_connect.driver import ctypes as driver_ctypes
 from clickhouse_connect.driver import options, tzutil
 from clickhouse_connect.driver.common import first_value, int_size, np_date_types, write_array
@@ -52,7 +52,7 @@ class Date(ClickHouseType):
     _array_type = "H"
     np_type = "datetime64[D]"
     nano_divisor = 86400 * 1000000000
-    valid_formats = "native", "int"
+    valid_formats = "native", "int", "category"
     python_type = date
     byte_size = 2
 
@@ -137,7 +137,7 @@ class Date32(Date):
 class DateTimeBase(ClickHouseType, registered=False):
     __slots__ = ("tzinfo",)
     tzinfo: tzinfo | None
-    valid_formats = "native", "int"
+    valid_formats = "native", "int", "category"
     python_type = datetime
 
     @property
@@ -157,6 +157,20 @@ class DateTimeBase(ClickHouseType, registered=False):
             return options.np.datetime64(0, self._null_time_unit)
         return epoch_start_datetime
 
+    def _naive_timestamp(self, ctx: InsertContext) -> Callable[[datetime], float] | None:
+        """
+        Returns the function that converts naive insert datetimes to epoch timestamps, or None when naive values
+        are in UTC and can be converted directly from their fields
+        """
+        if common.get_setting("naive_datetime_insert") == "server":
+            active_tz = self.tzinfo or ctx.server_tz
+            if tzutil.is_utc_timezone(active_tz):
+                return None
+            return partial(_localized_timestamp, target_tz=active_tz)
+        if tzutil.local_is_utc():
+            return None
+        return datetime.timestamp
+
     def _finalize_column(self, column: Sequence, ctx: QueryContext) -> Sequence:
         if ctx.use_extended_dtypes:
             if isinstance(column, options.np.ndarray) and options.np.issubdtype(column.dtype, options.np.datetime64):
@@ -211,23 +225,21 @@ class DateTime(DateTimeBase):
             return np_array
         return data_conv.read_datetime_col(source, num_rows, active_tz)
 
+    def column_reader(self, ctx: QueryContext) -> ColumnReader:
+        if self.nullable or self.low_card or ctx.use_numpy or ctx.use_extended_dtypes or self.read_format(ctx) != "native":
+            return self.read_column
+        read_datetime_col = data_conv.read_datetime_col
+        active_tz = ctx.active_tz(self.tzinfo)
+        return lambda source, num_rows, _ctx: read_datetime_col(source, num_rows, active_tz)
+
     def _write_column_binary(self, column: Sequence | MutableSequence, dest: bytearray, ctx: InsertContext):
         first = first_value(column, self.nullable)
         if isinstance(first, int) or self.write_format(ctx) == "int":
             if self.nullable:
                 column = [x if x else 0 for x in column]
-        elif common.get_setting("naive_datetime_insert") == "server":
-            active_tz = self.tzinfo or ctx.server_tz
-            if self.nullable:
-                column = [int(_localized_timestamp(x, active_tz)) if x else 0 for x in column]
-            else:
-                column = [int(_localized_timestamp(x, active_tz)) for x in column]
-        else:
-            if self.nullable:
-                column = [int(x.timestamp()) if x else 0 for x in column]
-            else:
-                column = [int(x.timestamp()) for x in column]
-        write_array(self._array_type, column, dest, ctx.column_name)
+            write_array(self._array_type, column, dest, ctx.column_name)
+            return
+        data_conv.write_datetime_col(column, self.nullable, 1, self._naive_timestamp(ctx), self.byte_size, dest, ctx.column_name)
 
 
 class DateTime64(DateTimeBase):
@@ -294,36 +306,9 @@ class DateTime64(DateTimeBase):
         if isinstance(first, int) or self.write_format(ctx) == "int":
             if self.nullable:
                 column = [x if x else 0 for x in column]
-        else:
-            prec = self.prec
-            server_mode = common.get_setting("naive_datetime_insert") == "server"
-            active_tz = (self.tzinfo or ctx.server_tz) if server_mode else None
-            if isinstance(first, str):
-                original_column = column
-                column = []
-
-                for x in original_column:
-                    if not x and self.nullable:
-                        v = 0
-                    else:
-                        dt = datetime.fromisoformat(x)
-                        timestamp = _localized_timestamp(dt, active_tz) if active_tz is not None else dt.timestamp()
-                        v = ((floor(timestamp) * 1000000 + dt.microsecond) * prec) // 1000000
-
-                    column.append(v)
-            elif active_tz is not None:
-                if self.nullable:
-                    column = [
-                        ((floor(_localized_timestamp(x, active_tz)) * 1000000 + x.microsecond) * prec) // 1000000 if x else 0
-                        for x in column
-                    ]
-                else:
-                    column = [((floor(_localized_timestamp(x, active_tz)) * 1000000 + x.microsecond) * prec) // 1000000 for x in column]
-            elif self.nullable:
-                column = [((floor(x.timestamp()) * 1000000 + x.microsecond) * prec) // 1000000 if x else 0 for x in column]
-            else:
-                column = [((floor(x.timestamp()) * 1000000 + x.microsecond) * prec) // 1000000 for x in column]
-        write_array("q", column, dest, ctx.column_name)
+            write_array("q", column, dest, ctx.column_name)
+            return
+        data_conv.write_datetime_col(column, self.nullable, self.prec, self._naive_timestamp(ctx), self.byte_size, dest, ctx.column_name)
 
 
 class _HMSParts(NamedTuple):
@@ -86,8 +86,14 @@ class QBit(ClickHouseType):
         if self.nullable:
             null_map = source.read_bytes(num_rows)
 
-        tuple_data = self._tuple_type.read_column_data(source, num_rows, ctx, read_state)
-        vectors = [self._untranspose_row(t) for t in tuple_data]
+        if options.np is not None:
+            matrix = self._untranspose_column(source, num_rows)
+            if ctx.use_numpy and not self.nullable:
+                return matrix
+            vectors = matrix.tolist()
+        else:
+            tuple_data = self._tuple_type.read_column_data(source, num_rows, ctx, read_state)
+            vectors = [self._untranspose_row(t) for t in tuple_data]
         if self.nullable:
             return data_conv.build_nullable_column(vectors, cast(bytes, null_map), self._active_null(ctx))
         return vectors
@@ -103,11 +109,64 @@ class QBit(ClickHouseType):
         if self.nullable:
             dest += bytes([1 if x is None else 0 for x in column])
 
+        if options.np is not None:
+            self._transpose_column(column, dest)
+            return
+
         null_tuple = tuple(b"\x00" * self._bytes_per_fixedstring for _ in range(self._bits_per_element))
         tuple_column = [null_tuple if row is None else self._transpose_row(row) for row in column]
 
         self._tuple_type.write_column_data(tuple_column, dest, ctx)
 
+    def _untranspose_column(self, source: ByteSource, num_rows: int) -> numpy.ndarray:
+        """Read all bit planes of the column at once and convert them to a (num_rows, dimension) float array."""
+        np = options.np
+        bits = self._bits_per_element
+        raw = source.read_bytes(self.byte_size * num_rows)
+        # Each bit plane is a FixedString column.  Server stores plane bytes reversed (elements 0-7 in the last byte)
+        planes = np.frombuffer(raw, dtype=np.uint8).reshape(bits, num_rows, self._bytes_per_fixedstring)[:, :, ::-1]
+        int_dtype = np.uint64 if self.element_type == "Float64" else np.uint32
+        words = np.zeros((num_rows, self.dimension), dtype=int_dtype)
+        for bit_idx in range(bits):
+            # MSB plane first
+            plane_bits = np.unpackbits(planes[bit_idx], axis=1, count=self.dimension, bitorder="little")
+            words |= plane_bits.astype(int_dtype) << int_dtype(bits - 1 - bit_idx)
+        if self.element_type == "BFloat16":
+            # Shift back up to the top 16 bits of a Float32
+            words <<= np.uint32(16)
+        return words.view(np.float64 if self.element_type == "Float64" else np.float32)
+
+    def _transpose_column(self, column: Sequence, dest: bytearray):
+        """Convert all vectors of the column to bit planes at once and write them as the Tuple element columns."""
+        np = options.np
+        dim = self.dimension
+        float_dtype = np.float64 if self.element_type == "Float64" else np.float32
+        if isinstance(column, np.ndarray) and column.ndim == 2:
+            if column.shape[1] != dim:
+                raise ValueError(f"Vector dimension mismatch: expected {dim}, got {column.shape[1]}")
+            values = column.astype(float_dtype, copy=False)
+        else:
+            zeros = np.zeros(dim, dtype=float_dtype)
+            rows = []
+            for row in column:
+                if row is None:
+                    row = zeros
+                elif len(row) != dim:
+                    raise ValueError(f"Vector dimension mismatch: expected {dim}, got {len(row)}")
+                rows.append(row)
+            values = np.array(rows, dtype=float_dtype)
+        if self.element_type == "BFloat16":
+            # Numpy doesn't have bfloat16, so keep the top 16 bits of the Float32
+            words = (values.view(np.uint32) >> np.uint32(16)).astype(np.uint16)
+        else:
+            words = values.view(np.uint64 if self.element_type == "Float64" else np.uint32)
+        one = words.dtype.type(1)
+        for bit_idx in range(self._bits_per_element):
+            plane_bits = ((words >> words.dtype.type(self._bits_per_element - 1 - bit_idx)) & one).astype(np.uint8)
+            packed = np.packbits(plane_bits, axis=1, bitorder="little")
+            # Server stores plane bytes in reverse order: elements 0-7 in the last byte
+            dest += packed[:, ::-1].tobytes()
+
     def _active_null(self, ctx: QueryContext):
         """Return context-appropriate null value for nullable QBit columns."""
         if ctx.use_none:
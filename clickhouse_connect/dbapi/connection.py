@@ -52,5 +52,5 @@ class Connection:
     def raw_query(self, query: str) -> QueryResult:
         return self.client.query(query)
 
-    def cursor(self) -> Cursor:
-        return Cursor(self.client)
+    def cursor(self, stream: bool = False) -> Cursor:
+        return Cursor(self.client, stream)
@@ -1,15 +1,18 @@
 import logging
 import re
-from collections.abc import Mapping, Sequence
+from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, cast
 
+from clickhouse_connect import common
 from clickhouse_connect.datatypes.base import ClickHouseType
 from clickhouse_connect.datatypes.registry import get_from_name
 from clickhouse_connect.driver import Client
-from clickhouse_connect.driver.common import unescape_identifier
+from clickhouse_connect.driver.common import StreamContext, unescape_identifier, worker_pool
 from clickhouse_connect.driver.exceptions import DatabaseError, ProgrammingError
 from clickhouse_connect.driver.parser import parse_callable
-from clickhouse_connect.driver.query import remove_sql_comments
+from clickhouse_connect.driver.query import QueryResult, remove_sql_comments
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,7 @@ insert_re = re.compile(r"^\s*INSERT\s+INTO\s+(.*$)", re.IGNORECASE)
 str_type = get_from_name("String")
 int_type = get_from_name("Int32")
 _IMPLICIT_NULLABLE_BASE_TYPES = frozenset(("Dynamic", "Variant"))
+_END = object()
 
 
 def _cursor_null_ok(ch_type: Any) -> bool | None:
@@ -71,12 +75,19 @@ def _leading_keyword(sql: str) -> str:
 class Cursor:
     """
     See :ref:`https://peps.python.org/pep-0249/`
+
+    A streaming cursor (stream=True) executes queries as a row block stream and only holds the current Native block
+    in memory.  Rows are pulled from the response as they are fetched, and rowcount is -1 until the stream is exhausted
     """
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, stream: bool = False):
         self.client = client
+        self.stream = stream
         self.arraysize: int = 1
         self.data: Sequence | None = None
+        self._stream: StreamContext | None = None
+        self._streaming: bool = False
+        self._streamed: int = 0
         self.names: Sequence[str] = []
         self.types: Sequence[Any] = []
         self._rowcount: int = 0
@@ -100,8 +111,44 @@ class Cursor:
         return self._summary
 
     def close(self) -> None:
+        self._close_stream()
         self.data = None
 
+    def _close_stream(self) -> None:
+        if self._stream is not None:
+            stream = self._stream
+            self._stream = None
+            stream.__exit__(None, None, None)
+
+    def _next_block(self) -> bool:
+        """Replace the current data with the next non-empty block of the stream, closing the stream at the end"""
+        while self._stream is not None:
+            try:
+                block = next(self._stream)
+            except StopIteration:
+                self._close_stream()
+                self._rowcount = self._streamed
+                return False
+            if block:
+                self.data = block
+                self._ix = 0
+                self._streamed += len(block)
+                return True
+        return False
+
+    def _fetch_stream(self, size: int) -> list:
+        rows: list = []
+        while size < 0 or len(rows) < size:
+            data = cast(Sequence, self.data)
+            if self._ix >= len(data):
+                if not self._next_block():
+                    break
+                data = cast(Sequence, self.data)
+            end = len(data) if size < 0 else min(len(data), self._ix + size - len(rows))
+            rows.extend(data[self._ix : end])
+            self._ix = end
+        return rows
+
     def execute(
         self,
         operation: str,
@@ -118,9 +165,20 @@ class Cursor:
             # unescaping automatically.  When there are no parameters,
             # finalize_query short-circuits, so we must unescape here.
             operation = operation.replace("%%", "%")
-        query_result = self.client.query(operation, parameters, settings=settings, query_formats=query_formats)
-        self.data = query_result.result_set
-        self._rowcount = len(self.data)
+        self._close_stream()
+        self._streaming = self.stream
+        if self.stream:
+            stream = self.client.query_row_block_stream(operation, parameters, settings=settings, query_formats=query_formats)
+            stream.__enter__()
+            self._stream = stream
+            query_result = stream.source
+            self.data = []
+            self._rowcount = -1
+            self._streamed = 0
+        else:
+            query_result = self.client.query(operation, parameters, settings=settings, query_formats=query_formats)
+            self.data = query_result.result_set
+            self._rowcount = len(self.data)
         self._summary.append(query_result.summary)
 
         # Need to reset cursor _ix after performing an execute
@@ -203,27 +261,24 @@ class Cursor:
         settings: dict[str, Any] | None = None,
         query_formats: dict[str, str] | None = None,
     ) -> None:
+        self._close_stream()
+        self._streaming = False
         self.names = []
         self.types = []
         if not parameters or self._try_bulk_insert(operation, parameters, settings):
             return
         self.data = []
+        pool = worker_pool("executemany_workers")
+        if pool is not None and ((settings and "session_id" in settings) or self.client.get_client_setting("session_id")):
+            # ClickHouse rejects concurrent queries in the same session
+            pool = None
         try:
-            for param_row in parameters:
-                query_result = self.client.query(operation, param_row, settings=settings, query_formats=query_formats)
-                self.data.extend(query_result.result_set)
-                if self.names or self.types:
-                    if query_result.column_names != self.names:
-                        logger.warning(
-                            "Inconsistent column names %s : %s for operation %s in cursor executemany",
-                            self.names,
-                            query_result.column_names,
-                            operation,
-                        )
-                else:
-                    self.names = query_result.column_names
-                    self.types = query_result.column_types
-                self._summary.append(query_result.summary)
+            if pool is None:
+                for param_row in parameters:
+                    query_result = self.client.query(operation, param_row, settings=settings, query_formats=query_formats)
+                    self._add_many_result(operation, query_result)
+            else:
+                self._pipeline_many(pool, operation, parameters, settings, query_formats)
         except TypeError as ex:
             raise ProgrammingError(f"Invalid parameters {parameters} passed to cursor executemany") from ex
         self._rowcount = len(self.data)
@@ -231,8 +286,51 @@ class Cursor:
         # Need to reset cursor _ix after performing an execute
         self._ix = 0
 
+    def _pipeline_many(
+        self,
+        pool: ThreadPoolExecutor,
+        operation: str,
+        parameters: Any,
+        settings: dict[str, Any] | None,
+        query_formats: dict[str, str] | None,
+    ) -> None:
+        # Keeps at most two queries per worker in flight, and adds the results in parameter order
+        max_pending = 2 * common.get_setting("executemany_workers")
+        pending: deque[Future] = deque()
+        try:
+            param_rows = iter(parameters)
+            while True:
+                param_row = next(param_rows, _END)
+                if param_row is not _END:
+                    pending.append(pool.submit(self.client.query, operation, param_row, settings=settings, query_formats=query_formats))
+                    if len(pending) < max_pending:
+                        continue
+                if not pending:
+                    break
+                self._add_many_result(operation, pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _add_many_result(self, operation: str, query_result: QueryResult) -> None:
+        cast(list, self.data).extend(query_result.result_set)
+        if self.names or self.types:
+            if query_result.column_names != self.names:
+                logger.warning(
+                    "Inconsistent column names %s : %s for operation %s in cursor executemany",
+                    self.names,
+                    query_result.column_names,
+                    operation,
+                )
+        else:
+            self.names = query_result.column_names
+            self.types = query_result.column_types
+        self._summary.append(query_result.summary)
+
     def fetchall(self) -> Sequence:
         self.check_valid()
+        if self._streaming:
+            return self._fetch_stream(-1)
         data = cast(Sequence, self.data)
         ret = data[self._ix :]
         self._ix = self._rowcount
@@ -240,6 +338,9 @@ class Cursor:
 
     def fetchone(self) -> Any:
         self.check_valid()
+        if self._streaming:
+            rows = self._fetch_stream(1)
+            return rows[0] if rows else None
         if self._ix >= self._rowcount:
             return None
         data = cast(Sequence, self.data)
@@ -249,6 +350,8 @@ class Cursor:
 
     def fetchmany(self, size: int = -1) -> Sequence:
         self.check_valid()
+        if self._streaming:
+            return self._fetch_stream(size) if size else []
         data = cast(Sequence, self.data)
 
         if size < 0:
@@ -263,6 +366,13 @@ class Cursor:
         self._ix = end
         return ret
 
+    def __iter__(self) -> Iterator:
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
     def nextset(self) -> None:
         raise NotImplementedError
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from inspect import signature
 from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, unquote, urlparse
@@ -44,7 +44,7 @@ def _unquote(value: str | None) -> str | None:
 
 
 def _parse_connection_params(
-    host: str | None,
+    host: str | Sequence[str] | None,
     username: str | None,
     password: str,
     port: int | None,
@@ -53,7 +53,7 @@ def _parse_connection_params(
     secure: bool | str,
     dsn: str | None,
     kwargs: dict[str, Any],
-) -> tuple[str, str | None, str, int, str | None, str]:
+) -> tuple[str | Sequence[str], str | None, str, int, str | None, str]:
     """Parse and normalize connection parameters including DSN parsing."""
     if database == "__default__":  # legacy sentinel for "not specified"
         database = None
@@ -61,8 +61,13 @@ def _parse_connection_params(
         parsed = urlparse(dsn)
         username = username or _unquote(parsed.username)
         password = password or _unquote(parsed.password) or ""
-        host = host or parsed.hostname
-        port = port or parsed.port
+        netloc_hosts = parsed.netloc.rpartition("@")[2]
+        if "," in netloc_hosts:
+            # Multiple replicas, each with an optional port, e.g. http://user@replica1,replica2:8124/db
+            host = host or netloc_hosts
+        else:
+            host = host or parsed.hostname
+            port = port or parsed.port
         if not database and parsed.path:
             database = unquote(parsed.path[1:].split("/")[0]) or None
         for k, v in parse_qs(parsed.query).items():
@@ -176,7 +181,7 @@ def _create_chdb_client(
 
 def create_client(
     *,
-    host: str | None = None,
+    host: str | Sequence[str] | None = None,
     username: str | None = None,
     password: str = "",
     access_token: str | None = None,
@@ -195,6 +200,9 @@ def create_client(
     The preferred method to get a ClickHouse Connect Client instance
 
     :param host: The hostname or IP address of the ClickHouse server. If not set, localhost will be used.
+      A list or comma separated string of replica hosts, each with an optional port (replica2:8124), spreads
+      requests across the replicas using lb_policy. Replicas that fail to connect are ejected with an exponential
+      backoff and readmitted after a successful ping, and queries fail over to another replica on connection errors.
     :param username: The ClickHouse username. If not set, the default ClickHouse user will be used.
       Should not be set if `access_token` is used.
     :param password: The password for username.
@@ -245,7 +253,9 @@ def create_client(
     :param client_cert_key: File path to the private key for the Client Certificate.  Required if the private key
       is not included the Client Certificate key file
     :param session_id: ClickHouse session id.  If not specified and the common setting 'autogenerate_session_id'
-      is True, the client will generate a UUID1 session id
+      is True, the client will generate a UUID1 session id.  Because sessions are bound to a single server, clients
+      with multiple hosts only generate one when autogenerate_session_id is passed explicitly, and session requests
+      always use the first host, raising an OperationalError while it is marked unavailable
     :param pool_mgr: Optional urllib3 PoolManager for this client.  Useful for creating separate connection
       pools for multiple client endpoints for applications with many clients
     :param http_proxy: http proxy address.  Equivalent to setting the HTTP_PROXY environment variable
@@ -265,6 +275,9 @@ def create_client(
       instead of as URL parameters. When False, large parameter payloads are still automatically sent as form data to
       avoid exceeding URL length limits, except for queries using binary parameter binds, which are only form-encoded
       when this is True. Only available for query operations (not inserts). Default: False
+    :param lb_policy: How requests are spread across multiple hosts. "round_robin" (default) cycles through the
+      healthy replicas, "least_in_flight" picks the replica with the fewest requests awaiting a response, and "ewma"
+      picks the replica with the lowest moving average response latency weighted by its requests in flight.
     :return: ClickHouse Connect Client instance
     """
     if _is_chdb_target(interface, dsn):
@@ -331,7 +344,7 @@ def create_client(
 
 async def create_async_client(
     *,
-    host: str | None = None,
+    host: str | Sequence[str] | None = None,
     username: str | None = None,
     password: str = "",
     access_token: str | None = None,
@@ -358,6 +371,9 @@ async def create_async_client(
     Unlike sync version, the 'autogenerate_session_id' setting by default is False.
 
     :param host: The hostname or IP address of the ClickHouse server. If not set, localhost will be used.
+      A list or comma separated string of replica hosts, each with an optional port (replica2:8124), spreads
+      requests across the replicas using lb_policy. Replicas that fail to connect are ejected with an exponential
+      backoff and readmitted after a successful ping, and queries fail over to another replica on connection errors.
     :param username: The ClickHouse username. If not set, the default ClickHouse user will be used.
     :param password: The password for username.
     :param access_token: JWT access token.
@@ -418,6 +434,9 @@ async def create_async_client(
       instead of as URL parameters. When False, large parameter payloads are still automatically sent as form data to
       avoid exceeding URL length limits, except for queries using binary parameter binds, which are only form-encoded
       when this is True. Only available for query operations (not inserts). Default: False
+    :param lb_policy: How requests are spread across multiple hosts. "round_robin" (default) cycles through the
+      healthy replicas, "least_in_flight" picks the replica with the fewest requests awaiting a response, and "ewma"
+      picks the replica with the lowest moving average response latency weighted by its requests in flight.
     :return: ClickHouse Connect AsyncClient instance
     """
     if _is_chdb_target(interface, dsn):
@@ -660,7 +660,7 @@ class ChdbBackend:
         context: InsertContext,
         runtime: QueryRuntime,
         body: Any,
-        retry_body: Callable[[], Any],
+        retry_body: Callable[[], Any] | None,
     ) -> dict[str, Any]:
         if isinstance(context.compression, str):
             raise NotSupportedError("Insert compression is not supported by the chdb backend")
@@ -708,6 +708,7 @@ class ChdbBackend:
         compression: str | None,
         runtime: QueryRuntime,
         transport_settings: dict[str, str] | None,
+        retry_body: Callable[[], Any] | None = None,
     ) -> dict[str, Any]:
         if not table:
             raise ProgrammingError("The chdb backend requires a table name for raw_insert")
@@ -51,7 +51,7 @@ class SyncBackend(Protocol):
         context: InsertContext,
         runtime: QueryRuntime,
         body: Any,
-        retry_body: Callable[[], Any],
+        retry_body: Callable[[], Any] | None,
         /,
     ) -> dict[str, Any]: ...
 
@@ -64,6 +64,7 @@ class SyncBackend(Protocol):
         compression: str | None,
         runtime: QueryRuntime,
         transport_settings: dict[str, str] | None,
+        retry_body: Callable[[], Any] | None = None,
         /,
     ) -> dict[str, Any]: ...
 
@@ -116,7 +117,7 @@ class AsyncBackend(Protocol):
         context: InsertContext,
         runtime: QueryRuntime,
         body: Any,
-        retry_body: Callable[[], Awaitable[Any]],
+        retry_body: Callable[[], Awaitable[Any]] | None,
         /,
     ) -> dict[str, Any]: ...
 
@@ -129,6 +130,7 @@ class AsyncBackend(Protocol):
         compression: str | None,
         runtime: QueryRuntime,
         transport_settings: dict[str, str] | None,
+        retry_body: Callable[[], Awaitable[Any]] | None = None,
         /,
     ) -> dict[str, Any]: ...
 
@@ -0,0 +1,202 @@
+"""Endpoint selection for HTTP clients configured with several ClickHouse replicas.
+
+An EndpointPool picks the base URL for each request attempt using a load
+balancing policy, tracks in-flight requests and response latency per
+endpoint, and ejects endpoints that fail to connect. Ejected endpoints are
+readmitted only after their backoff expires and a ping succeeds. A pool with
+a single endpoint never ejects it, so single host clients behave exactly as
+before.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Sequence
+
+from clickhouse_connect.driver.exceptions import OperationalError, ProgrammingError
+
+__all__ = ["Endpoint", "EndpointPool", "LB_POLICIES", "split_hosts", "host_port", "base_url"]
+
+LB_POLICIES = ("round_robin", "least_in_flight", "ewma")
+
+# Ejection backoff in seconds, doubled on each consecutive failure of the same endpoint
+EJECT_BACKOFF_MIN = 1.0
+EJECT_BACKOFF_MAX = 60.0
+
+# Weight of the newest latency sample in the exponentially weighted moving average
+EWMA_DECAY = 0.3
+
+
+def base_url(url: str) -> str:
+    # Normalize the valid but empty path to "/". urllib3 does this for direct
+    # requests but preserves it in forwarding-proxy absolute-form, which some
+    # proxies reject. Leave an explicit proxy_path untouched.
+    return url if "/" in url.split("://", 1)[-1] else f"{url}/"
+
+
+def split_hosts(host: str | Sequence[str]) -> list[str]:
+    """
+    Split a host argument into individual host entries.  Accepts a single host, a comma separated string
+    of hosts, or a sequence of hosts.  Each entry may carry its own port, as in 'replica2:8124'
+    """
+    entries = host.split(",") if isinstance(host, str) else list(host)
+    hosts = [entry.strip() for entry in entries if entry and entry.strip()]
+    if not hosts:
+        raise ProgrammingError("At least one ClickHouse host is required")
+    return hosts
+
+
+def host_port(entry: str, default_port: int) -> tuple[str, int]:
+    """
+    Split a 'host[:port]' entry, using default_port when the entry has no port.  IPv6 addresses must be
+    bracketed, as in '[::1]' or '[::1]:8123'
+    """
+    host, port = entry, ""
+    if entry.startswith("["):
+        end = entry.find("]") + 1
+        if not end or (end < len(entry) and entry[end] != ":"):
+            raise ProgrammingError(f"Invalid bracketed IPv6 address in ClickHouse host {entry}")
+        host, port = entry[:end], entry[end + 1 :]
+    elif entry.count(":") > 1:
+        raise ProgrammingError(f"IPv6 address in ClickHouse host {entry} must be bracketed, as in [{entry}]")
+    else:
+        host, _, port = entry.partition(":")
+    if not port:
+        return host, default_port
+    try:
+        return host, int(port)
+    except ValueError:
+        raise ProgrammingError(f"Invalid port in ClickHouse host {entry}") from None
+
+
+class Endpoint:
+    __slots__ = ("url", "base_url", "in_flight", "latency", "failures", "ejected_until")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.base_url = base_url(url)
+        self.in_flight = 0
+        self.latency = 0.0
+        self.failures = 0
+        self.ejected_until = 0.0
+
+    def __repr__(self):
+        return f"Endpoint({self.url})"
+
+
+class EndpointPool:
+    """
+    Thread safe selection of the endpoint used for each request attempt.  The round_robin policy cycles through
+    healthy endpoints, least_in_flight prefers the endpoint with the fewest requests awaiting a response, and ewma
+    prefers the lowest moving average response latency weighted by the requests in flight.  Ties are broken in
+    round robin order so that unmeasured endpoints are all tried
+    """
+
+    def __init__(self, urls: Sequence[str], policy: str = "round_robin"):
+        if policy not in LB_POLICIES:
+            raise ProgrammingError(f"Unrecognized load balancing policy {policy}, must be one of {', '.join(LB_POLICIES)}")
+        if not urls:
+            raise ProgrammingError("At least one ClickHouse endpoint is required")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.policy = policy
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    def select(self, exclude: Sequence[Endpoint] = (), sticky: bool = False) -> Endpoint | None:
+        """
+        Choose the endpoint for the next request attempt and count it as in flight.  Sticky requests (those bound
+        to a server side session) always use the first endpoint, and raise OperationalError while it is ejected,
+        since the session's temporary tables and settings do not exist on the other servers.  Otherwise, if every
+        remaining endpoint is ejected, the one due back soonest is used rather than failing the request.  Returns
+        None only when every endpoint is excluded
+        """
+        endpoints = self.endpoints
+        if len(endpoints) == 1:
+            endpoint = endpoints[0]
+            if exclude:
+                return None
+            with self._lock:
+                endpoint.in_flight += 1
+            return endpoint
+        with self._lock:
+            if sticky:
+                endpoint = endpoints[0]
+                if endpoint in exclude:
+                    return None
+                if endpoint.ejected_until:
+                    raise OperationalError(f"Session server {endpoint.url} is unavailable")
+                endpoint.in_flight += 1
+                return endpoint
+            count = len(endpoints)
+            start = self._next
+            ordered = [endpoints[(start + ix) % count] for ix in range(count)]
+            candidates = [ep for ep in ordered if ep not in exclude]
+            if not candidates:
+                return None
+            healthy = [ep for ep in candidates if not ep.ejected_until]
+            if not healthy:
+                endpoint = min(candidates, key=lambda ep: ep.ejected_until)
+            elif self.policy == "round_robin":
+                endpoint = healthy[0]
+            elif self.policy == "least_in_flight":
+                endpoint = min(healthy, key=lambda ep: ep.in_flight)
+            else:
+                endpoint = min(healthy, key=lambda ep: ep.latency * (ep.in_flight + 1))
+            self._next = (endpoints.index(endpoint) + 1) % count
+            endpoint.in_flight += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, latency: float | None = None):
+        """
+        Record the end of a request attempt.  A latency is only provided when the endpoint responded, which
+        also clears its consecutive failure count
+        """
+        with self._lock:
+            endpoint.in_flight -= 1
+            if latency is not None:
+                endpoint.failures = 0
+                if endpoint.latency:
+                    endpoint.latency += EWMA_DECAY * (latency - endpoint.latency)
+                else:
+                    endpoint.latency = latency
+
+    def eject(self, endpoint: Endpoint):
+        """
+        Take an endpoint out of rotation after a connection failure, backing off exponentially on repeated failures
+        """
+        if len(self.endpoints) == 1:
+            return
+        with self._lock:
+            endpoint.failures += 1
+            backoff = min(EJECT_BACKOFF_MIN * 2 ** (endpoint.failures - 1), EJECT_BACKOFF_MAX)
+            endpoint.ejected_until = time.monotonic() + backoff
+
+    def due_probes(self) -> list[Endpoint]:
+        """
+        Ejected endpoints whose backoff has expired and should be pinged before readmission.  Each returned
+        endpoint is claimed for a full backoff period so that concurrent requests do not probe it again
+        """
+        if len(self.endpoints) == 1:
+            return []
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for endpoint in self.endpoints:
+                if endpoint.ejected_until and endpoint.ejected_until <= now:
+                    endpoint.ejected_until = now + EJECT_BACKOFF_MAX
+                    due.append(endpoint)
+        return due
+
+    def readmit(self, endpoint: Endpoint, healthy: bool):
+        """
+        Apply a ping result, returning the endpoint to rotation or ejecting it again with a longer backoff
+        """
+        if healthy:
+            with self._lock:
+                endpoint.ejected_until = 0.0
+        else:
+            self.eject(endpoint)
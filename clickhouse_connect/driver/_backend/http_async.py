@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING, Any, cast
 import aiohttp
 
 from clickhouse_connect import common
+from clickhouse_connect.driver._backend.endpoints import Endpoint, EndpointPool
 from clickhouse_connect.driver._backend.httpcommon import (
     auth_failed_ex_code,
     build_http_error,
@@ -161,9 +162,11 @@ class HttpAsyncBackend:
         autogenerate_query_id: bool,
         read_format: str = "Native",
         form_encode_query_params: bool = False,
+        urls: Sequence[str] | None = None,
+        lb_policy: str = "round_robin",
     ):
         self.url = url
-        self._base_url = url if "/" in url.split("://", 1)[-1] else f"{url}/"
+        self.endpoints = EndpointPool(urls or (url,), lb_policy)
         self.headers = headers
         self.client_settings = client_settings
         self.timeout = timeout
@@ -309,7 +312,7 @@ class HttpAsyncBackend:
         context: InsertContext,
         runtime: QueryRuntime,
         body: Any,
-        retry_body: Callable[[], Awaitable[Any]],
+        retry_body: Callable[[], Awaitable[Any]] | None,
     ) -> dict[str, Any]:
         """Send a built insert payload, returning the response summary."""
         plan = plan_data_insert_request(context, runtime)
@@ -330,10 +333,12 @@ class HttpAsyncBackend:
         compression: str | None,
         runtime: QueryRuntime,
         transport_settings: dict[str, str] | None,
+        retry_body: Callable[[], Awaitable[Any]] | None = None,
     ) -> dict[str, Any]:
-        """Send a raw insert payload, returning the response summary."""
+        """Send a raw insert payload, returning the response summary.  retry_body rebuilds a streamed insert
+        block so the request can be sent again after a connection error."""
         plan = plan_raw_insert_request(table, column_names, insert_block, fmt, compression, runtime, transport_settings)
-        response = await self.request(plan.body, plan.params, plan.headers, server_wait=False)
+        response = await self.request(plan.body, plan.params, plan.headers, server_wait=False, retry_body=retry_body)
         try:
             logger.debug("Raw insert response code: %d", response.status)
             return summary_from_headers(response.headers)
@@ -450,6 +455,8 @@ class HttpAsyncBackend:
         query_session = final_params.get("session_id")
         attempts = 0
         auth_retried = False
+        await self._probe_endpoints()
+        failed: list[Endpoint] = []
 
         while True:
             attempts += 1
@@ -473,9 +480,17 @@ class HttpAsyncBackend:
                 session = lease.session
                 lease.acquire()
             lease_released = False
+            # Sessions live on a single server, so session requests stick to the first endpoint
+            try:
+                endpoint = cast(Endpoint, self.endpoints.select(failed, sticky=bool(query_session)))
+            except OperationalError:
+                lease.release()
+                self._active_session = None
+                raise
+            endpoint_released = False
             try:
                 # Construct full URL (aiohttp doesn't have base_url)
-                url = self._base_url
+                url = endpoint.base_url
                 request_kwargs = {"method": method, "url": url, "params": final_params, "headers": req_headers}
                 if self.server_host_name and self.ssl_context is not None:
                     request_kwargs["ssl"] = self.ssl_context
@@ -505,7 +520,10 @@ class HttpAsyncBackend:
                 else:
                     request_kwargs["data"] = data
 
+                start = time.monotonic()
                 response = await session.request(**request_kwargs)
+                endpoint_released = True
+                self.endpoints.release(endpoint, time.monotonic() - start)
                 if 200 <= response.status < 300 and not response.headers.get(ex_header):
                     # Caller releases lease after consuming the body.
                     response._lease_release = _one_shot(lease.release)  # type: ignore[attr-defined]
@@ -535,22 +553,38 @@ class HttpAsyncBackend:
 
             except aiohttp.ClientConnectionError as e:
                 msg = str(e)
+                replayable = retry_body is not None or data is None or isinstance(data, (bytes, bytearray, str, dict))
                 if _is_retryable_async_connection_error(e):
                     # Always allow at least one retry on a clean connection error so a single stale
                     # keep-alive socket doesn't surface to the caller, and additionally honor the
                     # retries budget when it is larger (e.g. query_retries for reads), so that
                     # bursts of stale pooled connections can be drained before giving up.
                     max_attempts = max(2, retries + 1)
-                    if attempts < max_attempts:
+                    if attempts < max_attempts and replayable:
                         if retry_body is not None:
                             data = await retry_body()
                             logger.debug("Retrying after connection error with rebuilt body (attempt %s/%s)", attempts, max_attempts)
-                            await asyncio.sleep(0.1 * attempts)
-                            continue
-                        if data is None or isinstance(data, (bytes, bytearray, str, dict)):
+                        else:
                             logger.debug("Retrying after connection error from remote host (attempt %s/%s)", attempts, max_attempts)
-                            await asyncio.sleep(0.1 * attempts)
-                            continue
+                        await asyncio.sleep(0.1 * attempts)
+                        continue
+                connect_failure = isinstance(e, aiohttp.ClientConnectorError)
+                if connect_failure:
+                    self.endpoints.eject(endpoint)
+                # Requests that never reached the server, and reads that failed mid flight, move to the next
+                # endpoint.  A read timeout is not retried elsewhere, since another replica is likely just as slow,
+                # and session requests are not, since their session state only exists on the original server
+                failed.append(endpoint)
+                if (
+                    len(failed) < len(self.endpoints)
+                    and replayable
+                    and not query_session
+                    and (connect_failure or (retries > 0 and not isinstance(e, aiohttp.ServerTimeoutError)))
+                ):
+                    if retry_body is not None:
+                        data = await retry_body()
+                    logger.debug("Failing over from %s after aiohttp connection error type=%s", endpoint.url, type(e).__name__)
+                    continue
                 logger.debug("Non-retryable aiohttp connection error type=%s", type(e).__name__)
                 if self.show_clickhouse_errors is True:
                     raise OperationalError(f"Network Error: {msg}") from e
@@ -564,12 +598,26 @@ class HttpAsyncBackend:
                 raise OperationalError("Network Error") from e
 
             finally:
+                if not endpoint_released:
+                    self.endpoints.release(endpoint)
                 if not lease_released:
                     lease.release()
                 if query_session:
                     self._active_session = None
 
     async def ping(self) -> bool:
+        """Ping every endpoint concurrently, updating their health, and return True if any of them responded."""
+        endpoints = self.endpoints.endpoints
+        results = await asyncio.gather(*(self._ping_url(endpoint.url) for endpoint in endpoints))
+        for endpoint, result in zip(endpoints, results):
+            self.endpoints.readmit(endpoint, result)
+        return any(results)
+
+    async def _probe_endpoints(self) -> None:
+        for endpoint in self.endpoints.due_probes():
+            self.endpoints.readmit(endpoint, await self._ping_url(endpoint.url))
+
+    async def _ping_url(self, base: str) -> bool:
         async with self.session_lock:
             lease = self.session_lease
             if lease is None or lease.session.closed:
@@ -577,7 +625,7 @@ class HttpAsyncBackend:
             session = lease.session
             lease.acquire()
         try:
-            url = f"{self.url}/ping"
+            url = f"{base}/ping"
             timeout = aiohttp.ClientTimeout(total=3.0)
             get_kwargs: dict[str, Any] = {"timeout": timeout}
             if self.proxy_url:
@@ -13,14 +13,16 @@ import logging
 import time
 import uuid
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlencode
 
 from urllib3 import Timeout
-from urllib3.exceptions import HTTPError
+from urllib3.exceptions import ConnectTimeoutError, HTTPError, ReadTimeoutError
 from urllib3.poolmanager import PoolManager
 from urllib3.response import HTTPResponse
 
+from clickhouse_connect.driver._backend.endpoints import Endpoint, EndpointPool
 from clickhouse_connect.driver._backend.httpcommon import (
     auth_failed_ex_code,
     build_http_error,
@@ -51,6 +53,11 @@ logger = logging.getLogger(__name__)
 _REMOTE_CLOSE_ERRORS = (ConnectionResetError, BrokenPipeError)
 
 
+def _connect_failure(ex: HTTPError) -> bool:
+    """True if the request never reached the server, so it is safe to send it to another endpoint."""
+    return isinstance(getattr(ex, "reason", None) or ex, ConnectTimeoutError)
+
+
 def _plan_fields(plan: QueryRequestPlan) -> dict[str, Any] | None:
     """Merge a plan's form parts into urllib3 fields: plain values first, then files."""
     if plan.form_values is None and plan.form_files is None:
@@ -81,12 +88,11 @@ class HttpSyncBackend:
         http_retries: int = 1,
         read_format: str = "Native",
         form_encode_query_params: bool = False,
+        urls: Sequence[str] | None = None,
+        lb_policy: str = "round_robin",
     ):
         self.url = url
-        # Normalize the valid but empty path to "/". urllib3 does this for direct
-        # requests but preserves it in forwarding-proxy absolute-form, which some
-        # proxies reject. Leave an explicit proxy_path untouched.
-        self._base_url = url if "/" in url.split("://", 1)[-1] else f"{url}/"
+        self.endpoints = EndpointPool(urls or (url,), lb_policy)
         self.http = pool_manager
         self.owns_pool_manager = owns_pool_manager
         self.headers = headers
@@ -174,7 +180,7 @@ class HttpSyncBackend:
         context: InsertContext,
         runtime: QueryRuntime,
         body: Any,
-        retry_body: Callable[[], Any],
+        retry_body: Callable[[], Any] | None,
     ) -> dict[str, Any]:
         """Send a built insert payload, returning the response summary."""
         plan = plan_data_insert_request(context, runtime)
@@ -207,10 +213,12 @@ class HttpSyncBackend:
         compression: str | None,
         runtime: QueryRuntime,
         transport_settings: dict[str, str] | None,
+        retry_body: Callable[[], Any] | None = None,
     ) -> dict[str, Any]:
-        """Send a raw insert payload, returning the response summary."""
+        """Send a raw insert payload, returning the response summary.  retry_body rebuilds a streamed insert
+        block so the request can be sent again after a connection error."""
         plan = plan_raw_insert_request(table, column_names, insert_block, fmt, compression, runtime, transport_settings)
-        response = self.request(plan.body, plan.params, plan.headers, server_wait=False)
+        response = self.request(plan.body, plan.params, plan.headers, server_wait=False, retry_body=retry_body)
         logger.debug("Raw insert response code: %d, content: %s", response.status, response.data)
         return summary_from_headers(response.headers)
 
@@ -305,7 +313,7 @@ class HttpSyncBackend:
         if self.autogenerate_query_id and "query_id" not in final_params:
             final_params["query_id"] = str(uuid.uuid4())
 
-        url = f"{self._base_url}?{urlencode(final_params)}"
+        query_string = urlencode(final_params)
         kwargs: dict[str, Any] = {"headers": headers, "timeout": self.timeout, "retries": self.http_retries, "preload_content": not stream}
         if self.server_host_name:
             kwargs["assert_same_host"] = False
@@ -316,6 +324,8 @@ class HttpSyncBackend:
             kwargs["body"] = data
         check_conn_expiration(cast(PoolManager, self.http))
         query_session = final_params.get("session_id")
+        self._probe_endpoints()
+        failed: list[Endpoint] = []
         while True:
             attempts += 1
             if query_session:
@@ -327,33 +337,60 @@ class HttpSyncBackend:
                 # There is a race condition here when using multiprocessing -- in that case the server will
                 # throw an error instead, but in most cases this more helpful error will be thrown first
                 self._active_session = query_session
+            # Sessions live on a single server, so session requests stick to the first endpoint
+            try:
+                endpoint = cast(Endpoint, self.endpoints.select(failed, sticky=bool(query_session)))
+            except OperationalError:
+                self._active_session = None
+                raise
+            start = time.monotonic()
             try:
-                response: HTTPResponse = cast(HTTPResponse, cast(PoolManager, self.http).request(method, url, **kwargs))
+                response: HTTPResponse = cast(
+                    HTTPResponse, cast(PoolManager, self.http).request(method, f"{endpoint.base_url}?{query_string}", **kwargs)
+                )
+                self.endpoints.release(endpoint, time.monotonic() - start)
             except HTTPError as ex:
+                self.endpoints.release(endpoint)
+                body = kwargs.get("body")
+                replayable = retry_body is not None or body is None or isinstance(body, (bytes, bytearray, str))
                 # Always allow at least one retry on a clean connection error so a single stale
                 # keep-alive socket doesn't surface to the caller, and additionally honor the
                 # retries budget when it is larger (e.g. query_retries for reads), so that
                 # bursts of stale pooled connections can be drained before giving up.
                 max_attempts = max(2, retries + 1)
                 remote_close = isinstance(ex.__context__, _REMOTE_CLOSE_ERRORS) or isinstance(ex.__cause__, _REMOTE_CLOSE_ERRORS)
-                if remote_close and attempts < max_attempts:
+                if remote_close and attempts < max_attempts and replayable:
                     # The server closed the connection, probably because the Keep Alive has expired.
                     # We should be safe to retry, as ClickHouse should not have processed anything on
                     # a connection that it killed.
-                    body = kwargs.get("body")
                     if retry_body is not None:
                         kwargs["body"] = retry_body()
                         logger.debug("Retrying remotely closed connection with rebuilt body (attempt %s/%s)", attempts, max_attempts)
-                        time.sleep(0.1 * attempts)
-                        continue
-                    if body is None or isinstance(body, (bytes, bytearray, str)):
+                    else:
                         logger.debug("Retrying remotely closed connection (attempt %s/%s)", attempts, max_attempts)
-                        time.sleep(0.1 * attempts)
-                        continue
+                    time.sleep(0.1 * attempts)
+                    continue
+                connect_failure = _connect_failure(ex)
+                if connect_failure:
+                    self.endpoints.eject(endpoint)
+                # Requests that never reached the server, and reads that failed mid flight, move to the next
+                # endpoint.  A read timeout is not retried elsewhere, since another replica is likely just as slow,
+                # and session requests are not, since their session state only exists on the original server
+                failed.append(endpoint)
+                if (
+                    len(failed) < len(self.endpoints)
+                    and replayable
+                    and not query_session
+                    and (connect_failure or (retries > 0 and not isinstance(ex, ReadTimeoutError)))
+                ):
+                    if retry_body is not None:
+                        kwargs["body"] = retry_body()
+                    logger.debug("Failing over from %s after HTTP transport error type=%s", endpoint.url, type(ex).__name__)
+                    continue
                 logger.debug("Non-retryable HTTP transport error type=%s", type(ex).__name__)
                 if self.show_clickhouse_errors is True:
                     logger.warning("Unexpected Http Driver Exception")
-                    raise OperationalError(f"Error {ex} executing HTTP request attempt {attempts} ({self.url})") from ex
+                    raise OperationalError(f"Error {ex} executing HTTP request attempt {attempts} ({endpoint.url})") from ex
                 logger.warning("Unexpected Http Driver Exception", exc_info=True)
                 raise OperationalError("Error executing HTTP request") from ex
             finally:
@@ -382,18 +419,34 @@ class HttpSyncBackend:
                 self.error_handler(response)
 
     def ping(self) -> bool:
+        """Ping every endpoint concurrently, updating their health, and return True if any of them responded."""
+        endpoints = self.endpoints.endpoints
+        if len(endpoints) == 1:
+            return self._ping_url(endpoints[0].url)
+        # Concurrent pings keep a single unreachable replica from adding a full ping timeout per endpoint
+        with ThreadPoolExecutor(max_workers=len(endpoints), thread_name_prefix="ch_ping") as pool:
+            results = list(pool.map(lambda endpoint: self._ping_url(endpoint.url), endpoints))
+        for endpoint, result in zip(endpoints, results):
+            self.endpoints.readmit(endpoint, result)
+        return any(results)
+
+    def _ping_url(self, url: str) -> bool:
         try:
             headers = dict_copy(self.headers)
             kwargs: dict[str, Any] = {"headers": headers, "timeout": 3, "preload_content": True}
             if self.server_host_name:
                 kwargs["assert_same_host"] = False
                 headers["Host"] = self.server_host_name
-            response = cast(PoolManager, self.http).request("GET", f"{self.url}/ping", **kwargs)
+            response = cast(PoolManager, self.http).request("GET", f"{url}/ping", **kwargs)
             return 200 <= response.status < 300
         except HTTPError:
             logger.debug("ping failed", exc_info=True)
             return False
 
+    def _probe_endpoints(self) -> None:
+        for endpoint in self.endpoints.due_probes():
+            self.endpoints.readmit(endpoint, self._ping_url(endpoint.url))
+
     def close_connections(self) -> None:
         cast(PoolManager, self.http).clear()
 
@@ -54,6 +54,21 @@ class ServerInfo:
         object.__setattr__(self, "settings", _freeze_mapping(self.settings))
 
 
+@dataclass(frozen=True)
+class ServerProbe:
+    """Raw server facts gathered by the initialization queries, before any
+    client policy (timezone source, generated settings) is applied. This is
+    the value the shared server info cache stores."""
+
+    version: str
+    timezone: str
+    settings: Mapping[str, SettingDef]
+    protocol_version: int = 0
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "settings", _freeze_mapping(self.settings))
+
+
 @dataclass(frozen=True)
 class QueryRuntime:
     """Backend-neutral per-call execution inputs resolved by the facade."""
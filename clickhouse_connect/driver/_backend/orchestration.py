@@ -11,13 +11,15 @@ from clickhouse_connect import common
 from clickhouse_connect.datatypes.base import ClickHouseType
 from clickhouse_connect.datatypes.registry import get_from_name
 from clickhouse_connect.driver import tzutil
-from clickhouse_connect.driver._backend.models import ClientConfig, ServerInfo
+from clickhouse_connect.driver._backend.models import ClientConfig, ServerInfo, ServerProbe
 from clickhouse_connect.driver._backend.operations import CommandOp, Operation, QueryOp, RawQueryOp
 from clickhouse_connect.driver.binding import quote_identifier
 from clickhouse_connect.driver.constants import PROTOCOL_VERSION_WITH_LOW_CARD
 from clickhouse_connect.driver.exceptions import OperationalError, ProgrammingError
 from clickhouse_connect.driver.insert import InsertContext
 from clickhouse_connect.driver.models import ColumnDef, SettingDef, setting_status
+from clickhouse_connect.driver.schemacache import SchemaCache, schema_key
+from clickhouse_connect.driver.serverinfocache import ServerInfoCache
 
 logger = logging.getLogger(__name__)
 
@@ -83,10 +85,53 @@ def _setting_definitions(result: object) -> dict[str, SettingDef]:
     return definitions
 
 
-def init_sequence(config: ClientConfig) -> InitializationSequence:
+def _probe_sequence() -> Generator[Operation, object, ServerProbe]:
     version_result = yield CommandOp("SELECT version(), timezone()", use_database=False)
     server_version, server_timezone_name = _version_timezone(version_result)
 
+    settings_result = yield QueryOp("SELECT name, value, readonly FROM system.settings LIMIT 10000")
+    server_settings = _setting_definitions(settings_result)
+
+    protocol_version = 0
+    if common.get_setting("use_protocol_version"):
+        # The response bytes must be validated because a proxy such as CHProxy
+        # can strip the client_protocol_version query parameter.
+        # Probe failures leave protocol_version at 0, the pre-existing
+        # AsyncClient._initialize behavior. The old sync path propagated them.
+        try:
+            protocol_result = yield RawQueryOp(
+                "SELECT 1 AS check",
+                settings={"client_protocol_version": PROTOCOL_VERSION_WITH_LOW_CARD},
+                fmt="Native",
+            )
+            if isinstance(protocol_result, (bytes, bytearray)) and protocol_result[8:16] == b"\x01\x01\x05check":
+                protocol_version = PROTOCOL_VERSION_WITH_LOW_CARD
+        except Exception as ex:
+            logger.debug("client_protocol_version probe failed, continuing with protocol version 0: %s", ex)
+    return ServerProbe(server_version, server_timezone_name, server_settings, protocol_version)
+
+
+def init_sequence(
+    config: ClientConfig,
+    server_info_cache: ServerInfoCache | None = None,
+    cache_key: str | None = None,
+) -> InitializationSequence:
+    if server_info_cache is None or cache_key is None:
+        probe = yield from _probe_sequence()
+    else:
+        cached_probe = server_info_cache.get(cache_key)
+        if cached_probe is None:
+            try:
+                probe = yield from _probe_sequence()
+            finally:
+                server_info_cache.release(cache_key)
+            server_info_cache.put(cache_key, probe)
+        else:
+            probe = cached_probe
+    server_version, server_timezone_name = probe.version, probe.timezone
+    server_settings = probe.settings
+    protocol_version = probe.protocol_version if common.get_setting("use_protocol_version") else 0
+
     server_timezone: tzinfo = timezone.utc
     timezone_dst_safe = True
     try:
@@ -109,26 +154,6 @@ def init_sequence(config: ClientConfig) -> InitializationSequence:
             tzutil.local_tz.tzname(None),
         )
 
-    settings_result = yield QueryOp("SELECT name, value, readonly FROM system.settings LIMIT 10000")
-    server_settings = _setting_definitions(settings_result)
-
-    protocol_version = 0
-    if common.get_setting("use_protocol_version"):
-        # The response bytes must be validated because a proxy such as CHProxy
-        # can strip the client_protocol_version query parameter.
-        # Probe failures leave protocol_version at 0, the pre-existing
-        # AsyncClient._initialize behavior. The old sync path propagated them.
-        try:
-            protocol_result = yield RawQueryOp(
-                "SELECT 1 AS check",
-                settings={"client_protocol_version": PROTOCOL_VERSION_WITH_LOW_CARD},
-                fmt="Native",
-            )
-            if isinstance(protocol_result, (bytes, bytearray)) and protocol_result[8:16] == b"\x01\x01\x05check":
-                protocol_version = PROTOCOL_VERSION_WITH_LOW_CARD
-        except Exception as ex:
-            logger.debug("client_protocol_version probe failed, continuing with protocol version 0: %s", ex)
-
     # Generated defaults skip keys the user supplied. Clients apply user
     # settings themselves, so the returned writes are defaults only.
     client_settings: dict[str, Any] = {}
@@ -154,6 +179,14 @@ def init_sequence(config: ClientConfig) -> InitializationSequence:
     )
 
 
+def full_table_name(table: str, database: str | None = None) -> str:
+    if "." in table:
+        return table
+    if database:
+        return f"{quote_identifier(database)}.{quote_identifier(table)}"
+    return quote_identifier(table)
+
+
 def insert_context_sequence(
     table: str,
     column_names: str | Sequence[str] | None = None,
@@ -165,21 +198,25 @@ def insert_context_sequence(
     data: Sequence[Sequence[Any]] | None = None,
     transport_settings: dict[str, str] | None = None,
     server_tz: tzinfo = timezone.utc,
+    schema_cache: SchemaCache | None = None,
+    default_database: str | None = None,
 ) -> Generator[Operation, object, InsertContext]:
-    full_table = table
-    if "." not in table:
-        if database:
-            full_table = f"{quote_identifier(database)}.{quote_identifier(table)}"
-        else:
-            full_table = quote_identifier(table)
-    column_defs: list[ColumnDef] = []
+    full_table = full_table_name(table, database)
+    column_defs: Sequence[ColumnDef] = []
     if column_types is None and column_type_names is None:
-        describe_result = yield QueryOp(f"DESCRIBE TABLE {full_table}", settings=settings or {})
-        column_defs = [
-            ColumnDef(**row)
-            for row in _named_rows(describe_result, "DESCRIBE TABLE")
-            if row["default_type"] not in ("ALIAS", "MATERIALIZED")
-        ]
+        cache_key = schema_key(full_table, default_database)
+        cached_defs = schema_cache.get(cache_key) if schema_cache is not None else None
+        if cached_defs is None:
+            describe_result = yield QueryOp(f"DESCRIBE TABLE {full_table}", settings=settings or {})
+            column_defs = [
+                ColumnDef(**row)
+                for row in _named_rows(describe_result, "DESCRIBE TABLE")
+                if row["default_type"] not in ("ALIAS", "MATERIALIZED")
+            ]
+            if schema_cache is not None:
+                schema_cache.put(cache_key, column_defs)
+        else:
+            column_defs = cached_defs
     if column_names is None or isinstance(column_names, str) and column_names == "*":
         column_names = [cd.name for cd in column_defs]
         column_types = [cd.ch_type for cd in column_defs]
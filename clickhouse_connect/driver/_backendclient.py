@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import io
 import logging
-from collections.abc import Generator, Sequence
+from collections.abc import Callable, Generator, Sequence
 from typing import TYPE_CHECKING, Any, BinaryIO, cast
 
 from clickhouse_connect.driver._backend.httpcommon import parse_command_body
@@ -21,6 +21,7 @@ from clickhouse_connect.driver.ctypes import RespBuffCls
 from clickhouse_connect.driver.external import ExternalData
 from clickhouse_connect.driver.insert import InsertContext
 from clickhouse_connect.driver.query import QueryContext, QueryResult
+from clickhouse_connect.driver.resultcache import ResultCache
 from clickhouse_connect.driver.summary import QuerySummary
 
 if TYPE_CHECKING:
@@ -46,15 +47,29 @@ class SyncBackendClient(Client):
             settings=self._validate_settings(context.settings),
             retries=self.query_retries,
         )
-        execution = self._backend.execute_query(context, runtime, self._prep_query(context))
+        prepped_query = self._prep_query(context)
+        cache_key = self._result_key(context, runtime, prepped_query)
+        if cache_key is not None:
+            cached = cast(ResultCache, self._result_cache).get(cache_key)
+            if cached is not None:
+                return self._parse_query_response(context, cached.replay(), cached.response_tz_name, cached.summary)
+        execution = self._backend.execute_query(context, runtime, prepped_query)
         if execution.columns is not None:
             return self._columns_only_result(context, execution.columns)
-        byte_source = RespBuffCls(execution.source)
-        response_tz = self._check_tz_change(execution.response_tz_name)
+        source = execution.source
+        if cache_key is not None:
+            source = cast(ResultCache, self._result_cache).recorder(cache_key, source, execution.response_tz_name, execution.summary)
+        return self._parse_query_response(context, source, execution.response_tz_name, execution.summary)
+
+    def _parse_query_response(
+        self, context: QueryContext, source: Any, response_tz_name: str | None, summary: dict[str, Any]
+    ) -> QueryResult:
+        byte_source = RespBuffCls(source)
+        response_tz = self._check_tz_change(response_tz_name)
         if response_tz is not None:
             context.set_response_tz(response_tz)
         query_result = self._transform.parse_response(byte_source, context)
-        query_result.summary = execution.summary
+        query_result.summary = summary
         return cast(QueryResult, query_result)
 
     def data_insert(self, context: InsertContext) -> QuerySummary:
@@ -75,8 +90,10 @@ class SyncBackendClient(Client):
             return self._transform.build_insert(context)
 
         runtime = QueryRuntime(database=self.database, settings=self._validate_settings(context.settings))
+        # A streamed insert consumes its data as it is sent, so there is nothing to rebuild the body from
+        retry_body = None if context.streaming else rebuild_block_gen
         try:
-            return QuerySummary(self._backend.execute_data_insert(context, runtime, block_gen, rebuild_block_gen))
+            return QuerySummary(self._backend.execute_data_insert(context, runtime, block_gen, retry_body))
         finally:
             context.data = None
 
@@ -99,6 +116,20 @@ class SyncBackendClient(Client):
         )
         return QuerySummary(summary)
 
+    def _raw_insert(
+        self,
+        table: str,
+        column_names: Sequence[str] | None,
+        insert_block: Generator[bytes, None, None],
+        settings: dict | None,
+        fmt: str,
+        transport_settings: dict[str, str] | None,
+        retry_block: Callable[[], Generator[bytes, None, None]],
+    ) -> QuerySummary:
+        runtime = QueryRuntime(database=self.database, settings=self._validate_settings(settings or {}))
+        summary = self._backend.execute_raw_insert(table, column_names, insert_block, fmt, None, runtime, transport_settings, retry_block)
+        return QuerySummary(summary)
+
     def command(
         self,
         cmd: str,
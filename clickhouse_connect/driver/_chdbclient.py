@@ -22,7 +22,7 @@ from urllib.parse import urlencode
 from clickhouse_connect import common
 from clickhouse_connect.driver._backend.chdb_backend import CHDB_TRANSPORT_SETTINGS, ChdbBackend
 from clickhouse_connect.driver._backendclient import SyncBackendClient
-from clickhouse_connect.driver.common import ShowClickHouseErrors, coerce_show_clickhouse_errors
+from clickhouse_connect.driver.common import ShowClickHouseErrors, coerce_show_clickhouse_errors, dict_copy
 from clickhouse_connect.driver.query import TzMode, TzSource
 from clickhouse_connect.driver.transform import NativeTransform
 
@@ -123,6 +123,9 @@ class ChdbClient(SyncBackendClient):
     def get_client_setting(self, key: str) -> str | None:
         return self._client_settings.get(key)
 
+    def _effective_settings(self, settings: dict[str, Any]) -> dict[str, Any]:
+        return dict_copy(self._client_settings, settings)
+
     def set_access_token(self, access_token: str) -> None:
         # chdb has no authentication concept; accept silently so token-based
         # callers work unchanged against the in-process engine.
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
 import ssl
 import sys
 import uuid
 from base64 import b64encode
-from collections.abc import Awaitable, Callable, Generator, Sequence
+from collections.abc import AsyncIterable, Awaitable, Callable, Generator, Iterable, Iterator, Sequence
 from datetime import tzinfo
 from typing import TYPE_CHECKING, Any, BinaryIO, cast
 
@@ -18,10 +19,13 @@ if TYPE_CHECKING:
     import polars
     import pyarrow
 
+    from clickhouse_connect.driver.npquery import NumpyResult
+
 from clickhouse_connect import common
 from clickhouse_connect.datatypes.base import ClickHouseType
 from clickhouse_connect.datatypes.registry import get_from_name
 from clickhouse_connect.driver import httputil, options
+from clickhouse_connect.driver._backend.endpoints import host_port, split_hosts
 from clickhouse_connect.driver._backend.http_async import HttpAsyncBackend, release_lease
 from clickhouse_connect.driver._backend.httpcommon import (
     add_integration_tag,
@@ -37,6 +41,7 @@ from clickhouse_connect.driver._backend.httpcommon import (
 from clickhouse_connect.driver._backend.models import ClientConfig, QueryRuntime
 from clickhouse_connect.driver._backend.operations import CommandOp, Operation, QueryOp, RawQueryOp
 from clickhouse_connect.driver._backend.orchestration import init_sequence, insert_context_sequence, run_async
+from clickhouse_connect.driver.batching import DEFAULT_BATCH_BYTES, DEFAULT_BATCH_LATENCY, DEFAULT_BATCH_ROWS, AsyncBatchingInserter
 from clickhouse_connect.driver.binding import (
     bind_query,
     use_form_encoding,  # noqa: F401  (compatibility re-export)
@@ -47,6 +52,7 @@ from clickhouse_connect.driver.client import (
     _INTERNAL_QUERY_FORMATS,
     Client,
     _apply_arrow_tz_policy,
+    _parallel_insert_summary,
 )
 from clickhouse_connect.driver.common import (
     ShowClickHouseErrors,
@@ -56,17 +62,21 @@ from clickhouse_connect.driver.common import (
     dict_copy,  # noqa: F401  (compatibility re-export)
 )
 from clickhouse_connect.driver.ctypes import RespBuffCls
-from clickhouse_connect.driver.exceptions import DataError, ProgrammingError
+from clickhouse_connect.driver.exceptions import DataError, Error, ProgrammingError
 from clickhouse_connect.driver.external import ExternalData
-from clickhouse_connect.driver.insert import InsertContext
+from clickhouse_connect.driver.insert import InsertContext, insert_row_count, slice_insert_data
 from clickhouse_connect.driver.options import check_arrow, check_numpy, check_pandas, check_polars
 from clickhouse_connect.driver.query import (
     QueryContext,
     QueryResult,
     TzMode,
     TzSource,
-    arrow_buffer,
+    arrow_stream,
+    read_arrow_source,
+    split_queries,
 )
+from clickhouse_connect.driver.resultcache import ResultCache
+from clickhouse_connect.driver.serverinfocache import server_info_key, shared_server_info_cache
 from clickhouse_connect.driver.streaming import (
     QueuedStreamSource,
     StreamingFileAdapter,
@@ -95,6 +105,37 @@ class BytesSource:
         """No-op close method for compatibility."""
 
 
+async def _bridge_async_iterable(data: AsyncIterable) -> Iterator:
+    """
+    Wrap an async iterable of rows or column chunks in a sync iterator for the insert producer thread.  The first
+    item is read here so that an empty iterable is recognized before the insert starts, and each later item is read
+    by scheduling the iteration on the event loop from the producer thread
+    """
+    loop = asyncio.get_running_loop()
+    items = data.__aiter__()
+    end = object()
+
+    async def next_item():
+        try:
+            return await items.__anext__()
+        except StopAsyncIteration:
+            return end
+
+    first = await next_item()
+
+    def rows():
+        if first is end:
+            return
+        yield first
+        while True:
+            item = asyncio.run_coroutine_threadsafe(next_item(), loop).result()
+            if item is end:
+                return
+            yield item
+
+    return rows()
+
+
 class AsyncClient(Client):
     valid_transport_settings = {
         "database",
@@ -121,7 +162,7 @@ class AsyncClient(Client):
     def __init__(
         self,
         interface: str,
-        host: str,
+        host: str | Sequence[str],
         port: int,
         username: str | None = None,
         password: str | None = None,
@@ -156,6 +197,7 @@ class AsyncClient(Client):
         form_encode_query_params: bool = False,
         rename_response_column: str | None = None,
         headers: dict[str, str] | None = None,
+        lb_policy: str = "round_robin",
     ):
         """
         Async HTTP Client using aiohttp. Initialization is handled via _initialize().
@@ -163,8 +205,17 @@ class AsyncClient(Client):
         proxy_path = proxy_path.lstrip("/")
         if proxy_path:
             proxy_path = "/" + proxy_path
-        self.uri = f"{interface}://{host}:{port}{proxy_path}"
+        hosts = split_hosts(host)
+        host = hosts[0]
+        if len(hosts) == 1:
+            urls = [f"{interface}://{host}:{port}{proxy_path}"]
+        else:
+            urls = [f"{interface}://{name}:{name_port}{proxy_path}" for name, name_port in (host_port(entry, port) for entry in hosts)]
+            host, port = host_port(host, port)
+        self.uri = urls[0]
         self.url = self.uri
+        if not token_provider:
+            self._server_info_key = server_info_key(self.url, username, access_token or password, settings)
         self._rename_response_column = rename_response_column
         self._initial_settings = settings
         self.headers = {}
@@ -281,6 +332,8 @@ class AsyncClient(Client):
             autogenerate_query_id=(common.get_setting("autogenerate_query_id") if autogenerate_query_id is None else autogenerate_query_id),
             read_format="Native",
             form_encode_query_params=form_encode_query_params,
+            urls=urls,
+            lb_policy=lb_policy,
         )
 
         # Call parent init with autoconnect=False to set up config without blocking I/O
@@ -367,7 +420,9 @@ class AsyncClient(Client):
 
         try:
             config = ClientConfig(settings=self._initial_settings or {}, timezone_policy=self._deferred_tz_source)
-            init_result = await run_async(init_sequence(config), self._execute_operation)
+            init_result = await run_async(
+                init_sequence(config, shared_server_info_cache(), self._server_info_key), self._execute_operation
+            )
             self._apply_init_result(init_result)
 
             if self._initial_settings:
@@ -438,6 +493,9 @@ class AsyncClient(Client):
     def get_client_setting(self, key) -> str | None:
         return self._client_settings.get(key)
 
+    def _effective_settings(self, settings: dict[str, Any]) -> dict[str, Any]:
+        return dict_copy(self._client_settings, settings)
+
     async def _resolve_token(self) -> str:
         return await self._backend.resolve_token()
 
@@ -454,38 +512,29 @@ class AsyncClient(Client):
             settings=self._validate_settings(context.settings),
             retries=self.query_retries,
         )
-        execution = await self._backend.execute_query(context, runtime, self._prep_query(context))
+        prepped_query = self._prep_query(context)
+        cache_key = self._result_key(context, runtime, prepped_query)
+        loop = asyncio.get_running_loop()
+        if cache_key is not None:
+            cached = cast(ResultCache, self._result_cache).get(cache_key)
+            if cached is not None:
+                query_result = await loop.run_in_executor(
+                    None, self._parse_response_source, context, cached.replay(), cached.response_tz_name
+                )
+                query_result.summary = cached.summary
+                return query_result
+        execution = await self._backend.execute_query(context, runtime, prepped_query)
         if execution.columns is not None:
             return self._columns_only_result(context, execution.columns)
 
         streaming_source = cast(StreamingResponseSource, execution.source)
-        loop = asyncio.get_running_loop()
-
-        def parse_streaming():
-            """Parse response from streaming queue (runs in executor)."""
-            # Wrap streaming source with ResponseBuffer. The streaming source provides a
-            #  .gen property that yields decompressed chunks.
-            byte_source = RespBuffCls(streaming_source)
-            context.set_response_tz(self._check_tz_change(execution.response_tz_name))
-            result = self._transform.parse_response(byte_source, context)
-
-            # For Pandas/Numpy, we must materialize in the executor because the resulting objects
-            # (DataFrame, Array) are fully in-memory structures.
-            # For standard queries, we return a lazy QueryResult. Accessing .result_set on the event loop
-            # will raise a ProgrammingError (deadlock check), encouraging usage of .rows_stream.
-            if not context.streaming:
-                if context.as_pandas and hasattr(result, "df_result"):
-                    _ = result.df_result
-                elif context.use_numpy and hasattr(result, "np_result"):
-                    _ = result.np_result
-                elif isinstance(result, QueryResult):
-                    _ = result.result_set
-
-            return result
+        source: Any = streaming_source
+        if cache_key is not None:
+            source = cast(ResultCache, self._result_cache).recorder(cache_key, source, execution.response_tz_name, execution.summary)
 
         # Run parser in executor (pulls from queue, decompresses & parses)
         try:
-            query_result = await loop.run_in_executor(None, parse_streaming)
+            query_result = await loop.run_in_executor(None, self._parse_response_source, context, source, execution.response_tz_name)
         except Exception:
             await streaming_source.aclose()
             raise
@@ -497,6 +546,28 @@ class AsyncClient(Client):
 
         return query_result
 
+    def _parse_response_source(self, context: QueryContext, source: Any, response_tz_name: str | None) -> Any:
+        """Parse response from streaming queue (runs in executor)."""
+        # Wrap streaming source with ResponseBuffer. The streaming source provides a
+        #  .gen property that yields decompressed chunks.
+        byte_source = RespBuffCls(source)
+        context.set_response_tz(cast(tzinfo, self._check_tz_change(response_tz_name)))
+        result = self._transform.parse_response(byte_source, context)
+
+        # For Pandas/Numpy, we must materialize in the executor because the resulting objects
+        # (DataFrame, Array) are fully in-memory structures.
+        # For standard queries, we return a lazy QueryResult. Accessing .result_set on the event loop
+        # will raise a ProgrammingError (deadlock check), encouraging usage of .rows_stream.
+        if not context.streaming:
+            if context.as_pandas and hasattr(result, "df_result"):
+                _ = result.df_result
+            elif context.use_numpy and hasattr(result, "np_result"):
+                _ = result.np_result
+            elif isinstance(result, QueryResult):
+                _ = result.result_set
+
+        return result
+
     async def query(  # type: ignore[override]
         self,
         query: str | None = None,
@@ -581,7 +652,8 @@ class AsyncClient(Client):
         Async version of query_column_block_stream.
         Returns a StreamContext that yields column-oriented blocks.
         """
-        return (await self._context_query(locals(), use_numpy=False, streaming=True)).column_block_stream
+        result = await self._context_query(locals(), use_numpy=False, streaming=True)
+        return self._queued_result_stream(result, result._column_block_stream)
 
     async def query_row_block_stream(  # type: ignore[override]
         self,
@@ -603,7 +675,8 @@ class AsyncClient(Client):
         Async version of query_row_block_stream.
         Returns a StreamContext that yields row-oriented blocks.
         """
-        return (await self._context_query(locals(), use_numpy=False, streaming=True)).row_block_stream
+        result = await self._context_query(locals(), use_numpy=False, streaming=True)
+        return self._queued_result_stream(result, result._row_block_stream)
 
     async def query_rows_stream(  # type: ignore[override]
         self,
@@ -623,9 +696,11 @@ class AsyncClient(Client):
     ) -> StreamContext:
         """
         Async version of query_rows_stream.
-        Returns a StreamContext that yields individual rows.
+        Returns a StreamContext that yields individual rows.  Whole row blocks are decoded off the event loop, and
+        the rows of each block are then yielded on the event loop
         """
-        return (await self._context_query(locals(), use_numpy=False, streaming=True)).rows_stream
+        result = await self._context_query(locals(), use_numpy=False, streaming=True)
+        return self._queued_result_stream(result, result._row_block_stream, flatten=True)
 
     async def query_np(  # type: ignore[override]
         self,
@@ -661,7 +736,8 @@ class AsyncClient(Client):
     ) -> StreamContext:
         check_numpy()
         self._add_integration_tag("numpy")
-        return (await self._context_query(locals(), use_numpy=True, streaming=True)).np_stream
+        result = await self._context_query(locals(), use_numpy=True, streaming=True)
+        return self._queued_result_stream(result, result._np_stream)
 
     async def query_df(
         self,
@@ -707,7 +783,34 @@ class AsyncClient(Client):
     ) -> StreamContext:
         check_pandas()
         self._add_integration_tag("pandas")
-        return (await self._context_query(locals(), use_numpy=True, as_pandas=True, streaming=True)).df_stream
+        result = await self._context_query(locals(), use_numpy=True, as_pandas=True, streaming=True)
+        return self._queued_result_stream(result, result._df_stream)
+
+    @staticmethod
+    def _queued_result_stream(result: QueryResult | NumpyResult, blocks: Callable[[], Generator], flatten: bool = False) -> StreamContext:
+        """Decode result blocks in a single executor task, handing them to the event loop through a bounded queue
+        so that iteration never waits on a thread pool round trip per block or row.  If flatten is set the items
+        of each block are yielded individually on the event loop.  The result stays the stream source, and the
+        executor task starts when the entered stream is first read."""
+        if not isinstance(result.source, StreamingResponseSource):
+            # Column metadata only results have no response stream to read
+            if flatten:
+                return StreamContext(result, (item for block in blocks() for item in block))
+            return StreamContext(result, blocks())
+        queued = QueuedStreamSource(result.source)
+        # Closing the result shuts down the queue as well as the response stream
+        result.source = queued
+
+        async def items():
+            queued.pump(blocks)
+            async for block in queued.items():
+                if flatten:
+                    for item in block:
+                        yield item
+                else:
+                    yield block
+
+        return StreamContext(result, items())
 
     async def _context_query(self, lcls: dict, **overrides):
         """
@@ -795,7 +898,7 @@ class AsyncClient(Client):
     async def insert(  # type: ignore[override]
         self,
         table: str | None = None,
-        data: Sequence[Sequence[Any]] | None = None,
+        data: Sequence[Sequence[Any]] | Iterable[Sequence[Any]] | AsyncIterable[Sequence[Any]] | None = None,
         column_names: str | Sequence[str] | None = "*",
         database: str | None = None,
         column_types: Sequence[ClickHouseType] | None = None,
@@ -809,7 +912,9 @@ class AsyncClient(Client):
         Method to insert multiple rows/data matrix of native Python objects.  If context is specified arguments
         other than data are ignored
         :param table: Target table
-        :param data: Sequence of sequences of Python data
+        :param data: Sequence of sequences of Python data, or any iterable or async iterable of rows (of column
+            chunks if column_oriented).  An iterable without a length is read as the insert is sent, so it is never
+            held in memory at once, but the insert can not be retried after a connection error
         :param column_names: Ordered list of column names or '*' if column types should be retrieved from the
             ClickHouse table definition
         :param database: Target database -- will use client default database if not specified.
@@ -842,8 +947,14 @@ class AsyncClient(Client):
         if data is not None:
             if not context.empty:
                 raise ProgrammingError("Attempting to insert new data with non-empty insert context") from None
+            if hasattr(data, "__aiter__"):
+                data = await _bridge_async_iterable(data)
             context.data = data
-        return await self.data_insert(context)
+        try:
+            return await self.data_insert(context)
+        except Error as ex:
+            self._check_schema_mismatch(context, ex)
+            raise
 
     async def query_arrow(
         self,
@@ -855,7 +966,7 @@ class AsyncClient(Client):
         transport_settings: dict[str, str] | None = None,
     ) -> pyarrow.Table:
         """
-        Query method using the ClickHouse Arrow format to return a PyArrow table
+        Query method that streams the ClickHouse ArrowStream format and returns a PyArrow table built batch by batch
         :param query: Query statement/format string
         :param parameters: Optional dictionary used to format the query
         :param settings: Optional dictionary of ClickHouse settings (key/string values)
@@ -868,19 +979,26 @@ class AsyncClient(Client):
         self._add_integration_tag("arrow")
         settings = self._update_arrow_settings(settings, use_strings)
 
+        loop = asyncio.get_running_loop()
+        cache_key = self._arrow_result_key(query, parameters, settings, external_data)
+        if cache_key is not None:
+            cached = cast(ResultCache, self._result_cache).get(cache_key)
+            if cached is not None:
+                table = await loop.run_in_executor(None, read_arrow_source, cached.replay())
+                return _apply_arrow_tz_policy(table, self.tz_mode)
+
         final_query, bind_params, runtime = self._prep_raw_query_runtime(query, parameters, settings, "ArrowStream", True)
         response = await self._backend.execute_raw_stream(final_query, bind_params, external_data, runtime, transport_settings)
         encoding = response.headers.get("Content-Encoding")
         exception_tag = response.headers.get(ex_tag_header)
 
-        loop = asyncio.get_running_loop()
         streaming_source = await start_streaming_response(response, encoding=encoding, exception_tag=exception_tag)
+        source: Any = streaming_source
+        if cache_key is not None:
+            source = cast(ResultCache, self._result_cache).recorder(cache_key, source)
 
         def parse_arrow_stream():
-            file_adapter = StreamingFileAdapter(streaming_source)
-            reader = options.arrow.ipc.open_stream(file_adapter)
-            table = reader.read_all()
-            return _apply_arrow_tz_policy(table, self.tz_mode)
+            return _apply_arrow_tz_policy(read_arrow_source(source), self.tz_mode)
 
         try:
             return await loop.run_in_executor(None, parse_arrow_stream)
@@ -933,6 +1051,89 @@ class AsyncClient(Client):
         queued.pump(batches)
         return StreamContext(queued, queued.items())
 
+    async def query_df_parallel(  # type: ignore[override]
+        self,
+        query: str,
+        split_by: str | Sequence[str],
+        splits: int = 4,
+        parameters: Sequence | dict[str, Any] | None = None,
+        settings: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> pandas.DataFrame:
+        """
+        Split a SELECT query into disjoint queries, run them concurrently, and combine the results into one pandas
+        DataFrame in split order.  At most parallel_query_workers queries run at once, or one at a time if the client
+        has a session ID.  See Client.query_df_parallel for the parameters
+        :return: Pandas dataframe representing the result set
+        """
+        check_pandas()
+        results = await self._parallel_query(self.query_df, query, split_by, splits, parameters, settings, kwargs)
+        return options.pd.concat(results, ignore_index=True)
+
+    async def query_np_parallel(  # type: ignore[override]
+        self,
+        query: str,
+        split_by: str | Sequence[str],
+        splits: int = 4,
+        parameters: Sequence | dict[str, Any] | None = None,
+        settings: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> numpy.ndarray:
+        """
+        Split a SELECT query into disjoint queries, run them concurrently, and combine the results into one numpy
+        array in split order.  See Client.query_df_parallel for the parameters
+        :return: Numpy array representing the result set
+        """
+        check_numpy()
+        results = await self._parallel_query(self.query_np, query, split_by, splits, parameters, settings, kwargs)
+        return options.np.concatenate(results)
+
+    async def query_arrow_parallel(  # type: ignore[override]
+        self,
+        query: str,
+        split_by: str | Sequence[str],
+        splits: int = 4,
+        parameters: Sequence | dict[str, Any] | None = None,
+        settings: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> pyarrow.Table:
+        """
+        Split a SELECT query into disjoint queries, run them concurrently, and combine the results into one PyArrow
+        table in split order.  See Client.query_df_parallel for the parameters
+        :return: PyArrow.Table
+        """
+        check_arrow()
+        results = await self._parallel_query(self.query_arrow, query, split_by, splits, parameters, settings, kwargs)
+        return options.arrow.concat_tables(results)
+
+    async def _parallel_query(  # type: ignore[override]
+        self,
+        method: Callable[..., Awaitable[Any]],
+        query: str,
+        split_by: str | Sequence[str],
+        splits: int,
+        parameters: Sequence | dict[str, Any] | None,
+        settings: dict[str, Any] | None,
+        kwargs: dict[str, Any],
+    ) -> list:
+        queries = split_queries(query, split_by, splits)
+        workers = common.get_setting("parallel_query_workers") or 1
+        if (settings and "session_id" in settings) or self.get_client_setting("session_id"):
+            # ClickHouse rejects concurrent queries in the same session
+            workers = 1
+        limit = asyncio.Semaphore(workers)
+
+        async def run(split_query: str):
+            async with limit:
+                return await method(split_query, parameters, settings, **kwargs)
+
+        tasks = [asyncio.ensure_future(run(split_query)) for split_query in queries]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def query_df_arrow(
         self,
         query: str,
@@ -944,7 +1145,7 @@ class AsyncClient(Client):
         dataframe_library: str = "pandas",
     ) -> pandas.DataFrame | polars.DataFrame:
         """
-        Query method using the ClickHouse Arrow format to return a DataFrame
+        Query method that streams the ClickHouse ArrowStream format to return a DataFrame
         with PyArrow dtype backend. This provides better performance and memory efficiency
         compared to the standard query_df method, though fewer output formatting options.
 
@@ -1050,9 +1251,11 @@ class AsyncClient(Client):
         transport_settings: dict[str, str] | None = None,
     ) -> QuerySummary:
         """
-        Insert a PyArrow table DataFrame into ClickHouse using raw Arrow format
+        Insert PyArrow data into ClickHouse using the ArrowStream format.  Record batches are serialized and sent
+        as the request body streams, so the complete Arrow IPC stream is never held in memory
         :param table: ClickHouse table
-        :param arrow_table: PyArrow Table object
+        :param arrow_table: PyArrow Table, RecordBatchReader, RecordBatch, or iterable of RecordBatches.  An
+          iterable must yield at least one RecordBatch, and all batches must share the schema of the first one
         :param database: Optional ClickHouse database
         :param settings: Optional dictionary of ClickHouse settings (key/string values)
         :param transport_settings: Optional dictionary of transport level settings (HTTP headers, etc.)
@@ -1061,10 +1264,30 @@ class AsyncClient(Client):
         self._add_integration_tag("arrow")
         full_table = table if "." in table or not database else f"{database}.{table}"
         compression = self.write_compression if self.write_compression in ("zstd", "lz4") else None
-        column_names, insert_block = arrow_buffer(arrow_table, compression)
-        if hasattr(insert_block, "to_pybytes"):
-            insert_block = insert_block.to_pybytes()
-        return await self.raw_insert(full_table, column_names, insert_block, settings, "Arrow", transport_settings=transport_settings)
+        column_names, insert_block = arrow_stream(arrow_table, compression)
+        loop = asyncio.get_running_loop()
+        # Record batches are serialized on an executor thread so reading a RecordBatchReader never blocks the loop
+        source = StreamingInsertSource(None, None, loop, chunks=insert_block)
+        source.start_producer()
+        try:
+            if not isinstance(arrow_table, (options.arrow.Table, options.arrow.RecordBatch)):
+                return await self.raw_insert(
+                    full_table, column_names, source.async_generator(), settings, "ArrowStream", transport_settings=transport_settings
+                )
+
+            # Tables and record batches are already in memory, so the stream can be serialized again for a retry
+            async def retry_block():
+                nonlocal source
+                await source.close(timeout=None)
+                source = StreamingInsertSource(None, None, loop, chunks=arrow_stream(arrow_table, compression)[1])
+                source.start_producer()
+                return source.async_generator()
+
+            return await self._raw_insert(
+                full_table, column_names, source.async_generator(), settings, "ArrowStream", transport_settings, retry_block
+            )
+        finally:
+            await source.close()
 
     async def insert_df_arrow(  # type: ignore[override]
         self,
@@ -1125,6 +1348,51 @@ class AsyncClient(Client):
             transport_settings=transport_settings,
         )
 
+    async def batching_inserter(  # type: ignore[override]
+        self,
+        table: str,
+        column_names: str | Sequence[str] | None = "*",
+        database: str | None = None,
+        column_types: Sequence[ClickHouseType] | None = None,
+        column_type_names: Sequence[str] | None = None,
+        settings: dict[str, Any] | None = None,
+        transport_settings: dict[str, str] | None = None,
+        max_rows: int = DEFAULT_BATCH_ROWS,
+        max_bytes: int = DEFAULT_BATCH_BYTES,
+        max_latency: float = DEFAULT_BATCH_LATENCY,
+        max_pending: int = 2,
+    ) -> AsyncBatchingInserter:
+        """
+        Creates an inserter that collects many small inserts into the table and inserts them in larger batches from
+        a task on the running event loop
+        :param table: Target table
+        :param column_names: Ordered list of column names or '*' if column types should be retrieved from the
+            ClickHouse table definition
+        :param database: Target database -- will use client default database if not specified
+        :param column_types: ClickHouse column types.  If set then column data does not need to be retrieved from
+            the server
+        :param column_type_names: ClickHouse column type names.  If set then column data does not need to be
+            retrieved from the server
+        :param settings: Optional dictionary of ClickHouse settings (key/string values)
+        :param transport_settings: Optional dictionary of transport level settings (HTTP headers, etc.)
+        :param max_rows: Insert the current batch once it holds this many rows
+        :param max_bytes: Insert the current batch once its estimated size reaches this many bytes
+        :param max_latency: Insert the current batch this many seconds after its first rows were added
+        :param max_pending: Number of full batches that may wait to be inserted before add waits
+        :return: AsyncBatchingInserter, which should be closed to insert any remaining rows
+        """
+        context = await self.create_insert_context(
+            table,
+            column_names,
+            database,
+            column_types,
+            column_type_names,
+            True,
+            settings,
+            transport_settings=transport_settings,
+        )
+        return AsyncBatchingInserter(self, context, max_rows, max_bytes, max_latency, max_pending)
+
     async def create_insert_context(  # type: ignore[override]
         self,
         table: str,
@@ -1165,6 +1433,8 @@ class AsyncClient(Client):
                 data,
                 transport_settings,
                 server_tz=self.server_tz,
+                schema_cache=self._schema_cache,
+                default_database=self.database,
             ),
             self._execute_operation,
         )
@@ -1201,7 +1471,9 @@ class AsyncClient(Client):
 
         runtime = QueryRuntime(database=self.database, settings=self._validate_settings(context.settings))
         try:
-            summary = await self._backend.execute_data_insert(context, runtime, active_source.async_generator(), rebuild_body)
+            # A streamed insert consumes its data as it is sent, so there is nothing to rebuild the body from
+            retry_body = None if context.streaming else rebuild_body
+            summary = await self._backend.execute_data_insert(context, runtime, active_source.async_generator(), retry_body)
         except Exception:
             await active_source.close()
 
@@ -1216,6 +1488,58 @@ class AsyncClient(Client):
 
         return QuerySummary(summary)
 
+    async def insert_parallel(  # type: ignore[override]
+        self,
+        table: str,
+        data: Any,
+        slices: int = 4,
+        shard_by: str | None = None,
+        column_names: str | Sequence[str] | None = "*",
+        database: str | None = None,
+        column_types: Sequence[ClickHouseType] | None = None,
+        column_type_names: Sequence[str] | None = None,
+        column_oriented: bool = False,
+        settings: dict[str, Any] | None = None,
+        transport_settings: dict[str, str] | None = None,
+    ) -> QuerySummary:
+        """
+        Split a large insert into slices that are serialized and uploaded as separate concurrent inserts.  At most
+        parallel_insert_workers slices are inserted at once, or one at a time if the client has a session ID.  See
+        Client.insert_parallel for the parameters
+        :return: QuerySummary combining the summaries of every slice.  Raises PartialInsertError with the combined
+          summary of the inserted slices and the data of the failed slices if any slice fails
+        """
+        context = await self.create_insert_context(
+            table,
+            column_names,
+            database,
+            column_types,
+            column_type_names,
+            column_oriented,
+            settings,
+            transport_settings=transport_settings,
+        )
+        parts = slice_insert_data(data, slices, context.column_names, column_oriented, shard_by)
+        workers = common.get_setting("parallel_insert_workers") or 1
+        if (settings and "session_id" in settings) or self.get_client_setting("session_id"):
+            # ClickHouse rejects concurrent queries in the same session
+            workers = 1
+        limit = asyncio.Semaphore(workers)
+
+        async def run(part):
+            if not insert_row_count(part, column_oriented):
+                return None
+            async with limit:
+                return await self.insert(data=part, context=copy.copy(context))
+
+        tasks = [asyncio.ensure_future(run(part)) for part in parts]
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return _parallel_insert_summary(context.table, parts, results)
+
     async def insert_df(  # type: ignore[override]
         self,
         table: str | None = None,
@@ -1283,6 +1607,22 @@ class AsyncClient(Client):
         )
         return QuerySummary(summary)
 
+    async def _raw_insert(  # type: ignore[override]
+        self,
+        table: str,
+        column_names: Sequence[str] | None,
+        insert_block: AsyncIterable[bytes],
+        settings: dict | None,
+        fmt: str,
+        transport_settings: dict[str, str] | None,
+        retry_block: Callable[[], Awaitable[AsyncIterable[bytes]]],
+    ) -> QuerySummary:
+        runtime = QueryRuntime(database=self.database, settings=self._validate_settings(settings or {}))
+        summary = await self._backend.execute_raw_insert(
+            table, column_names, insert_block, fmt, None, runtime, transport_settings, retry_block
+        )
+        return QuerySummary(summary)
+
     def _add_integration_tag(self, name: str):
         """
         Dynamically adds a product (like pandas or sqlalchemy) to the User-Agent string details section.
@@ -0,0 +1,308 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future, InvalidStateError
+from typing import TYPE_CHECKING, Any
+
+from clickhouse_connect.driver.ctypes import data_conv
+from clickhouse_connect.driver.exceptions import ProgrammingError
+from clickhouse_connect.driver.insert import InsertContext
+from clickhouse_connect.driver.summary import QuerySummary
+
+if TYPE_CHECKING:
+    from clickhouse_connect.driver.asyncclient import AsyncClient
+    from clickhouse_connect.driver.client import Client
+
+__all__ = ["BatchingInserter", "AsyncBatchingInserter"]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_ROWS = 100_000
+DEFAULT_BATCH_BYTES = 16 * 1024 * 1024
+DEFAULT_BATCH_LATENCY = 1.0
+# Number of values of each variable width column sampled to estimate the byte size of added rows
+_SIZE_SAMPLE = 16
+
+
+class _Batch:
+    __slots__ = ("columns", "row_count", "future")
+
+    def __init__(self, columns: list[list], row_count: int, future: Any):
+        self.columns = columns
+        self.row_count = row_count
+        self.future = future
+
+
+class _BatchBuffer:
+    """
+    Column buffers and flush thresholds shared by the sync and async batching inserters.  Callers hold the inserter
+    lock for every method except _pivot and _estimate_bytes
+    """
+
+    def __init__(self, context: InsertContext, max_rows: int, max_bytes: int, max_latency: float, max_pending: int):
+        if max_rows <= 0 or max_bytes <= 0 or max_latency <= 0 or max_pending <= 0:
+            raise ProgrammingError("Batching inserter limits must be positive")
+        self.context = context
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_latency = max_latency
+        self.max_pending = max_pending
+        self._pending: deque[_Batch] = deque()
+        self._closed = False
+        self._last_future: Any = None
+        self._reset()
+
+    def _reset(self):
+        self._columns: list[list] = [[] for _ in self.context.column_names]
+        self._rows = 0
+        self._bytes = 0
+        self._deadline = 0.0
+        self._future: Any = None
+
+    def _pivot(self, data: Sequence[Sequence[Any]], column_oriented: bool) -> Sequence[Sequence[Any]]:
+        if len(data) == 0:
+            raise ProgrammingError("No data specified for insert")
+        columns = data if column_oriented else data_conv.pivot(data, 0, len(data))
+        if len(columns) != len(self.context.column_names):
+            raise ProgrammingError("Insert data column count does not match column names")
+        if len(columns[0]) == 0:
+            raise ProgrammingError("No data specified for insert")
+        return columns
+
+    def _estimate_bytes(self, columns: Sequence[Sequence[Any]]) -> int:
+        row_count = len(columns[0])
+        row_size = 0
+        for ch_type, column in zip(self.context.column_types, columns):
+            if ch_type.byte_size:
+                row_size += ch_type.byte_size
+            else:
+                step = max(1, row_count // _SIZE_SAMPLE)
+                row_size += ch_type.data_size([column[i] for i in range(0, row_count, step)])
+        return row_count * row_size
+
+    def _append(self, columns: Sequence[Sequence[Any]], byte_size: int, now: float, new_future):
+        if self._closed:
+            raise ProgrammingError("Batching inserter is closed")
+        if self._rows == 0:
+            self._deadline = now + self.max_latency
+            self._future = new_future()
+        for buffer, column in zip(self._columns, columns):
+            buffer.extend(column)
+        self._rows += len(columns[0])
+        self._bytes += byte_size
+        future = self._future
+        if self._rows >= self.max_rows or self._bytes >= self.max_bytes:
+            self._seal()
+        return future
+
+    def _seal(self):
+        if self._rows:
+            self._pending.append(_Batch(self._columns, self._rows, self._future))
+            self._last_future = self._future
+            self._reset()
+
+    def _next_batch(self, now: float) -> _Batch | None:
+        if self._rows and (self._closed or now >= self._deadline):
+            self._seal()
+        if self._pending:
+            return self._pending.popleft()
+        return None
+
+    def _wait_time(self, now: float) -> float | None:
+        return max(0.0, self._deadline - now) if self._rows else None
+
+    def _insert_done(self, batch: _Batch, summary: QuerySummary | None, ex: Exception | None):
+        if ex is not None:
+            logger.warning("Batched insert of %d rows into %s failed: %s", batch.row_count, self.context.table, ex)
+        # A future cancelled by one caller is shared with every other add into the same batch, so the insert
+        # itself still runs
+        if batch.future.done():
+            return
+        try:
+            if ex is None:
+                batch.future.set_result(summary)
+            else:
+                batch.future.set_exception(ex)
+        except (InvalidStateError, asyncio.InvalidStateError):
+            # Cancelled by another thread after the check
+            pass
+
+
+class BatchingInserter(_BatchBuffer):
+    """
+    Accumulates small inserts into one table in column buffers and inserts them in larger batches from a background
+    thread.  A batch is inserted once it reaches max_rows rows or an estimated max_bytes bytes, or max_latency
+    seconds after its first rows were added.  At most max_pending full batches wait behind the batch being inserted,
+    after which add blocks until the background thread catches up.
+
+    The background thread inserts through the client that created the inserter, so that client should not be used
+    concurrently by other threads if it has a session ID
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        context: InsertContext,
+        max_rows: int = DEFAULT_BATCH_ROWS,
+        max_bytes: int = DEFAULT_BATCH_BYTES,
+        max_latency: float = DEFAULT_BATCH_LATENCY,
+        max_pending: int = 2,
+    ):
+        super().__init__(context, max_rows, max_bytes, max_latency, max_pending)
+        self._client = client
+        self._changed = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=f"batching-inserter-{context.table}", daemon=True)
+        self._thread.start()
+
+    def add(self, data: Sequence[Sequence[Any]], column_oriented: bool = False) -> "Future[QuerySummary]":
+        """
+        Add rows to the current batch
+        :param data: Sequence of rows, or of columns if column_oriented is True
+        :param column_oriented: If true the data is already "pivoted" in column form
+        :return: Future resolved with the QuerySummary of the insert that includes these rows, or with its exception
+        """
+        columns = self._pivot(data, column_oriented)
+        byte_size = self._estimate_bytes(columns)
+        with self._changed:
+            while len(self._pending) >= self.max_pending and not self._closed:
+                self._changed.wait()
+            future = self._append(columns, byte_size, time.monotonic(), Future)
+            self._changed.notify_all()
+        return future
+
+    def flush(self) -> "Future[QuerySummary] | None":
+        """
+        Insert the current batch without waiting for a flush threshold
+        :return: Future resolved once every row added so far has been inserted, or None if nothing was ever added
+        """
+        with self._changed:
+            self._seal()
+            self._changed.notify_all()
+            return self._last_future
+
+    def close(self):
+        """
+        Insert any buffered rows and stop the background thread.  Failed inserts are reported only through their
+        futures
+        """
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._changed:
+                while True:
+                    now = time.monotonic()
+                    batch = self._next_batch(now)
+                    if batch is not None:
+                        self._changed.notify_all()
+                        break
+                    if self._closed:
+                        return
+                    self._changed.wait(self._wait_time(now))
+            try:
+                summary = self._client.insert(data=batch.columns, context=self.context)
+            except Exception as ex:
+                self._insert_done(batch, None, ex)
+            else:
+                self._insert_done(batch, summary, None)
+            finally:
+                self.context.data = None
+
+    def __enter__(self) -> "BatchingInserter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+
+
+class AsyncBatchingInserter(_BatchBuffer):
+    """
+    asyncio version of BatchingInserter.  Batches are inserted by a task on the event loop that created the
+    inserter, add awaits while max_pending full batches are waiting, and the returned futures are asyncio futures
+    """
+
+    def __init__(
+        self,
+        client: "AsyncClient",
+        context: InsertContext,
+        max_rows: int = DEFAULT_BATCH_ROWS,
+        max_bytes: int = DEFAULT_BATCH_BYTES,
+        max_latency: float = DEFAULT_BATCH_LATENCY,
+        max_pending: int = 2,
+    ):
+        super().__init__(context, max_rows, max_bytes, max_latency, max_pending)
+        self._client = client
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Condition()
+        self._task = self._loop.create_task(self._run())
+
+    async def add(self, data: Sequence[Sequence[Any]], column_oriented: bool = False) -> "asyncio.Future[QuerySummary]":
+        """
+        Add rows to the current batch
+        :param data: Sequence of rows, or of columns if column_oriented is True
+        :param column_oriented: If true the data is already "pivoted" in column form
+        :return: Future resolved with the QuerySummary of the insert that includes these rows, or with its exception
+        """
+        columns = self._pivot(data, column_oriented)
+        byte_size = self._estimate_bytes(columns)
+        async with self._changed:
+            await self._changed.wait_for(lambda: len(self._pending) < self.max_pending or self._closed)
+            future = self._append(columns, byte_size, self._loop.time(), self._loop.create_future)
+            self._changed.notify_all()
+        return future
+
+    async def flush(self) -> "asyncio.Future[QuerySummary] | None":
+        """
+        Insert the current batch without waiting for a flush threshold
+        :return: Future resolved once every row added so far has been inserted, or None if nothing was ever added
+        """
+        async with self._changed:
+            self._seal()
+            self._changed.notify_all()
+            return self._last_future
+
+    async def close(self):
+        """
+        Insert any buffered rows and stop the background task.  Failed inserts are reported only through their
+        futures
+        """
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+        await self._task
+
+    async def _run(self):
+        while True:
+            async with self._changed:
+                while True:
+                    now = self._loop.time()
+                    batch = self._next_batch(now)
+                    if batch is not None:
+                        self._changed.notify_all()
+                        break
+                    if self._closed:
+                        return
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), self._wait_time(now))
+                    except asyncio.TimeoutError:
+                        pass
+            try:
+                summary = await self._client.insert(data=batch.columns, context=self.context)
+            except Exception as ex:
+                self._insert_done(batch, None, ex)
+            else:
+                self._insert_done(batch, summary, None)
+            finally:
+                self.context.data = None
+
+    async def __aenter__(self) -> "AsyncBatchingInserter":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback) -> None:
+        await self.close()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import copy
+import functools
 import io
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from datetime import timezone, tzinfo
 from typing import (
     TYPE_CHECKING,
@@ -22,10 +24,12 @@ from clickhouse_connect.driver._backend.models import ClientConfig, QueryRuntime
 from clickhouse_connect.driver._backend.operations import CommandOp, Operation, QueryOp, RawQueryOp
 from clickhouse_connect.driver._backend.orchestration import (
     InitializationResult,
+    full_table_name,
     init_sequence,
     insert_context_sequence,
     run_sync,
 )
+from clickhouse_connect.driver.batching import DEFAULT_BATCH_BYTES, DEFAULT_BATCH_LATENCY, DEFAULT_BATCH_ROWS, BatchingInserter
 from clickhouse_connect.driver.binding import (
     _binding_has_binary_values,
     _binding_keeps_query_structure,
@@ -42,14 +46,17 @@ from clickhouse_connect.driver.common import (
     coerce_show_clickhouse_errors,
     dict_copy,
     version_at_least,
+    worker_pool,
 )
 from clickhouse_connect.driver.exceptions import (
     DataError,
+    Error,
     OperationalError,
+    PartialInsertError,
     ProgrammingError,
 )
 from clickhouse_connect.driver.external import ExternalData
-from clickhouse_connect.driver.insert import InsertContext
+from clickhouse_connect.driver.insert import InsertContext, insert_row_count, slice_insert_data
 from clickhouse_connect.driver.models import SettingDef, SettingStatus, setting_status
 from clickhouse_connect.driver.options import (
     check_arrow,
@@ -64,12 +71,18 @@ from clickhouse_connect.driver.query import (
     QueryResult,
     TzMode,
     TzSource,
-    arrow_buffer,
+    arrow_stream,
     leading_select_re,
+    read_arrow_source,
+    read_arrow_stream,
     remove_sql_comments,
-    to_arrow,
+    select_re,
+    split_queries,
     to_arrow_batches,
 )
+from clickhouse_connect.driver.resultcache import ResultCache, result_key
+from clickhouse_connect.driver.schemacache import SCHEMA_MISMATCH_CODES, SchemaCache, schema_key
+from clickhouse_connect.driver.serverinfocache import shared_server_info_cache
 from clickhouse_connect.driver.summary import QuerySummary
 from clickhouse_connect.driver.types import Closable
 
@@ -139,6 +152,20 @@ def _apply_arrow_tz_policy(table: pyarrow.Table, tz_mode: str) -> pyarrow.Table:
     return table
 
 
+def _parallel_insert_summary(table: str, parts: Sequence, results: Sequence[QuerySummary | BaseException | None]) -> QuerySummary:
+    """
+    Combine the results of the slices of a parallel insert, where empty slices have a None result, raising
+    PartialInsertError with the data of the failed slices if any slice failed
+    """
+    summary = QuerySummary.combine([result for result in results if isinstance(result, QuerySummary)])
+    errors = {ix: result for ix, result in enumerate(results) if isinstance(result, BaseException)}
+    if not errors:
+        return summary
+    first = next(iter(errors.values()))
+    message = f"{len(errors)} of {len(results)} parallel insert slices into {table} failed: {first}"
+    raise PartialInsertError(message, summary, errors, {ix: parts[ix] for ix in errors}) from first
+
+
 class Client(ABC):
     """
     Base ClickHouse Connect client
@@ -164,6 +191,10 @@ class Client(ABC):
     _apply_server_tz = False
     tz_mode: TzMode = "naive_utc"
     show_clickhouse_errors: ShowClickHouseErrors = True
+    _schema_cache: SchemaCache | None = None
+    _result_cache: ResultCache | None = None
+    # Key of this client's server in the shared server info cache, or None if the client never uses that cache
+    _server_info_key: str | None = None
 
     @property
     def tz_source(self) -> TzSource:
@@ -223,6 +254,12 @@ class Client(ABC):
         if resolved_tz_source not in _VALID_TZ_SOURCES:
             raise ProgrammingError(f'tz_source must be "auto", "server", or "local", got "{resolved_tz_source}"')
         self._tz_source = resolved_tz_source
+        schema_cache_size = common.get_setting("schema_cache_size")
+        if schema_cache_size > 0:
+            self._schema_cache = SchemaCache(schema_cache_size, common.get_setting("schema_cache_ttl"))
+        result_cache_size = common.get_setting("result_cache_size")
+        if result_cache_size > 0:
+            self._result_cache = ResultCache(result_cache_size, common.get_setting("result_cache_ttl"))
 
         # Initialize attributes that will be set during connection
         self.server_version: str | None = None
@@ -237,7 +274,7 @@ class Client(ABC):
 
     def _init_common_settings(self, tz_source: TzSource):
         config = ClientConfig(settings=self._initial_settings or {}, timezone_policy=tz_source)
-        result = run_sync(init_sequence(config), self._execute_operation)
+        result = run_sync(init_sequence(config, shared_server_info_cache(), self._server_info_key), self._execute_operation)
         self._apply_init_result(result)
 
     def _execute_operation(self, operation: Operation) -> object:
@@ -848,7 +885,7 @@ class Client(ABC):
         transport_settings: dict[str, str] | None = None,
     ) -> pyarrow.Table:
         """
-        Query method using the ClickHouse Arrow format to return a PyArrow table
+        Query method that streams the ClickHouse ArrowStream format and returns a PyArrow table built batch by batch
         :param query: Query statement/format string
         :param parameters: Optional dictionary used to format the query
         :param settings: Optional dictionary of ClickHouse settings (key/string values)
@@ -860,15 +897,27 @@ class Client(ABC):
         check_arrow()
         self._add_integration_tag("arrow")
         settings = self._update_arrow_settings(settings, use_strings)
-        return to_arrow(
-            self.raw_query(
-                query,
-                parameters,
-                settings,
-                fmt="Arrow",
-                external_data=external_data,
-                transport_settings=transport_settings,
-            )
+        cache_key = self._arrow_result_key(query, parameters, settings, external_data)
+        recorder = None
+        if cache_key is not None:
+            cache = cast(ResultCache, self._result_cache)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return read_arrow_source(cached.replay())
+            recorder = functools.partial(cache.recorder, cache_key)
+        return read_arrow_stream(
+            cast(
+                io.IOBase,
+                self.raw_stream(
+                    query,
+                    parameters,
+                    settings,
+                    fmt="ArrowStream",
+                    external_data=external_data,
+                    transport_settings=transport_settings,
+                ),
+            ),
+            recorder,
         )
 
     def query_arrow_stream(
@@ -907,6 +956,92 @@ class Client(ABC):
             )
         )
 
+    def query_df_parallel(
+        self,
+        query: str,
+        split_by: str | Sequence[str],
+        splits: int = 4,
+        parameters: Sequence | dict[str, Any] | None = None,
+        settings: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> pandas.DataFrame:
+        """
+        Split a SELECT query into disjoint queries, run them concurrently, and combine the results into one pandas
+        DataFrame in split order.  The queries run on up to parallel_query_workers pooled connections, or one at a
+        time if the client has a session ID
+        :param query: SELECT query without a FORMAT clause
+        :param split_by: Expression over the query result columns whose hash splits the rows into `splits` groups, or
+          a sequence of disjoint filter conditions on the result columns, one for each split
+        :param splits: Number of splits when split_by is an expression
+        :param parameters: Optional dictionary used to format the query
+        :param settings: Optional dictionary of ClickHouse settings (key/string values)
+        :param kwargs: Other query_df arguments, applied to each split
+        :return: Pandas dataframe representing the result set
+        """
+        check_pandas()
+        results = self._parallel_query(self.query_df, query, split_by, splits, parameters, settings, kwargs)
+        return options.pd.concat(results, ignore_index=True)
+
+    def query_np_parallel(
+        self,
+        query: str,
+        split_by: str | Sequence[str],
+        splits: int = 4,
+        parameters: Sequence | dict[str, Any] | None = None,
+        settings: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> numpy.ndarray:
+        """
+        Split a SELECT query into disjoint queries, run them concurrently, and combine the results into one numpy
+        array in split order.  See query_df_parallel for the parameters
+        :return: Numpy array representing the result set
+        """
+        check_numpy()
+        results = self._parallel_query(self.query_np, query, split_by, splits, parameters, settings, kwargs)
+        return options.np.concatenate(results)
+
+    def query_arrow_parallel(
+        self,
+        query: str,
+        split_by: str | Sequence[str],
+        splits: int = 4,
+        parameters: Sequence | dict[str, Any] | None = None,
+        settings: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> pyarrow.Table:
+        """
+        Split a SELECT query into disjoint queries, run them concurrently, and combine the results into one PyArrow
+        table in split order.  See query_df_parallel for the parameters
+        :return: PyArrow.Table
+        """
+        check_arrow()
+        results = self._parallel_query(self.query_arrow, query, split_by, splits, parameters, settings, kwargs)
+        return options.arrow.concat_tables(results)
+
+    def _parallel_query(
+        self,
+        method: Callable[..., Any],
+        query: str,
+        split_by: str | Sequence[str],
+        splits: int,
+        parameters: Sequence | dict[str, Any] | None,
+        settings: dict[str, Any] | None,
+        kwargs: dict[str, Any],
+    ) -> list:
+        queries = split_queries(query, split_by, splits)
+        pool = worker_pool("parallel_query_workers")
+        if pool is not None and ((settings and "session_id" in settings) or self.get_client_setting("session_id")):
+            # ClickHouse rejects concurrent queries in the same session
+            pool = None
+        if pool is None:
+            return [method(split_query, parameters, settings, **kwargs) for split_query in queries]
+        futures = [pool.submit(method, split_query, parameters, settings, **kwargs) for split_query in queries]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
     def query_df_arrow(
         self,
         query: str,
@@ -918,7 +1053,7 @@ class Client(ABC):
         dataframe_library: str = "pandas",
     ) -> pandas.DataFrame | polars.DataFrame:
         """
-        Query method using the ClickHouse Arrow format to return a DataFrame
+        Query method that streams the ClickHouse ArrowStream format to return a DataFrame
         with PyArrow dtype backend. This provides better performance and memory efficiency
         compared to the standard query_df method, though fewer output formatting options.
 
@@ -1066,7 +1201,7 @@ class Client(ABC):
     def insert(
         self,
         table: str | None = None,
-        data: Sequence[Sequence[Any]] | None = None,
+        data: Sequence[Sequence[Any]] | Iterable[Sequence[Any]] | None = None,
         column_names: str | Sequence[str] | None = "*",
         database: str | None = None,
         column_types: Sequence[ClickHouseType] | None = None,
@@ -1080,7 +1215,9 @@ class Client(ABC):
         Method to insert multiple rows/data matrix of native Python objects.  If context is specified arguments
         other than data are ignored
         :param table: Target table
-        :param data: Sequence of sequences of Python data
+        :param data: Sequence of sequences of Python data, or any iterable of rows (of column chunks if
+            column_oriented).  An iterable without a length is read as the insert is sent, so it is never held in
+            memory at once, but the insert can not be retried after a connection error
         :param column_names: Ordered list of column names or '*' if column types should be retrieved from the
             ClickHouse table definition
         :param database: Target database -- will use client default database if not specified.
@@ -1114,7 +1251,81 @@ class Client(ABC):
             if not context.empty:
                 raise ProgrammingError("Attempting to insert new data with non-empty insert context") from None
             context.data = data
-        return self.data_insert(context)
+        try:
+            return self.data_insert(context)
+        except Error as ex:
+            self._check_schema_mismatch(context, ex)
+            raise
+
+    def insert_parallel(
+        self,
+        table: str,
+        data: Any,
+        slices: int = 4,
+        shard_by: str | None = None,
+        column_names: str | Sequence[str] | None = "*",
+        database: str | None = None,
+        column_types: Sequence[ClickHouseType] | None = None,
+        column_type_names: Sequence[str] | None = None,
+        column_oriented: bool = False,
+        settings: dict[str, Any] | None = None,
+        transport_settings: dict[str, str] | None = None,
+    ) -> QuerySummary:
+        """
+        Split a large insert into slices that are serialized and uploaded as separate concurrent inserts on up to
+        parallel_insert_workers pooled connections, or one at a time if the client has a session ID.  Every slice
+        is attempted even if another fails, and each slice is atomic only on its own
+        :param table: Target table
+        :param data: pandas DataFrame, NumPy array, or sequence of rows (of columns if column_oriented)
+        :param slices: Number of slices
+        :param shard_by: Optional column name.  If set, rows are assigned to slices by the pandas hash of this column,
+          so that rows with equal values are inserted by the same request.  Otherwise each slice is a contiguous row
+          range
+        :param column_names: Ordered list of column names or '*' if column types should be retrieved from the
+            ClickHouse table definition
+        :param database: Target database -- will use client default database if not specified.
+        :param column_types: ClickHouse column types.  If set then column data does not need to be retrieved from
+            the server
+        :param column_type_names: ClickHouse column type names.  If set then column data does not need to be
+            retrieved from the server
+        :param column_oriented: If true the data is already "pivoted" in column form
+        :param settings: Optional dictionary of ClickHouse settings (key/string values)
+        :param transport_settings: Optional dictionary of transport level settings (HTTP headers, etc.)
+        :return: QuerySummary combining the summaries of every slice.  Raises PartialInsertError with the combined
+          summary of the inserted slices and the data of the failed slices if any slice fails
+        """
+        context = self.create_insert_context(
+            table,
+            column_names,
+            database,
+            column_types,
+            column_type_names,
+            column_oriented,
+            settings,
+            transport_settings=transport_settings,
+        )
+        parts = slice_insert_data(data, slices, context.column_names, column_oriented, shard_by)
+        pool = worker_pool("parallel_insert_workers")
+        if pool is not None and ((settings and "session_id" in settings) or self.get_client_setting("session_id")):
+            # ClickHouse rejects concurrent queries in the same session
+            pool = None
+        # Empty slices are skipped but keep their index, so the indexes of failed slices match the slicing
+        results: list[QuerySummary | BaseException | None] = [None] * len(parts)
+        filled = [ix for ix, part in enumerate(parts) if insert_row_count(part, column_oriented)]
+        if pool is None:
+            for ix in filled:
+                try:
+                    results[ix] = self.insert(data=parts[ix], context=copy.copy(context))
+                except Exception as ex:
+                    results[ix] = ex
+        else:
+            futures = {ix: pool.submit(self.insert, data=parts[ix], context=copy.copy(context)) for ix in filled}
+            for ix, future in futures.items():
+                try:
+                    results[ix] = future.result()
+                except Exception as ex:
+                    results[ix] = ex
+        return _parallel_insert_summary(context.table, parts, results)
 
     def insert_df(
         self,
@@ -1173,9 +1384,11 @@ class Client(ABC):
         transport_settings: dict[str, str] | None = None,
     ) -> QuerySummary:
         """
-        Insert a PyArrow table DataFrame into ClickHouse using raw Arrow format
+        Insert PyArrow data into ClickHouse using the ArrowStream format.  Record batches are serialized and sent
+        as the request body streams, so the complete Arrow IPC stream is never held in memory
         :param table: ClickHouse table
-        :param arrow_table: PyArrow Table object
+        :param arrow_table: PyArrow Table, RecordBatchReader, RecordBatch, or iterable of RecordBatches.  An
+          iterable must yield at least one RecordBatch, and all batches must share the schema of the first one
         :param database: Optional ClickHouse database
         :param settings: Optional dictionary of ClickHouse settings (key/string values)
         :param transport_settings: Optional dictionary of transport level settings (HTTP headers, etc.)
@@ -1184,8 +1397,14 @@ class Client(ABC):
         self._add_integration_tag("arrow")
         full_table = table if "." in table or not database else f"{database}.{table}"
         compression = self.write_compression if self.write_compression in ("zstd", "lz4") else None
-        column_names, insert_block = arrow_buffer(arrow_table, compression)
-        return self.raw_insert(full_table, column_names, insert_block, settings, "Arrow", transport_settings=transport_settings)
+        column_names, insert_block = arrow_stream(arrow_table, compression)
+        if isinstance(arrow_table, (options.arrow.Table, options.arrow.RecordBatch)):
+            # Tables and record batches are already in memory, so the stream can be serialized again for a retry
+            def retry_block():
+                return arrow_stream(arrow_table, compression)[1]
+
+            return self._raw_insert(full_table, column_names, insert_block, settings, "ArrowStream", transport_settings, retry_block)
+        return self.raw_insert(full_table, column_names, insert_block, settings, "ArrowStream", transport_settings=transport_settings)
 
     def insert_df_arrow(
         self,
@@ -1286,10 +1505,126 @@ class Client(ABC):
                 data,
                 transport_settings,
                 server_tz=self.server_tz,
+                schema_cache=self._schema_cache,
+                default_database=self.database,
             ),
             self._execute_operation,
         )
 
+    def batching_inserter(
+        self,
+        table: str,
+        column_names: str | Sequence[str] | None = "*",
+        database: str | None = None,
+        column_types: Sequence[ClickHouseType] | None = None,
+        column_type_names: Sequence[str] | None = None,
+        settings: dict[str, Any] | None = None,
+        transport_settings: dict[str, str] | None = None,
+        max_rows: int = DEFAULT_BATCH_ROWS,
+        max_bytes: int = DEFAULT_BATCH_BYTES,
+        max_latency: float = DEFAULT_BATCH_LATENCY,
+        max_pending: int = 2,
+    ) -> BatchingInserter:
+        """
+        Creates an inserter that collects many small inserts into the table and inserts them in larger batches from
+        a background thread
+        :param table: Target table
+        :param column_names: Ordered list of column names or '*' if column types should be retrieved from the
+            ClickHouse table definition
+        :param database: Target database -- will use client default database if not specified
+        :param column_types: ClickHouse column types.  If set then column data does not need to be retrieved from
+            the server
+        :param column_type_names: ClickHouse column type names.  If set then column data does not need to be
+            retrieved from the server
+        :param settings: Optional dictionary of ClickHouse settings (key/string values)
+        :param transport_settings: Optional dictionary of transport level settings (HTTP headers, etc.)
+        :param max_rows: Insert the current batch once it holds this many rows
+        :param max_bytes: Insert the current batch once its estimated size reaches this many bytes
+        :param max_latency: Insert the current batch this many seconds after its first rows were added
+        :param max_pending: Number of full batches that may wait to be inserted before add blocks
+        :return: BatchingInserter, which should be closed to insert any remaining rows
+        """
+        context = self.create_insert_context(
+            table,
+            column_names,
+            database,
+            column_types,
+            column_type_names,
+            True,
+            settings,
+            transport_settings=transport_settings,
+        )
+        return BatchingInserter(self, context, max_rows, max_bytes, max_latency, max_pending)
+
+    def invalidate_schema_cache(self, table: str | None = None, database: str | None = None):
+        """
+        Remove cached insert table definitions so that the next insert retrieves column types from the server.
+        Only applies if the client schema cache is enabled with the schema_cache_size common setting
+        :param table: Table to invalidate.  If not set, every cached table definition is removed
+        :param database: Database of the table -- will use the client default database if not specified
+        """
+        if self._schema_cache is None:
+            return
+        if table is None:
+            self._schema_cache.invalidate()
+        else:
+            self._schema_cache.invalidate(schema_key(full_table_name(table, database), self.database))
+
+    def clear_result_cache(self):
+        """
+        Remove every cached query response.  Only applies if the client result cache is enabled with the
+        result_cache_size common setting
+        """
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def result_cache_stats(self) -> dict[str, int]:
+        """
+        Hit and miss counts, number of entries, and total bytes of the client result cache, or an empty dictionary
+        if the cache is not enabled
+        """
+        if self._result_cache is None:
+            return {}
+        return self._result_cache.stats()
+
+    def _result_key(self, context: QueryContext, runtime: QueryRuntime, prepped_query: str | bytes) -> tuple | None:
+        """
+        The result cache key for a Native query, or None if the result cache is disabled or the query is not a
+        SELECT.  Queries with external data are never cached
+        """
+        if self._result_cache is None or context.external_data is not None or not context.is_select:
+            return None
+        settings = self._effective_settings(runtime.settings)
+        return result_key("Native", runtime.database, prepped_query, context.bind_params, settings, runtime.protocol_version)
+
+    def _arrow_result_key(
+        self,
+        query: str,
+        parameters: Sequence | dict[str, Any] | None,
+        settings: dict[str, Any] | None,
+        external_data: ExternalData | None,
+    ) -> tuple | None:
+        """
+        The result cache key for an ArrowStream query, or None if the result cache is disabled or the query is not
+        a SELECT
+        """
+        if self._result_cache is None or external_data is not None or select_re.search(remove_sql_comments(query)) is None:
+            return None
+        final_query, bind_params, runtime = self._prep_raw_query_runtime(query, parameters, settings, "ArrowStream", True)
+        return result_key("ArrowStream", runtime.database, final_query, bind_params, self._effective_settings(runtime.settings))
+
+    def _effective_settings(self, settings: dict[str, Any]) -> dict[str, Any]:
+        """
+        The client level settings sent with every request, including any session ID and role, overridden by the
+        settings of one request
+        """
+        return dict(settings)
+
+    def _check_schema_mismatch(self, context: InsertContext, ex: Error):
+        if self._schema_cache is not None and ex.code in SCHEMA_MISMATCH_CODES:
+            logger.debug("Insert into %s failed with error code %s, invalidating cached schema", context.table, ex.code)
+            self._schema_cache.invalidate(schema_key(context.table, self.database))
+
     def min_version(self, version_str: str) -> bool:
         """
         Determine whether the connected server is at least the submitted version
@@ -1332,6 +1667,22 @@ class Client(ABC):
         :param transport_settings: Optional dictionary of transport level settings (HTTP headers, etc.)
         """
 
+    def _raw_insert(
+        self,
+        table: str,
+        column_names: Sequence[str] | None,
+        insert_block: Generator[bytes, None, None],
+        settings: dict | None,
+        fmt: str,
+        transport_settings: dict[str, str] | None,
+        retry_block: Callable[[], Generator[bytes, None, None]],
+    ) -> QuerySummary:
+        """
+        raw_insert of a streamed insert block, where retry_block builds the block again so that the request can be
+        resent after a connection error
+        """
+        return self.raw_insert(table, column_names, insert_block, settings, fmt, transport_settings=transport_settings)
+
     @abstractmethod
     def close(self) -> None:
         """
@@ -3,10 +3,13 @@ import asyncio
 import logging
 import struct
 import sys
+import threading
 from collections.abc import Callable, Generator, MutableSequence, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from io import IOBase
 from typing import Any, Literal
 
+from clickhouse_connect import common
 from clickhouse_connect.driver.exceptions import DataError, ProgrammingError, StreamClosedError
 from clickhouse_connect.driver.types import Closable
 
@@ -228,6 +231,26 @@ def version_at_least(server_version: str | None, required_version: str) -> bool:
     return True
 
 
+_worker_pools: dict[str, tuple[int, ThreadPoolExecutor]] = {}
+_worker_pools_lock = threading.Lock()
+
+
+def worker_pool(setting: str) -> ThreadPoolExecutor | None:
+    """Shared thread pool sized by the named common setting, or None if the setting disables it"""
+    workers = common.get_setting(setting) or 0
+    if workers < 2:
+        return None
+    with _worker_pools_lock:
+        current = _worker_pools.get(setting)
+        if current is not None and current[0] == workers:
+            return current[1]
+        # A replaced pool is not shut down, since other threads may still be submitting work to it.  Its idle worker
+        # threads exit once the last caller holding the pool releases it
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"ch_{setting}")
+        _worker_pools[setting] = (workers, pool)
+        return pool
+
+
 def first_value(column: Sequence, nullable: bool = True):
     if nullable:
         return next((x for x in column if x is not None), None)
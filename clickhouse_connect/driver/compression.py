@@ -61,6 +61,9 @@ comp_map: dict[str, "Compressor | type[Compressor]"] = {}
 
 
 class Compressor:
+    # Whether each compressed block is a complete stream of its own, so blocks can be compressed independently
+    independent_blocks = True
+
     def __init_subclass__(cls, tag: str, thread_safe: bool = True):
         comp_map[tag] = cls() if thread_safe else cls
 
@@ -72,6 +75,8 @@ class Compressor:
 
 
 class GzipCompressor(Compressor, tag="gzip", thread_safe=False):
+    independent_blocks = False
+
     def __init__(self, level: int = 6, wbits: int = 31):
         self.zlib_obj = zlib.compressobj(level=level, wbits=wbits)
 
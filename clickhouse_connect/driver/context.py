@@ -44,16 +44,30 @@ class BaseQueryContext:
         self.use_extended_dtypes = use_extended_dtypes
         self._active_col_fmt = None
         self._active_col_type_fmts = _empty_map
+        # Resolved type formats for each column, so that format patterns are matched once per query rather than
+        # once per block
+        self._resolved_fmts: dict[str | None, dict[str, str | None]] = {}
+        self._active_resolved_fmts = self._resolved_fmts.setdefault(None, {})
         self.column_renamer: Callable[[str], str] | None = None
 
     def start_column(self, name: str):
         self.column_name = name
         self._active_col_fmt = self.col_simple_formats.get(name)
         self._active_col_type_fmts = self.col_type_formats.get(name, _empty_map)
+        self._active_resolved_fmts = self._resolved_fmts.setdefault(name, {})
 
     def active_fmt(self, ch_type):
         if self._active_col_fmt:
             return self._active_col_fmt
+        if not self.type_formats and not self._active_col_type_fmts:
+            return None
+        try:
+            return self._active_resolved_fmts[ch_type]
+        except KeyError:
+            fmt = self._active_resolved_fmts[ch_type] = self._match_fmt(ch_type)
+            return fmt
+
+    def _match_fmt(self, ch_type):
         for type_pattern, fmt in self._active_col_type_fmts.items():
             if type_pattern.match(ch_type):
                 return fmt
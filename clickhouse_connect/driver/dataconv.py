@@ -1,12 +1,13 @@
 import array
-from collections.abc import Sequence
-from datetime import date, datetime, tzinfo
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, timezone, tzinfo
 from ipaddress import IPv4Address
+from math import floor
 from typing import Any
 from uuid import UUID, SafeUUID
 
 from clickhouse_connect.driver import options, tzutil
-from clickhouse_connect.driver.common import int_size, must_swap, write_array
+from clickhouse_connect.driver.common import array_type, int_size, must_swap, write_array
 from clickhouse_connect.driver.errors import NONE_IN_NULLABLE_COLUMN
 from clickhouse_connect.driver.types import ByteSource
 
@@ -121,6 +122,20 @@ def read_uuid_col(source: ByteSource, num_rows: int):
     return column
 
 
+def read_bigint_col(source: ByteSource, num_rows: int, byte_size: int, signed: bool):
+    data = source.read_bytes(byte_size * num_rows)
+    ifb = int.from_bytes
+    return [ifb(data[ix : ix + byte_size], "little", signed=signed) for ix in range(0, byte_size * num_rows, byte_size)]
+
+
+def write_bigint_col(column: Sequence, nullable: bool, byte_size: int, signed: bool, dest: bytearray):
+    empty = bytes(byte_size)
+    if nullable:
+        dest += b"".join(int(x).to_bytes(byte_size, "little", signed=signed) if x else empty for x in column)
+    else:
+        dest += b"".join(int(x).to_bytes(byte_size, "little", signed=signed) for x in column)
+
+
 def read_nullable_array(source: ByteSource, array_type: str, num_rows: int, null_obj: Any):
     null_map = source.read_bytes(num_rows)
     column = source.read_array(array_type, num_rows)
@@ -141,6 +156,27 @@ def build_lc_nullable_column(index: Sequence, keys: array.array, null_obj: Any):
     return column
 
 
+def build_lc_keys(column: Sequence, nullable: bool) -> tuple[list[Any], array.array]:
+    index: list[Any] = [None] if nullable else []
+    keys: list[int] = []
+    rev_map: dict[Any, int] = {}
+    rmg = rev_map.get
+    key = len(index)
+    for x in column:
+        if nullable and x is None:
+            keys.append(0)
+            continue
+        ix = rmg(x)
+        if ix is None:
+            keys.append(key)
+            index.append(x)
+            rev_map[x] = key
+            key += 1
+        else:
+            keys.append(ix)
+    return index, array.array("I", keys)
+
+
 def to_numpy_array(column: Sequence):
     np = options.np
     arr = np.empty((len(column),), dtype=np.object)
@@ -205,3 +241,62 @@ def build_map_columns(column: Sequence, dest: bytearray):
             keys.append(k)
             values.append(val)
     return keys, values
+
+
+def flatten_array_col(column: Sequence, dest: bytearray) -> list:
+    """
+    Pure Python fallback for flatten_array_col.
+    Flattens one nesting level of a column of sequences and writes UInt64 end offsets into dest.
+    """
+    offsets = array.array("Q")
+    values: list = []
+    total = 0
+    for v in column:
+        total += len(v)
+        offsets.append(total)
+        values.extend(v)
+    if must_swap:
+        offsets.byteswap()
+    dest += offsets.tobytes()
+    return values
+
+
+def unflatten_array_col(values: list, offsets: Sequence[int]) -> list:
+    column = []
+    last = 0
+    for x in offsets:
+        column.append(values[last:x])
+        last = x
+    return column
+
+
+def write_datetime_col(
+    column: Sequence,
+    nullable: bool,
+    prec: int,
+    naive_ts: Callable[[datetime], float] | None,
+    byte_size: int,
+    dest: bytearray,
+    col_name: str | None = None,
+) -> int:
+    """
+    Pure Python fallback for write_datetime_col.
+    Encodes datetimes or ISO 8601 strings as DateTime seconds or DateTime64 ticks, with naive values as UTC unless
+    naive_ts is provided.
+    """
+    ticks = []
+    for x in column:
+        if nullable and not x:
+            ticks.append(0)
+            continue
+        if isinstance(x, str):
+            x = datetime.fromisoformat(x)
+        if x.utcoffset() is not None:
+            ts = x.timestamp()
+        elif naive_ts is not None:
+            ts = naive_ts(x)
+        else:
+            ts = x.replace(tzinfo=timezone.utc).timestamp()
+        ticks.append(((floor(ts) * 1000000 + x.microsecond) * prec) // 1000000)
+    write_array(array_type(byte_size, byte_size == 8), ticks, dest, col_name)
+    return 0
@@ -5,6 +5,7 @@ libraries.  In most cases docstring are taken from the DBIApi 2.0 documentation
 """
 
 import re
+from typing import Any
 
 _error_name_re = re.compile(r"\(([A-Z][A-Z0-9_]+)\)")
 
@@ -113,6 +114,19 @@ class NotSupportedError(DatabaseError):
     has transactions turned off."""
 
 
+class PartialInsertError(DatabaseError):
+    """Exception raised when some slices of a parallel insert failed.  Every slice is attempted, so the rows of the
+    other slices were written.  summary is the combined QuerySummary of the written slices, errors maps the index
+    of each failed slice to its exception, and failed_slices maps the same indexes to the data of the slice, so
+    that only the failed slices can be inserted again."""
+
+    def __init__(self, message: str, summary, errors: dict[int, Exception], failed_slices: dict[int, Any] | None = None):
+        super().__init__(message)
+        self.summary = summary
+        self.errors = errors
+        self.failed_slices = failed_slices or {}
+
+
 class StreamClosedError(ProgrammingError):
     """Exception raised when a stream operation is executed on a closed stream."""
 
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from base64 import b64encode
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, cast
 
 from urllib3 import Timeout
@@ -9,6 +9,7 @@ from urllib3.poolmanager import PoolManager
 from urllib3.response import HTTPResponse
 
 from clickhouse_connect import common
+from clickhouse_connect.driver._backend.endpoints import host_port, split_hosts
 from clickhouse_connect.driver._backend.http_sync import HttpSyncBackend
 from clickhouse_connect.driver._backend.httpcommon import (
     add_integration_tag,
@@ -41,6 +42,7 @@ from clickhouse_connect.driver.httputil import (
     get_proxy_manager,
 )
 from clickhouse_connect.driver.query import TzMode, TzSource
+from clickhouse_connect.driver.serverinfocache import server_info_key
 from clickhouse_connect.driver.transform import NativeTransform
 
 logger = logging.getLogger(__name__)
@@ -73,7 +75,7 @@ class HttpClient(SyncBackendClient):
     def __init__(
         self,
         interface: str,
-        host: str,
+        host: str | Sequence[str],
         port: int,
         username: str,
         password: str,
@@ -106,6 +108,7 @@ class HttpClient(SyncBackendClient):
         form_encode_query_params: bool = False,
         rename_response_column: str | None = None,
         headers: dict[str, str] | None = None,
+        lb_policy: str = "round_robin",
     ):
         """
         Create an HTTP ClickHouse Connect client
@@ -114,7 +117,16 @@ class HttpClient(SyncBackendClient):
         proxy_path = proxy_path.lstrip("/")
         if proxy_path:
             proxy_path = "/" + proxy_path
-        self.url = f"{interface}://{host}:{port}{proxy_path}"
+        hosts = split_hosts(host)
+        host = hosts[0]
+        if len(hosts) == 1:
+            urls = [f"{interface}://{host}:{port}{proxy_path}"]
+        else:
+            urls = [f"{interface}://{name}:{name_port}{proxy_path}" for name, name_port in (host_port(entry, port) for entry in hosts)]
+            host, port = host_port(host, port)
+        self.url = urls[0]
+        if not token_provider:
+            self._server_info_key = server_info_key(self.url, username, access_token or password, settings)
         client_headers: dict[str, str] = {}
         self.params = dict_copy(HttpClient.params)
         ch_settings = dict_copy(settings, self.params)
@@ -179,7 +191,8 @@ class HttpClient(SyncBackendClient):
 
         if session_id:
             ch_settings["session_id"] = session_id
-        elif "session_id" not in ch_settings and _autogenerate_session_id:
+        elif "session_id" not in ch_settings and _autogenerate_session_id and (len(urls) == 1 or autogenerate_session_id):
+            # Sessions are bound to a single server, so only an explicit request enables them for multiple hosts
             ch_settings["session_id"] = str(uuid.uuid4())
 
         compression, write_compression = negotiate_compression(compress)
@@ -201,6 +214,8 @@ class HttpClient(SyncBackendClient):
             autogenerate_query_id=(common.get_setting("autogenerate_query_id") if autogenerate_query_id is None else autogenerate_query_id),
             read_format="Native",
             form_encode_query_params=form_encode_query_params,
+            urls=urls,
+            lb_policy=lb_policy,
         )
         self._initial_settings = settings
         # Stashed for _init_common_settings, which needs the discovered server
@@ -309,6 +324,9 @@ class HttpClient(SyncBackendClient):
     def get_client_setting(self, key: str) -> str | None:
         return self.params.get(key)
 
+    def _effective_settings(self, settings: dict[str, Any]) -> dict[str, Any]:
+        return dict_copy(self.params, settings)
+
     def set_access_token(self, access_token: str) -> None:
         self._backend.set_access_token(access_token)
 
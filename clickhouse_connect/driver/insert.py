@@ -1,7 +1,9 @@
 import logging
-from collections.abc import Generator, Iterable, Sequence
+from collections.abc import Generator, Iterable, Iterator, Sequence
 from datetime import timedelta, timezone, tzinfo
+from itertools import chain, islice
 from math import log
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 from clickhouse_connect.driver import options
@@ -15,6 +17,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 DEFAULT_BLOCK_BYTES = 1 << 21  # Try to generate blocks between 1MB and 2MB in raw size
+STREAM_SAMPLE_ROWS = 64  # Rows of a streamed insert sampled to estimate the block size
+_EMPTY = object()  # Returned by next for an exhausted insert stream, since None can be the first row
 
 
 class InsertBlock(NamedTuple):
@@ -74,7 +78,13 @@ class InsertContext(BaseQueryContext):
         self.row_count = 0
         self.column_count = 0
         self._data = None
-        if data is None or len(data) == 0:
+        self._stream: Iterator | None = None
+        if data is None:
+            return
+        if not hasattr(data, "__len__"):
+            self._set_stream(data)
+            return
+        if len(data) == 0:
             return
         if options.pd and isinstance(data, options.pd.DataFrame):
             data = self._convert_pandas(data)
@@ -99,6 +109,28 @@ class InsertContext(BaseQueryContext):
             self._data = data
             self.block_row_count = self._calc_block_size()
 
+    @property
+    def streaming(self) -> bool:
+        """
+        True if the insert data is an iterator or other unsized iterable, which is consumed as the insert is sent and
+        so can not be sent again
+        """
+        return self._stream is not None
+
+    def _set_stream(self, data: Iterable):
+        # Only the first row or column chunk is read here.  The async client feeds async iterables through a bridge
+        # that must not be advanced on the event loop thread, so sampling for the block size waits for next_block
+        stream = iter(data)
+        first = next(stream, _EMPTY)
+        if first is _EMPTY:
+            return
+        self.column_count = len(first)
+        if self.column_count != len(self.column_names):
+            raise ProgrammingError("Insert data column count does not match column names")
+        self._stream = chain((first,), stream)
+        self._data = self._stream
+        self.row_count = -1
+
     def _calc_block_size(self) -> int:
         assert self._data is not None
         if self.req_block_size:
@@ -125,22 +157,86 @@ class InsertContext(BaseQueryContext):
         shift_size = 21 - int(log(row_size, 2))
         return 1 if shift_size < 0 else 1 << (21 - int(log(row_size, 2)))
 
+    def _sample_block_size(self, columns: Sequence[Sequence[Any]]) -> int:
+        if self.req_block_size:
+            return self.req_block_size
+        row_count = len(columns[0])
+        sample_freq = max(1, row_count // STREAM_SAMPLE_ROWS)
+        row_size = 0
+        for d_type, col_data in zip(self.column_types, columns):
+            if d_type.byte_size:
+                row_size += d_type.byte_size
+            else:
+                row_size += d_type.data_size([col_data[j] for j in range(0, row_count, sample_freq)])
+        shift_size = 21 - int(log(max(row_size, 1), 2))
+        return 1 if shift_size < 0 else 1 << shift_size
+
+    def _make_block(self, row_count: int, data: Sequence[Sequence[Any]]) -> InsertBlock:
+        if self.current_block == 0:
+            cols = f" ({', '.join([quote_identifier(x) for x in self.column_names])})"
+            prefix = f"INSERT INTO {self.table}{cols} FORMAT Native\n".encode()
+        else:
+            prefix = b""
+        self.current_block += 1
+        return InsertBlock(prefix, self.column_count, row_count, self.column_names, self.column_types, data)
+
     def next_block(self) -> Generator[InsertBlock, None, None]:
+        if self._stream is not None:
+            if self.column_oriented:
+                yield from self._column_stream_blocks(self._stream)
+            else:
+                yield from self._row_stream_blocks(self._stream)
+            return
         while True:
             block_end = min(self.current_row + self.block_row_count, self.row_count)
             row_count = block_end - self.current_row
             if row_count <= 0:
                 return
-            if self.current_block == 0:
-                cols = f" ({', '.join([quote_identifier(x) for x in self.column_names])})"
-                prefix = f"INSERT INTO {self.table}{cols} FORMAT Native\n".encode()
-            else:
-                prefix = b""
-            self.current_block += 1
-            data = self._next_block_data(self.current_row, block_end)
-            yield InsertBlock(prefix, self.column_count, row_count, self.column_names, self.column_types, data)
+            block = self._make_block(row_count, self._next_block_data(self.current_row, block_end))
+            yield block
             self.current_row = block_end
 
+    def _row_stream_blocks(self, stream: Iterator) -> Generator[InsertBlock, None, None]:
+        rows = list(islice(stream, STREAM_SAMPLE_ROWS))
+        self.block_row_count = self._sample_block_size(data_conv.pivot(rows, 0, len(rows)))
+        while rows:
+            if len(rows) < self.block_row_count:
+                rows.extend(islice(stream, self.block_row_count - len(rows)))
+            self.current_row += len(rows)
+            yield self._make_block(len(rows), data_conv.pivot(rows, 0, len(rows)))
+            rows = list(islice(stream, self.block_row_count))
+
+    def _column_stream_blocks(self, stream: Iterator) -> Generator[InsertBlock, None, None]:
+        # Chunks of at least one block are sent as they are.  Smaller chunks are combined until they fill a block
+        buffered: list[list] = [[] for _ in range(self.column_count)]
+        buffered_rows = 0
+        for chunk in stream:
+            if len(chunk) != self.column_count:
+                raise ProgrammingError("Insert data column count does not match column names")
+            chunk_rows = len(chunk[0])
+            if chunk_rows and self.current_block == 0 and buffered_rows == 0:
+                self.block_row_count = self._sample_block_size(chunk)
+            if chunk_rows >= self.block_row_count:
+                if buffered_rows:
+                    self.current_row += buffered_rows
+                    yield self._make_block(buffered_rows, buffered)
+                    buffered = [[] for _ in range(self.column_count)]
+                    buffered_rows = 0
+                self.current_row += chunk_rows
+                yield self._make_block(chunk_rows, chunk)
+                continue
+            for column, chunk_column in zip(buffered, chunk):
+                column.extend(chunk_column)
+            buffered_rows += chunk_rows
+            if buffered_rows >= self.block_row_count:
+                self.current_row += buffered_rows
+                yield self._make_block(buffered_rows, buffered)
+                buffered = [[] for _ in range(self.column_count)]
+                buffered_rows = 0
+        if buffered_rows:
+            self.current_row += buffered_rows
+            yield self._make_block(buffered_rows, buffered)
+
     def _column_block_data(self, block_start, block_end):
         if block_start == 0 and self.row_count <= block_end:
             return self._block_columns  # Optimization if we don't need to break up the block
@@ -153,6 +249,10 @@ class InsertContext(BaseQueryContext):
         data = []
         for df_col_name, col_name, ch_type in zip(df.columns, self.column_names, self.column_types):
             df_col = df[df_col_name]
+            if ch_type.low_card and isinstance(df_col.dtype, options.pd.CategoricalDtype):
+                # The categories and codes are written directly as the LowCardinality dictionary and keys
+                data.append(df_col.array)
+                continue
             d_type_kind = df_col.dtype.kind
             try:
                 np_type = ch_type.np_type
@@ -227,3 +327,84 @@ class InsertContext(BaseQueryContext):
 
     def data_error(self, error_message: str) -> DataError:
         return DataError(f"Failed to write column '{self.column_name}': {error_message}")
+
+
+def insert_row_count(data: Any, column_oriented: bool = False) -> int:
+    """
+    Number of rows in insert data of a form accepted by slice_insert_data
+    """
+    if column_oriented and not _is_frame_or_array(data):
+        return len(data[0]) if len(data) else 0
+    return len(data)
+
+
+def _is_frame_or_array(data: Any) -> bool:
+    return (options.pd is not None and isinstance(data, options.pd.DataFrame)) or (
+        options.np is not None and isinstance(data, options.np.ndarray)
+    )
+
+
+def slice_insert_data(
+    data: Any, slices: int, column_names: Sequence[str], column_oriented: bool = False, shard_by: str | None = None
+) -> list:
+    """
+    Split insert data into exactly `slices` parts that can be inserted independently.  Parts can be empty, so the
+    index of a part depends only on the data and the number of slices, including in another process
+    :param data: pandas DataFrame, NumPy array, or sequence of rows (of columns if column_oriented)
+    :param slices: Number of parts
+    :param column_names: Insert column names, used to find the shard_by column in data without column labels
+    :param column_oriented: If true the data is already "pivoted" in column form
+    :param shard_by: Optional column name.  If set, rows are assigned to parts by the pandas hash of this column,
+      which is the same for every form of data and every process, so that rows with equal values are in the same
+      part.  Otherwise the parts are contiguous row ranges
+    :return: List of parts in the same form as data
+    """
+    if slices < 1:
+        raise ProgrammingError("Parallel insert slices must be positive")
+    if data is None or not hasattr(data, "__len__"):
+        raise ProgrammingError("Parallel inserts require a DataFrame, NumPy array, or sequence of rows or columns")
+    is_df = options.pd is not None and isinstance(data, options.pd.DataFrame)
+    is_np = options.np is not None and isinstance(data, options.np.ndarray)
+    by_column = column_oriented and not is_df and not is_np
+    row_count = insert_row_count(data, column_oriented)
+    if shard_by is None:
+        bounds = [row_count * ix // slices for ix in range(slices + 1)]
+        ranges = list(zip(bounds, bounds[1:]))
+        if is_df:
+            return [data.iloc[start:end] for start, end in ranges]
+        if by_column:
+            return [[column[start:end] for column in data] for start, end in ranges]
+        return [data[start:end] for start, end in ranges]
+    pd = options.check_pandas()
+    np = options.np
+    if is_df:
+        if shard_by not in data.columns:
+            raise ProgrammingError(f"Shard column {shard_by} is not in the DataFrame")
+        keys = data[shard_by]
+    elif is_np and data.dtype.names is not None:
+        if shard_by not in data.dtype.names:
+            raise ProgrammingError(f"Shard column {shard_by} is not in the NumPy array")
+        keys = data[shard_by]
+    else:
+        if shard_by not in column_names:
+            raise ProgrammingError(f"Shard column {shard_by} is not an insert column")
+        key_ix = list(column_names).index(shard_by)
+        if by_column:
+            keys = data[key_ix]
+        elif is_np:
+            keys = data[:, key_ix]
+        else:
+            keys = list(map(itemgetter(key_ix), data))
+    if not isinstance(keys, pd.Series):
+        keys = pd.Series(keys, dtype=object if len(keys) == 0 else None)
+    buckets = (pd.util.hash_pandas_object(keys, index=False).to_numpy() % slices).astype(np.intp)
+    # A stable sort keeps the rows of each part in their original order
+    order = np.argsort(buckets, kind="stable")
+    parts = np.split(order, np.searchsorted(buckets[order], np.arange(1, slices)))
+    if is_df:
+        return [data.iloc[part] for part in parts]
+    if is_np:
+        return [data[part] for part in parts]
+    if by_column:
+        return [[[column[row] for row in part.tolist()] for column in data] for part in parts]
+    return [[data[row] for row in part.tolist()] for part in parts]
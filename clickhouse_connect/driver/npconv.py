@@ -1,9 +1,16 @@
+from clickhouse_connect import common
 from clickhouse_connect.driver import options
+from clickhouse_connect.driver.buffer import ResponseBuffer
 from clickhouse_connect.driver.types import ByteSource
 
 
 def read_numpy_array(source: ByteSource, np_type: str, num_rows: int):
     np = options.np
     dtype = np.dtype(np_type)
-    buffer = source.read_bytes(dtype.itemsize * num_rows)
+    sz = dtype.itemsize * num_rows
+    if isinstance(source, ResponseBuffer) and sz and source.buf_loc + sz <= source.buf_sz and common.get_setting("numpy_zero_copy"):
+        offset = source.buf_loc
+        source.buf_loc += sz
+        return np.frombuffer(source.buffer, dtype, num_rows, offset)
+    buffer = source.read_bytes(sz)
     return np.frombuffer(buffer, dtype, num_rows)
@@ -41,7 +41,14 @@ class NumpyResult(Closable):
 
         d_types = self.np_types
         first_type = d_types[0]
-        if first_type != options.np.object_ and all(options.np.dtype(np_type) == first_type for np_type in d_types):
+        if len(d_types) == 1 and options.np.dtype(first_type).shape:
+            # A single column of fixed length vectors is returned as the 2-D array it was read into
+            self.np_types = options.np.dtype(first_type).base
+
+            def numpy_blocks():
+                for block in block_gen:
+                    yield block[0]
+        elif first_type != options.np.object_ and all(options.np.dtype(np_type) == first_type for np_type in d_types):
             self.np_types = first_type
 
             def numpy_blocks():
@@ -68,7 +75,7 @@ class NumpyResult(Closable):
 
         def pd_blocks():
             for block in block_gen:
-                yield options.pd.DataFrame(dict(zip(self.column_names, block)))
+                yield options.pd.DataFrame(dict(zip(self.column_names, (_df_column(data) for data in block))))
 
         self._block_gen = None
         return pd_blocks()
@@ -103,8 +110,12 @@ class NumpyResult(Closable):
         chains = [chain(b) for b in zip(*bg)]
         new_df_series = []
         for c in chains:
-            series = [options.pd.Series(piece) for piece in c if len(piece) > 0]
-            if len(series) > 0:
+            series = [options.pd.Series(_df_column(piece)) for piece in c if len(piece) > 0]
+            if len(series) > 1 and all(isinstance(s.dtype, options.pd.CategoricalDtype) for s in series):
+                # Each block has its own LowCardinality dictionary, so the categories are merged rather than
+                # letting concat fall back to object columns
+                new_df_series.append(options.pd.Series(options.pd.api.types.union_categoricals(series, ignore_order=True)))
+            elif len(series) > 0:
                 new_df_series.append(options.pd.concat(series, ignore_index=True))
         self._df_result = options.pd.DataFrame(dict(zip(self.column_names, new_df_series)))
         self.close()
@@ -137,3 +148,10 @@ class NumpyResult(Closable):
         if self.source:
             self.source.close()
             self.source = None
+
+
+def _df_column(data):
+    # 2-D arrays of fixed length vectors become one column of row views, without copying the vector data
+    if getattr(data, "ndim", 1) > 1:
+        return list(data)
+    return data
@@ -1,9 +1,9 @@
 import logging
 import re
-from collections.abc import Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from datetime import timezone, tzinfo
-from io import IOBase
-from typing import TYPE_CHECKING, Any, BinaryIO, Literal
+from io import BytesIO, IOBase
+from typing import TYPE_CHECKING, Any, Literal
 from zoneinfo import ZoneInfoNotFoundError
 
 from clickhouse_connect.driver import tzutil
@@ -20,6 +20,7 @@ from clickhouse_connect.driver.context import BaseQueryContext
 from clickhouse_connect.driver.exceptions import ProgrammingError, StreamClosedError
 from clickhouse_connect.driver.external import ExternalData
 from clickhouse_connect.driver.options import check_arrow
+from clickhouse_connect.driver.streaming import PrefetchSource, StreamingFileAdapter
 from clickhouse_connect.driver.types import Closable, Matrix
 
 if TYPE_CHECKING:
@@ -34,6 +35,10 @@ _VALID_TZ_MODES = {"naive_utc", "aware", "schema"}
 
 _VALID_TZ_SOURCES = {"auto", "server", "local"}
 
+# Minimum size of each body chunk sent by a streaming Arrow insert.  Serialized record batches are accumulated
+# until this size is reached to avoid sending a large number of tiny HTTP chunks
+ARROW_STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 commands = "CREATE|ALTER|SYSTEM|GRANT|REVOKE|CHECK|DETACH|ATTACH|DROP|DELETE|KILL|OPTIMIZE|SET|RENAME|TRUNCATE|USE|UPDATE"
 
@@ -468,24 +473,111 @@ def remove_sql_comments(sql: str) -> str:
     return comment_re.sub(replacer, sql)
 
 
+def split_queries(query: str, split_by: str | Sequence[str], splits: int) -> list[str]:
+    """
+    Split a SELECT query into disjoint queries that together return its rows, by wrapping it in a filtered
+    subquery for each split.  ClickHouse pushes the filters down into the subquery where it can
+    :param query: SELECT query, which should not include a FORMAT clause
+    :param split_by: Either an expression over the query result columns, in which case the rows are split into
+      `splits` groups by the hash of the expression, or a sequence of disjoint filter conditions, one for each split,
+      such as key ranges or partition ids
+    :param splits: Number of splits when split_by is an expression
+    :return: Query for each split, in order
+    """
+    query = query.strip().rstrip(";")
+    if isinstance(split_by, str):
+        if splits < 1:
+            raise ProgrammingError("Parallel queries require at least one split")
+        # modulo rather than %, which client side parameter binding would read as a placeholder
+        conditions = [f"modulo(cityHash64({split_by}), {splits}) = {ix}" for ix in range(splits)]
+    else:
+        conditions = list(split_by)
+        if not conditions:
+            raise ProgrammingError("Parallel queries require at least one split condition")
+    # The line breaks keep a trailing line comment in the query from swallowing the closing parenthesis
+    return [f"SELECT * FROM (\n{query}\n) WHERE {condition}" for condition in conditions]
+
+
 def to_arrow(content: bytes):
     pyarrow = check_arrow()
     reader = pyarrow.ipc.RecordBatchFileReader(content)
     return reader.read_all()
 
 
+def read_arrow_stream(stream: IOBase, wrap_source: Callable[[Any], Any] | None = None):
+    """
+    Assemble a PyArrow Table from an ArrowStream response batch by batch.  The response is read ahead on a background
+    thread into a bounded queue, so only the decoded record batches and a few raw chunks are held in memory
+    :param stream: Response stream
+    :param wrap_source: Optional wrapper applied to the chunk source before parsing, such as a result cache recorder
+    """
+    source = PrefetchSource(stream)
+    try:
+        return read_arrow_source(wrap_source(source) if wrap_source else source)
+    finally:
+        source.close()
+
+
+def read_arrow_source(source) -> Any:
+    """
+    Assemble a PyArrow Table from a source whose gen yields the chunks of an ArrowStream response
+    """
+    pyarrow = check_arrow()
+    table = pyarrow.ipc.open_stream(StreamingFileAdapter(source)).read_all()
+    # The reader stops at the end of stream marker, so finish the source in case it is recording the response
+    for _ in source.gen:
+        pass
+    return table
+
+
 def to_arrow_batches(buffer: IOBase) -> StreamContext:
     pyarrow = check_arrow()
     reader = pyarrow.ipc.open_stream(buffer)
     return StreamContext(buffer, reader)
 
 
-def arrow_buffer(table, compression: str | None = None) -> tuple[Sequence[str], bytes | BinaryIO]:
+def arrow_stream(source, compression: str | None = None) -> tuple[Sequence[str], Generator[bytes, None, None]]:
+    """
+    Serialize a PyArrow Table, RecordBatchReader, RecordBatch, or iterable of RecordBatches as an ArrowStream
+    insert body.  Record batches are serialized as the returned generator is consumed, so the complete IPC stream
+    is never held in memory
+    """
     pyarrow = check_arrow()
+    if isinstance(source, pyarrow.Table):
+        schema = source.schema
+        batches: Iterable = source.to_batches()
+    elif isinstance(source, pyarrow.RecordBatch):
+        schema = source.schema
+        batches = (source,)
+    elif isinstance(source, pyarrow.RecordBatchReader):
+        schema = source.schema
+        batches = source
+    else:
+        batch_iter = iter(source)
+        first = next(batch_iter, None)
+        if first is None:
+            raise ProgrammingError("No record batches specified for Arrow insert")
+        schema = first.schema
+
+        def chain_batches():
+            yield first
+            yield from batch_iter
+
+        batches = chain_batches()
     write_options = None
     if compression in ("zstd", "lz4"):
         write_options = pyarrow.ipc.IpcWriteOptions(compression=pyarrow.Codec(compression=compression))
-    sink = pyarrow.BufferOutputStream()
-    with pyarrow.RecordBatchFileWriter(sink, table.schema, options=write_options) as writer:
-        writer.write(table)
-    return table.schema.names, sink.getvalue()
+
+    def chunk_gen():
+        sink = BytesIO()
+        with pyarrow.ipc.new_stream(sink, schema, options=write_options) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                if sink.tell() >= ARROW_STREAM_CHUNK_SIZE:
+                    yield sink.getvalue()
+                    sink.seek(0)
+                    sink.truncate()
+        # Closing the writer appends the end of stream marker
+        yield sink.getvalue()
+
+    return schema.names, chunk_gen()
@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Mapping
+from typing import Any, NamedTuple
+
+__all__ = ["ResultCache", "CachedResult", "result_key"]
+
+
+def result_key(
+    fmt: str,
+    database: str | None,
+    final_query: str | bytes,
+    bind_params: Mapping[str, str],
+    settings: Mapping[str, Any],
+    protocol_version: int | None = None,
+) -> tuple:
+    """
+    Cache key for a query response.  Every value that changes the bytes ClickHouse returns for the query is part
+    of the key, so two calls share an entry only if the server would send them identical responses
+    """
+    return fmt, database, final_query, tuple(sorted(bind_params.items())), tuple(sorted(settings.items())), protocol_version
+
+
+class CachedResult(NamedTuple):
+    chunks: tuple[bytes, ...]
+    size: int
+    response_tz_name: str | None
+    summary: dict[str, Any]
+    expires: float
+
+    def replay(self) -> "CachedSource":
+        return CachedSource(self.chunks)
+
+
+class CachedSource:
+    """
+    Replays cached response chunks to a ResponseBuffer or StreamingFileAdapter in place of a network response
+    """
+
+    def __init__(self, chunks: tuple[bytes, ...]):
+        self.gen = iter(chunks)
+
+    def close(self):
+        pass
+
+
+class RecordingSource:
+    """
+    Wraps a response source and keeps a reference to each chunk it yields.  The chunks are passed to on_complete
+    only if the source is read to the end without error and the response fits within max_size bytes
+    """
+
+    def __init__(self, source: Any, max_size: int, on_complete: Callable[[tuple[bytes, ...], int], None]):
+        self.source = source
+        self.exception_tag = getattr(source, "exception_tag", None)
+        self.gen = self._record(source.gen, max_size, on_complete)
+
+    @staticmethod
+    def _record(gen, max_size: int, on_complete) -> Generator[bytes, None, None]:
+        chunks: list[bytes] | None = []
+        size = 0
+        for chunk in gen:
+            if chunks is not None:
+                size += len(chunk)
+                if size > max_size:
+                    chunks = None
+                else:
+                    chunks.append(chunk)
+            yield chunk
+        if chunks is not None:
+            on_complete(tuple(chunks), size)
+
+    def close(self):
+        self.source.close()
+
+
+class ResultCache:
+    """
+    Thread safe cache of raw query responses, bounded by the total size of the cached responses in bytes.  Entries
+    expire ttl seconds after they are stored, and least recently used entries are evicted to stay within max_bytes.
+    Hit and miss counts are kept for tuning the cache size
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._entries: OrderedDict[tuple, CachedResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> CachedResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        key: tuple,
+        chunks: tuple[bytes, ...],
+        size: int,
+        response_tz_name: str | None = None,
+        summary: dict[str, Any] | None = None,
+    ):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CachedResult(chunks, size, response_tz_name, summary or {}, time.monotonic() + self.ttl)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def recorder(
+        self, key: tuple, source: Any, response_tz_name: str | None = None, summary: dict[str, Any] | None = None
+    ) -> RecordingSource:
+        """
+        Wrap a response source so that the response is cached once it has been completely read
+        """
+
+        def store(chunks: tuple[bytes, ...], size: int):
+            self.put(key, chunks, size, response_tz_name, summary)
+
+        return RecordingSource(source, self.max_bytes, store)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self.size}
+
+    def _remove(self, key: tuple):
+        self.size -= self._entries.pop(key).size
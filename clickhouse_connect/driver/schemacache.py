@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from clickhouse_connect.driver.binding import quote_identifier
+from clickhouse_connect.driver.models import ColumnDef
+
+__all__ = ["SchemaCache", "SCHEMA_MISMATCH_CODES", "schema_key"]
+
+# ClickHouse error codes that indicate an insert was built against a table definition that no longer matches the
+# server, so any cached DESCRIBE TABLE result for that table should be dropped
+SCHEMA_MISMATCH_CODES = frozenset(
+    {
+        8,  # THERE_IS_NO_COLUMN
+        10,  # NOT_FOUND_COLUMN_IN_BLOCK
+        16,  # NO_SUCH_COLUMN_IN_TABLE
+        20,  # NUMBER_OF_COLUMNS_DOESNT_MATCH
+        47,  # UNKNOWN_IDENTIFIER
+        53,  # TYPE_MISMATCH
+        60,  # UNKNOWN_TABLE
+        81,  # UNKNOWN_DATABASE
+    }
+)
+
+
+def schema_key(full_table: str, default_database: str | None) -> str:
+    """
+    Cache key for a (possibly unqualified) insert table name.  Unqualified names are qualified with the client
+    default database so that changing the client database does not return the schema of another table
+    """
+    if "." in full_table or not default_database:
+        return full_table
+    return f"{quote_identifier(default_database)}.{full_table}"
+
+
+class SchemaCache:
+    """
+    Thread safe LRU cache of DESCRIBE TABLE results used to build insert contexts.  Entries expire ttl seconds after
+    they are stored, and the least recently used entry is evicted once max_size entries are cached
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, tuple[ColumnDef, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[ColumnDef, ...] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, column_defs: Sequence[ColumnDef]):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, tuple(column_defs))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str | None = None):
+        """
+        Drop the cached schema for key, or every cached schema if key is None
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
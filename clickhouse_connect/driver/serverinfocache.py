@@ -0,0 +1,164 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+
+from clickhouse_connect import common
+from clickhouse_connect.driver._backend.models import ServerProbe
+from clickhouse_connect.driver.models import SettingDef
+
+__all__ = ["ServerInfoCache", "server_info_key", "shared_server_info_cache"]
+
+logger = logging.getLogger(__name__)
+
+
+def server_info_key(url: str, username: str | None, credential: str | None = None, settings: dict[str, Any] | None = None) -> str:
+    """
+    Cache key for the server behind url as seen by username.  Settings definitions depend on the user's profile and on
+    the settings and roles a client starts with, so each combination is cached separately.  The password or access
+    token is part of a hash rather than stored, so that a client only reuses an entry created with its credentials
+    """
+    digest = hashlib.sha256(f"{username or ''}@{url}\0{credential or ''}\0".encode())
+    digest.update(json.dumps(settings or {}, sort_keys=True, default=str).encode())
+    return f"{username or ''}@{url}#{digest.hexdigest()}"
+
+
+class ServerInfoCache:
+    """
+    Thread safe cache of the server version, timezone, settings definitions and protocol version that clients query
+    when they are created, shared by every client in the process and optionally persisted to a JSON file so that new
+    processes skip the initialization queries as well.
+
+    Entries are used for ttl seconds.  Once an entry expires, the next client created for that server queries it
+    again and refreshes the entry, while clients created concurrently keep using the expired entry until the refresh
+    completes
+    """
+
+    def __init__(self, ttl: float, path: str | None = None):
+        self.ttl = ttl
+        self.path = path
+        self._entries: dict[str, tuple[float, ServerProbe]] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._mtime: int | None = None
+
+    def get(self, key: str) -> ServerProbe | None:
+        """
+        Return the cached server info for key.  None means the caller must query the server and then call put, or
+        release if the queries fail
+        """
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] < self.ttl:
+                return entry[1]
+            if key in self._refreshing:
+                return entry[1]
+            self._refreshing.add(key)
+            return None
+
+    def put(self, key: str, probe: ServerProbe):
+        with self._lock:
+            self._load()
+            self._entries[key] = (time.time(), probe)
+            self._refreshing.discard(key)
+            self._save()
+
+    def release(self, key: str):
+        """
+        Abandon a refresh started by get, so that the next client created for key refreshes the entry instead
+        """
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, key: str | None = None):
+        """
+        Drop the cached server info for key, or for every server if key is None
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._load()
+                self._entries.pop(key, None)
+            self._save()
+
+    def _load(self):
+        # The file is read again whenever another process has replaced it, keeping the newest entry for each server
+        if self.path is None:
+            return
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._mtime:
+                return
+            with open(self.path, encoding="utf-8") as cache_file:
+                stored = json.load(cache_file)
+            self._mtime = mtime
+            for key, entry in stored.items():
+                current = self._entries.get(key)
+                if current is not None and current[0] >= entry["stored"]:
+                    continue
+                settings = {name: SettingDef(name, value, readonly) for name, value, readonly in entry["settings"]}
+                probe = ServerProbe(entry["version"], entry["timezone"], settings, entry["protocol_version"])
+                self._entries[key] = (entry["stored"], probe)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as ex:
+            logger.warning("Ignoring unreadable server info cache file %s: %s", self.path, ex)
+
+    def _save(self):
+        if self.path is None:
+            return
+        stored = {
+            key: {
+                "stored": stored_at,
+                "version": probe.version,
+                "timezone": probe.timezone,
+                "protocol_version": probe.protocol_version,
+                "settings": [(s.name, s.value, s.readonly) for s in probe.settings.values()],
+            }
+            for key, (stored_at, probe) in self._entries.items()
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        temp_path = None
+        try:
+            # Replace the file atomically so that concurrent processes never read a partially written cache
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".chc_server_info_")
+            with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                json.dump(stored, temp_file)
+            os.replace(temp_path, self.path)
+            self._mtime = os.stat(self.path).st_mtime_ns
+        except OSError as ex:
+            logger.warning("Unable to write server info cache file %s: %s", self.path, ex)
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_shared_cache: ServerInfoCache | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_server_info_cache() -> ServerInfoCache | None:
+    """
+    The process wide server info cache configured by the server_info_cache_ttl and server_info_cache_file common
+    settings, or None if the cache is disabled
+    """
+    global _shared_cache
+    ttl = common.get_setting("server_info_cache_ttl")
+    if ttl <= 0:
+        return None
+    path = common.get_setting("server_info_cache_file") or None
+    with _shared_lock:
+        if _shared_cache is None or _shared_cache.path != path:
+            _shared_cache = ServerInfoCache(ttl, path)
+        _shared_cache.ttl = ttl
+        return _shared_cache
@@ -283,6 +283,53 @@ class QueuedStreamSource(Closable):
         self.source.close()
 
 
+class PrefetchSource(Closable):
+    """Reads a blocking byte stream on a background thread, keeping a bounded number of chunks ahead of the
+    sync consumer so network reads and decompression overlap with parsing."""
+
+    READ_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, stream, maxsize: int = 10):
+        self.stream = stream
+        self.queue: AsyncSyncQueue[bytes | Exception] = AsyncSyncQueue(maxsize=maxsize)
+        self.gen = self._chunks()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self):
+        try:
+            while True:
+                chunk = self.stream.read(self.READ_BUFFER_SIZE)
+                if not chunk:
+                    break
+                self.queue.sync_q.put(chunk)
+            self.queue.sync_q.put(EOF_SENTINEL)
+        except RuntimeError:
+            # The queue was shut down because the consumer closed the source
+            pass
+        except Exception as e:
+            logger.error("Prefetch error while streaming response: %s", e, exc_info=True)
+            try:
+                self.queue.sync_q.put(e)
+            except RuntimeError:
+                pass
+        finally:
+            self.queue.shutdown()
+
+    def _chunks(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.queue.sync_q.get()
+            if chunk is EOF_SENTINEL:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    def close(self):
+        self.queue.shutdown()
+        self.stream.close()
+
+
 class StreamingFileAdapter:
     """File-like adapter for PyArrow streaming."""
 
@@ -336,9 +383,13 @@ class StreamingFileAdapter:
 class StreamingInsertSource:
     """Streaming source for async inserts (reverse bridge)"""
 
-    def __init__(self, transform, context, loop: asyncio.AbstractEventLoop, maxsize: int = 10):
+    def __init__(self, transform, context, loop: asyncio.AbstractEventLoop, maxsize: int = 10, chunks: Iterable[bytes] | None = None):
+        """
+        :param chunks: Optional pre-built body chunks to stream instead of the blocks built by transform from context
+        """
         self.transform = transform
         self.context = context
+        self.chunks = chunks
         self.loop = loop
         self.queue: AsyncSyncQueue[bytes | bytearray | Exception] = AsyncSyncQueue(maxsize=maxsize)
         self._producer_future = None
@@ -351,7 +402,8 @@ class StreamingInsertSource:
 
         def producer():
             try:
-                for block in self.transform.build_insert(self.context):
+                blocks = self.chunks if self.chunks is not None else self.transform.build_insert(self.context)
+                for block in blocks:
                     self.queue.sync_q.put(block)
 
                 self.queue.sync_q.put(EOF_SENTINEL)
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from clickhouse_connect.datatypes.registry import get_from_name
 from clickhouse_connect.driver.query import QueryResult
 
@@ -19,6 +21,22 @@ class QuerySummary:
     def query_id(self) -> str:
         return self.summary.get("query_id", "")
 
+    @classmethod
+    def combine(cls, summaries: "Sequence[QuerySummary]") -> "QuerySummary":
+        """
+        Summary of several queries run as one operation, such as the slices of a parallel insert.  Numeric values
+        are added and other values are taken from the first summary
+        """
+        combined: dict[str, str] = {}
+        for summary in summaries:
+            for key, value in summary.summary.items():
+                current = combined.get(key)
+                if current is None:
+                    combined[key] = value
+                elif isinstance(value, str) and value.isnumeric() and current.isnumeric():
+                    combined[key] = str(int(current) + int(value))
+        return cls(combined)
+
     def as_query_result(self) -> QueryResult:
         data: list[int | str] = []
         column_names = []
@@ -1,11 +1,22 @@
 import asyncio
-from collections.abc import Sequence
-from typing import Any
+import glob
+import os
+from collections.abc import Generator, Sequence
+from typing import TYPE_CHECKING, Any
 
 from clickhouse_connect.driver import Client
 from clickhouse_connect.driver.binding import quote_identifier
+from clickhouse_connect.driver.compression import Compressor, get_compressor, null_compressor
+from clickhouse_connect.driver.exceptions import ProgrammingError
+from clickhouse_connect.driver.streaming import StreamingInsertSource
 from clickhouse_connect.driver.summary import QuerySummary
 
+if TYPE_CHECKING:
+    from clickhouse_connect.driver.asyncclient import AsyncClient
+
+# Size of the chunks read from a file by insert_file_async.  At most ten chunks per file are queued for the request
+FILE_CHUNK_SIZE = 1024 * 1024
+
 
 def insert_file(
     client: Client,
@@ -17,17 +28,7 @@ def insert_file(
     settings: dict[str, Any] | None = None,
     compression: str | None = None,
 ) -> QuerySummary:
-    if not database and table[0] not in ("`", "'") and table.find(".") > 0:
-        full_table = table
-    elif database:
-        full_table = f"{quote_identifier(database)}.{quote_identifier(table)}"
-    else:
-        full_table = quote_identifier(table)
-    if not fmt:
-        fmt = "CSV" if column_names else "CSVWithNames"
-    if compression is None:
-        if file_path.endswith(".gzip") or file_path.endswith(".gz"):
-            compression = "gzip"
+    full_table, fmt, compression = _file_insert_args(table, file_path, fmt, column_names, database, compression)
     with open(file_path, "rb") as file:
         return client.raw_insert(
             full_table,
@@ -40,7 +41,7 @@ def insert_file(
 
 
 async def insert_file_async(
-    client,
+    client: "AsyncClient",
     table: str,
     file_path: str,
     fmt: str | None = None,
@@ -49,7 +50,77 @@ async def insert_file_async(
     settings: dict[str, Any] | None = None,
     compression: str | None = None,
 ) -> QuerySummary:
+    """
+    Insert a local file with an AsyncClient.  The file is read in chunks on an executor thread and streamed as the
+    request body, so only a few chunks are held in memory.  A file that is not already compressed is compressed as it
+    is read with the client write compression, if any
+    """
+    full_table, fmt, compression = _file_insert_args(table, file_path, fmt, column_names, database, compression)
+    compressor = null_compressor
+    if compression is None and client.write_compression:
+        compression = client.write_compression
+        compressor = get_compressor(compression)
+    source = StreamingInsertSource(None, None, asyncio.get_running_loop(), chunks=_file_chunks(file_path, compressor))
+    source.start_producer()
+    try:
+        return await client.raw_insert(
+            full_table,
+            column_names=column_names,
+            insert_block=source.async_generator(),
+            fmt=fmt,
+            settings=settings,
+            compression=compression,
+        )
+    finally:
+        await source.close()
+
+
+async def insert_files_async(
+    client: "AsyncClient",
+    table: str,
+    file_paths: str | Sequence[str],
+    fmt: str | None = None,
+    column_names: Sequence[str] | None = None,
+    database: str | None = None,
+    settings: dict[str, Any] | None = None,
+    compression: str | None = None,
+    max_concurrency: int = 4,
+) -> list[QuerySummary]:
+    """
+    Insert many local files with an AsyncClient, each file streamed as its own insert by insert_file_async.  The
+    client must not use a session ID, since ClickHouse rejects concurrent inserts in the same session
+    :param file_paths: A directory (all files in it), a glob pattern, or a sequence of file paths
+    :param max_concurrency: Maximum number of files inserted at the same time
+    :return: The QuerySummary of each file insert, in file order.  If any insert fails the remaining inserts are
+      cancelled, but files that were already inserted are not rolled back
+    """
+    if isinstance(file_paths, str):
+        if os.path.isdir(file_paths):
+            paths = sorted(entry.path for entry in os.scandir(file_paths) if entry.is_file())
+        else:
+            paths = sorted(glob.glob(file_paths))
+    else:
+        paths = list(file_paths)
+    if not paths:
+        raise ProgrammingError(f"No files found to insert for {file_paths}")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def insert_one(file_path: str) -> QuerySummary:
+        async with semaphore:
+            return await insert_file_async(client, table, file_path, fmt, column_names, database, settings, compression)
 
+    tasks = [asyncio.ensure_future(insert_one(file_path)) for file_path in paths]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _file_insert_args(
+    table: str, file_path: str, fmt: str | None, column_names: Sequence[str] | None, database: str | None, compression: str | None
+) -> tuple[str, str, str | None]:
     if not database and table[0] not in ("`", "'") and table.find(".") > 0:
         full_table = table
     elif database:
@@ -61,18 +132,16 @@ async def insert_file_async(
     if compression is None:
         if file_path.endswith(".gzip") or file_path.endswith(".gz"):
             compression = "gzip"
+    return full_table, fmt, compression
 
-    def read_file():
-        with open(file_path, "rb") as file:
-            return file.read()
 
-    file_data = await asyncio.to_thread(read_file)
-
-    return await client.raw_insert(
-        full_table,
-        column_names=column_names,
-        insert_block=file_data,
-        fmt=fmt,
-        settings=settings,
-        compression=compression,
-    )
+def _file_chunks(file_path: str, compressor: Compressor) -> Generator[bytes, None, None]:
+    with open(file_path, "rb") as file:
+        while True:
+            chunk = file.read(FILE_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield compressor.compress_block(chunk)
+    footer = compressor.flush()
+    if footer:
+        yield footer
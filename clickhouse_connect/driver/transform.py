@@ -1,8 +1,15 @@
+import copy
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from clickhouse_connect import common
 from clickhouse_connect.datatypes import registry
-from clickhouse_connect.driver.common import write_leb128
+from clickhouse_connect.datatypes.base import ColumnReader
+from clickhouse_connect.driver import options
+from clickhouse_connect.driver.common import worker_pool, write_leb128
 from clickhouse_connect.driver.compression import get_compressor
+from clickhouse_connect.driver.ctypes import RespBuffCls
 from clickhouse_connect.driver.exceptions import (
     GENERIC_CLICKHOUSE_ERROR,
     OperationalError,
@@ -10,24 +17,53 @@ from clickhouse_connect.driver.exceptions import (
     StreamFailureError,
     scrub_error_details,
 )
-from clickhouse_connect.driver.insert import InsertContext
+from clickhouse_connect.driver.insert import InsertBlock, InsertContext
 from clickhouse_connect.driver.npquery import NumpyResult
 from clickhouse_connect.driver.query import QueryContext, QueryResult
 from clickhouse_connect.driver.types import ByteSource
 
 _EMPTY_CTX = QueryContext()
+# Blocks smaller than this are always decoded on the calling thread, since the thread handoff costs more than it saves
+PARALLEL_DECODE_MIN_ROWS = 1024
 
 logger = logging.getLogger(__name__)
 
+class _ColumnSource:
+    """Transport style source that feeds the raw bytes of a single column to a response buffer"""
+
+    __slots__ = ("gen",)
+
+    def __init__(self, data: bytes):
+        self.gen = iter((data,))
+
+    def close(self):
+        pass
+
+
+def _decode_raw_column(reader: ColumnReader, raw: bytes, num_rows: int, ctx: QueryContext):
+    return reader(RespBuffCls(_ColumnSource(raw)), num_rows, ctx)
+
+
+def _column_dtype(column):
+    if not hasattr(column, "dtype"):
+        return "O"
+    if getattr(column, "ndim", 1) > 1:
+        # Columns of fixed length vectors, such as QBit, are read as 2-D arrays with one row per value
+        return options.np.dtype((column.dtype, column.shape[1:]))
+    return column.dtype
+
 
 class NativeTransform:
     @staticmethod
     def parse_response(source: ByteSource, context: QueryContext = _EMPTY_CTX) -> NumpyResult | QueryResult:
         names = []
         col_types = []
+        # The decoder plan, compiled from the first block header with one pre-resolved reader per column
+        readers: list[ColumnReader] = []
         block_num = 0
         renamer = context.column_renamer
         show_clickhouse_errors = context.show_clickhouse_errors
+        decode_pool = worker_pool("decode_workers")
 
         def format_stream_error(error_msg: str) -> str:
             if show_clickhouse_errors is False:
@@ -64,6 +100,8 @@ class NativeTransform:
                         raise StreamFailureError(format_stream_error(error_msg)) from None
                     return None
                 num_rows = source.read_leb128()
+                pool = decode_pool if num_rows >= PARALLEL_DECODE_MIN_ROWS else None
+                pending = False
                 for col_num in range(num_cols):
                     orig_name = source.read_leb128_str()
                     type_name = source.read_leb128_str()
@@ -72,14 +110,29 @@ class NativeTransform:
                         names.append(disp_name)
                         col_type = registry.get_from_name(type_name)
                         col_types.append(col_type)
+                        context.start_column(orig_name)
+                        readers.append(col_type.column_reader(context))
                     else:
                         col_type = col_types[col_num]
+                    reader = readers[col_num]
                     if num_rows == 0:
                         result_block.append(tuple())
-                    else:
-                        context.start_column(orig_name)
-                        column = col_type.read_column(source, num_rows, context)
-                        result_block.append(column)
+                        continue
+                    if pool is not None:
+                        # Columns with a known extent are sliced out of the stream and decoded by the pool,
+                        # each with its own copy of the context, while this thread moves on to the next column
+                        raw_column = col_type.read_raw_column(source, num_rows)
+                        if raw_column is not None:
+                            col_ctx = copy.copy(context)
+                            col_ctx.start_column(orig_name)
+                            result_block.append(pool.submit(_decode_raw_column, reader, raw_column, num_rows, col_ctx))
+                            pending = True
+                            continue
+                    context.start_column(orig_name)
+                    column = reader(source, num_rows, context)
+                    result_block.append(column)
+                if pending:
+                    result_block = [col.result() if isinstance(col, Future) else col for col in result_block]
             except Exception as ex:
                 source.close()
                 if isinstance(ex, StreamCompleteException):
@@ -116,7 +169,7 @@ class NativeTransform:
                 yield next_block
 
         if context.use_numpy:
-            res_types = [col.dtype if hasattr(col, "dtype") else "O" for col in first_block]
+            res_types = [_column_dtype(col) for col in first_block]
             return NumpyResult(gen(), tuple(names), tuple(col_types), res_types, source)
         return QueryResult(None, gen(), tuple(names), tuple(col_types), context.column_oriented, source)
 
@@ -124,32 +177,22 @@ class NativeTransform:
     def build_insert(context: InsertContext):
         compression = context.compression if isinstance(context.compression, str) else None
         compressor = get_compressor(compression)
+        encode_pool = worker_pool("encode_workers")
+        if encode_pool is not None:
+            return _pipelined_insert(context, compression, encode_pool)
 
         def chunk_gen():
             for block in context.next_block():
-                output = bytearray()
-                output += block.prefix
-                write_leb128(block.column_count, output)
-                write_leb128(block.row_count, output)
-                for col_name, col_type, data in zip(block.column_names, block.column_types, block.column_data):
-                    col_enc = col_name.encode()
-                    write_leb128(len(col_enc), output)
-                    output += col_enc
-                    col_enc = col_type.insert_name.encode()
-                    write_leb128(len(col_enc), output)
-                    output += col_enc
-                    context.start_column(col_name)
-                    try:
-                        col_type.write_column(data, output, context)
-                    except Exception as ex:
-                        # This is hideous, but some low level serializations can fail while streaming
-                        # the insert if the user has included bad data in the column.  We need to ensure that the
-                        # insert fails (using garbage data) to avoid a partial insert, and use the context to
-                        # propagate the correct exception to the user
-                        logger.error("Error serializing column `%s` into data type `%s`", col_name, col_type.name, exc_info=True)
-                        context.insert_exception = ex
-                        yield b"INTERNAL EXCEPTION WHILE SERIALIZING"
-                        return
+                try:
+                    output = _serialize_block(block, context)
+                except Exception as ex:
+                    # This is hideous, but some low level serializations can fail while streaming
+                    # the insert if the user has included bad data in the column.  We need to ensure that the
+                    # insert fails (using garbage data) to avoid a partial insert, and use the context to
+                    # propagate the correct exception to the user
+                    context.insert_exception = ex
+                    yield b"INTERNAL EXCEPTION WHILE SERIALIZING"
+                    return
                 yield compressor.compress_block(output)
             footer = compressor.flush()
             if footer:
@@ -158,6 +201,73 @@ class NativeTransform:
         return chunk_gen()
 
 
+def _serialize_block(block: InsertBlock, context: InsertContext) -> bytearray:
+    output = bytearray()
+    output += block.prefix
+    write_leb128(block.column_count, output)
+    write_leb128(block.row_count, output)
+    for col_name, col_type, data in zip(block.column_names, block.column_types, block.column_data):
+        col_enc = col_name.encode()
+        write_leb128(len(col_enc), output)
+        output += col_enc
+        col_enc = col_type.insert_name.encode()
+        write_leb128(len(col_enc), output)
+        output += col_enc
+        context.start_column(col_name)
+        try:
+            col_type.write_column(data, output, context)
+        except Exception:
+            logger.error("Error serializing column `%s` into data type `%s`", col_name, col_type.name, exc_info=True)
+            raise
+    return output
+
+
+def _pipelined_insert(context: InsertContext, compression: str | None, pool: ThreadPoolExecutor):
+    """
+    Serialize insert blocks on the worker pool while the body generator yields the finished blocks in order.  Each
+    block is compressed by its worker unless the compression stream spans blocks (gzip), in which case it is
+    compressed here as it is yielded.  At most two blocks per worker are in flight, which bounds the memory used.
+    """
+    compressor = get_compressor(compression)
+    compress_in_worker = compressor.independent_blocks
+    max_pending = 2 * (common.get_setting("encode_workers") or 1)
+
+    def encode(block: InsertBlock, block_ctx: InsertContext) -> bytes | bytearray:
+        output = _serialize_block(block, block_ctx)
+        if compress_in_worker:
+            return get_compressor(compression).compress_block(output)
+        return output
+
+    def chunk_gen():
+        pending: deque[Future] = deque()
+        try:
+            blocks = context.next_block()
+            while True:
+                block = next(blocks, None)
+                if block is not None:
+                    pending.append(pool.submit(encode, block, copy.copy(context)))
+                    if len(pending) < max_pending:
+                        continue
+                if not pending:
+                    break
+                try:
+                    output = pending.popleft().result()
+                except Exception as ex:
+                    # See the serial chunk generator, the insert must fail with garbage data
+                    context.insert_exception = ex
+                    yield b"INTERNAL EXCEPTION WHILE SERIALIZING"
+                    return
+                yield output if compress_in_worker else compressor.compress_block(output)
+            footer = compressor.flush()
+            if footer:
+                yield footer
+        finally:
+            for future in pending:
+                future.cancel()
+
+    return chunk_gen()
+
+
 def extract_exception_with_tag(message: bytes, exception_tag: str) -> str | None:
     """Extract exception message from the new format with exception tag. Server v25.11+.
 
@@ -49,3 +49,23 @@ class ByteSource(Closable):
     @abstractmethod
     def read_byte(self) -> int:
         pass
+
+    def read_str_col_raw(self, num_rows: int) -> bytes:
+        """
+        Read a column of num_rows LEB128 length prefixed strings without decoding it
+        :param num_rows: Number of strings in the column
+        :return: The native bytes of the column, including the length prefixes
+        """
+        output = bytearray()
+        for _ in range(num_rows):
+            sz = self.read_leb128()
+            prefix = sz
+            while True:
+                b = prefix & 0x7F
+                prefix >>= 7
+                if prefix == 0:
+                    output.append(b)
+                    break
+                output.append(0x80 | b)
+            output += self.read_bytes(sz)
+        return bytes(output)
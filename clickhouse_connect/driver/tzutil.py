@@ -1,5 +1,6 @@
 import os
 import re
+import time
 import zoneinfo
 from datetime import datetime, timedelta, timezone, tzinfo
 
@@ -132,6 +133,11 @@ def is_utc_timezone(tz: tzinfo | str | None) -> bool:
     return tz.tzname(None) in UTC_EQUIVALENTS
 
 
+def local_is_utc() -> bool:
+    """Check if the process timezone used for naive datetime.timestamp() calls never has a UTC offset."""
+    return time.timezone == 0 and time.altzone == 0 and not time.daylight
+
+
 def utc_equivalent_tzaware_datetime(ts: int, microseconds: int, tz_info: tzinfo) -> datetime:
     """Build a UTC-equivalent timezone-aware datetime via epoch arithmetic.
 
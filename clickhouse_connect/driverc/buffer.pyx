@@ -10,7 +10,7 @@ from cpython.unicode cimport PyUnicode_Decode
 from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
 from cpython.bytes cimport PyBytes_FromStringAndSize
 from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_ANY_CONTIGUOUS, PyBUF_SIMPLE
-from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from cpython.mem cimport PyMem_Free, PyMem_Malloc, PyMem_Realloc
 from libc.string cimport memcpy
 
 from clickhouse_connect.driver.exceptions import StreamCompleteException
@@ -317,6 +317,56 @@ cdef class ResponseBuffer:
             return self._read_nullable_str_col(num_rows, enc, null_object)
         return self._read_str_col(num_rows, enc)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def read_str_col_raw(self, unsigned long long num_rows) -> bytes:
+        cdef unsigned long long x = 0, sz, shift, out_sz = 0, out_cap = 4096
+        cdef unsigned char b
+        cdef char * buf
+        cdef char * out = <char *> PyMem_Malloc(out_cap)
+        cdef char * grown
+        cdef object result
+        if out == NULL:
+            raise MemoryError
+        try:
+            while x < num_rows:
+                sz = 0
+                shift = 0
+                while 1:
+                    if self.buf_loc < self.buf_sz:
+                        b = self.buffer[self.buf_loc]
+                        self.buf_loc += 1
+                    else:
+                        b = self._read_byte_load()
+                    if out_sz == out_cap:
+                        out_cap <<= 1
+                        grown = <char *> PyMem_Realloc(out, out_cap)
+                        if grown == NULL:
+                            raise MemoryError
+                        out = grown
+                    out[out_sz] = <char> b
+                    out_sz += 1
+                    sz += (<unsigned long long>(b & 0x7f)) << shift
+                    if (b & 0x80) == 0:
+                        break
+                    shift += 7
+                if sz > 0:
+                    if out_sz + sz > out_cap:
+                        while out_sz + sz > out_cap:
+                            out_cap <<= 1
+                        grown = <char *> PyMem_Realloc(out, out_cap)
+                        if grown == NULL:
+                            raise MemoryError
+                        out = grown
+                    buf = self.read_bytes_c(sz)
+                    memcpy(out + out_sz, buf, sz)
+                    out_sz += sz
+                x += 1
+            result = PyBytes_FromStringAndSize(out, out_sz)
+        finally:
+            PyMem_Free(out)
+        return result
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     def read_array(self, t: str, unsigned long long num_rows) -> Iterable[Any]:
@@ -3,23 +3,34 @@ import struct
 from typing import Sequence, Optional
 
 import array
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 
 import cython
 import sys
 
 from .buffer cimport ResponseBuffer
-from cpython cimport Py_INCREF, Py_DECREF
+from cpython cimport Py_INCREF, Py_DECREF, PyObject
+from cpython cimport array as carray
+from cpython.dict cimport PyDict_GetItem, PyDict_SetItem
 from cpython.buffer cimport PyBUF_READ, PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE, Py_buffer
 from cpython.mem cimport PyMem_Free, PyMem_Malloc
 from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+from cpython.list cimport PyList_GetSlice
 from cpython.bytearray cimport PyByteArray_GET_SIZE, PyByteArray_Resize, PyByteArray_AS_STRING
 from cpython.memoryview cimport PyMemoryView_FromMemory
-from cpython.datetime cimport datetime_new, import_datetime
+from cpython.long cimport PyLong_AsUnsignedLongLongMask
+from cpython.datetime cimport (
+    datetime_new, import_datetime, PyDateTime_Check, PyDateTime_CheckExact, datetime_year, datetime_month, datetime_day,
+    datetime_hour, datetime_minute, datetime_second, datetime_microsecond, datetime_tzinfo, timedelta_days,
+    timedelta_seconds, timedelta_microseconds
+)
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize
+from libc.math cimport floor
+from libc.limits cimport LLONG_MAX, LLONG_MIN
 from cython.view cimport array as cvarray
 from ipaddress import IPv4Address
 from uuid import UUID, SafeUUID
-from libc.string cimport memcpy
+from libc.string cimport memcpy, memset
 from datetime import tzinfo
 
 from clickhouse_connect.driver import tzutil, options
@@ -30,6 +41,27 @@ from clickhouse_connect.driver.exceptions import DataError
 # Initialize datetime C API for direct object construction
 import_datetime()
 
+cdef extern from *:
+    """
+    #if PY_VERSION_HEX >= 0x030D0000
+    #define CH_HAS_NATIVE_BYTES 1
+    static PyObject* ch_long_from_le_bytes(const unsigned char* bytes, size_t n, int is_signed) {
+        if (is_signed)
+            return PyLong_FromNativeBytes(bytes, n, Py_ASNATIVEBYTES_LITTLE_ENDIAN);
+        return PyLong_FromUnsignedNativeBytes(bytes, n, Py_ASNATIVEBYTES_LITTLE_ENDIAN);
+    }
+    #else
+    #define CH_HAS_NATIVE_BYTES 0
+    static PyObject* ch_long_from_le_bytes(const unsigned char* bytes, size_t n, int is_signed) {
+        PyErr_SetString(PyExc_NotImplementedError, "PyLong_FromNativeBytes requires Python 3.13");
+        return NULL;
+    }
+    #endif
+    """
+    # The public int from bytes conversion added in Python 3.13, older versions use int.from_bytes
+    bint CH_HAS_NATIVE_BYTES
+    object ch_long_from_le_bytes(const unsigned char* bytes, size_t n, int is_signed)
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def pivot(data: Sequence, unsigned long long start, unsigned long long end):
@@ -320,6 +352,67 @@ def read_uuid_col(ResponseBuffer buffer, unsigned long long num_rows):
     return column
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def read_bigint_col(ResponseBuffer buffer, unsigned long long num_rows, int byte_size, bint signed):
+    """
+    Decode a column of little endian 128 or 256 bit integers from a single contiguous read
+    """
+    cdef unsigned long long x = 0
+    cdef const unsigned char * loc = <const unsigned char *>buffer.read_bytes_c(byte_size * num_rows)
+    cdef object column = PyTuple_New(num_rows), v
+    from_bytes = int.from_bytes
+    for x in range(num_rows):
+        if CH_HAS_NATIVE_BYTES:
+            v = ch_long_from_le_bytes(loc, byte_size, signed)
+        else:
+            v = from_bytes(loc[:byte_size], "little", signed=signed)
+        PyTuple_SET_ITEM(column, x, v)
+        Py_INCREF(v)
+        loc += byte_size
+    return column
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def write_bigint_col(column: Sequence, bint nullable, int byte_size, bint signed, bytearray dest):
+    """
+    Encode a column of Python ints (or values convertible to int, such as strings) as little endian 128 or 256 bit
+    integers.  Each value is written 64 bits at a time directly into dest, and falsy values in nullable columns are
+    written as zero
+    """
+    cdef Py_ssize_t old_size = PyByteArray_GET_SIZE(dest)
+    cdef Py_ssize_t sz = byte_size * len(column)
+    cdef int words = byte_size >> 3, w, b
+    cdef unsigned long long word
+    cdef unsigned char * loc
+    cdef object v
+    cdef object min_value, max_value, one = 1
+    if signed:
+        max_value = (one << (byte_size * 8 - 1)) - 1
+        min_value = -max_value - 1
+    else:
+        max_value = (one << (byte_size * 8)) - 1
+        min_value = 0
+    PyByteArray_Resize(dest, old_size + sz)
+    loc = <unsigned char *>PyByteArray_AS_STRING(dest) + old_size
+    memset(loc, 0, sz)
+    for x in column:
+        if nullable and not x:
+            loc += byte_size
+            continue
+        v = x if type(x) is int else int(x)
+        if v < min_value or v > max_value:
+            raise OverflowError("int too big to convert")
+        for w in range(words):
+            word = PyLong_AsUnsignedLongLongMask(v)
+            for b in range(8):
+                loc[b] = <unsigned char>(word >> (b << 3))
+            loc += 8
+            if w < words - 1:
+                v = v >> 64
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def read_datetime64_naive_col(object column: Sequence, unsigned long long prec, tz: tzinfo = None):
@@ -452,6 +545,47 @@ def build_lc_nullable_column(index: Sequence, keys: array.array, object null_obj
     return column
 
 
+cdef carray.array _lc_keys_template = array.array("I")
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def build_lc_keys(column: Sequence, bint nullable):
+    """
+    Build the dictionary and the UInt32 dictionary keys of a LowCardinality insert column in one pass.  For
+    Nullable columns the first dictionary entry is the None placeholder, and None values map to key 0
+    """
+    cdef Py_ssize_t num_rows = len(column), ix = 0
+    cdef unsigned int next_key = 1 if nullable else 0
+    cdef dict rev_map = {}
+    cdef list index = [None] if nullable else []
+    cdef carray.array keys = carray.clone(_lc_keys_template, num_rows, False)
+    cdef unsigned int* key_data = keys.data.as_uints
+    cdef PyObject* found
+    cdef object key, last = None
+    cdef unsigned int last_key = 0
+    for x in column:
+        if nullable and x is None:
+            key_data[ix] = 0
+        elif x is last and ix > 0:
+            # Runs of the same object, common in sorted or repeated data, skip the dictionary lookup
+            key_data[ix] = last_key
+        else:
+            found = PyDict_GetItem(rev_map, x)
+            if found == NULL:
+                key = next_key
+                PyDict_SetItem(rev_map, x, key)
+                index.append(x)
+                key_data[ix] = next_key
+                next_key += 1
+            else:
+                key_data[ix] = <unsigned int>PyLong_AsUnsignedLongLongMask(<object>found)
+            last = x
+            last_key = key_data[ix]
+        ix += 1
+    return index, keys
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef inline extend_byte_array(target: bytearray, int start, object source, Py_ssize_t sz):
@@ -636,3 +770,203 @@ def build_map_columns(column, bytearray dest):
             ix += 1
 
     return keys, values
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def flatten_array_col(column, bytearray dest):
+    """
+    Flatten one nesting level of a column of sequences into a single list, writing the UInt64 end offset of each
+    row into dest
+    """
+    cdef unsigned long long num_rows = len(column)
+    cdef unsigned long long total = 0, offset_value, i = 0
+    cdef Py_ssize_t old_size = PyByteArray_GET_SIZE(dest)
+    cdef char* dest_ptr
+    cdef list values = []
+
+    PyByteArray_Resize(dest, old_size + num_rows * 8)
+    dest_ptr = PyByteArray_AS_STRING(dest) + old_size
+    for v in column:
+        total += len(v)
+        offset_value = total
+        if must_swap:
+            offset_value = _bswap_uint64(offset_value)
+        memcpy(dest_ptr + i * 8, &offset_value, 8)
+        values.extend(v)
+        i += 1
+    return values
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def unflatten_array_col(list values, const unsigned long long[:] offsets):
+    """
+    Split a flat list of values into one list per row using the UInt64 end offsets of each row
+    """
+    cdef Py_ssize_t num_rows = offsets.shape[0], i
+    cdef Py_ssize_t last = 0, end
+    cdef list column = [None] * num_rows
+    for i in range(num_rows):
+        end = <Py_ssize_t>offsets[i]
+        column[i] = PyList_GetSlice(values, last, end)
+        last = end
+    return column
+
+
+cdef inline long long _days_from_civil(long long year, long long month, long long day):
+    """Days since 1970-01-01 of a proleptic Gregorian date, for years 1 through 9999"""
+    cdef long long yoe, doy
+    if month <= 2:
+        year -= 1
+    yoe = year % 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    return (year // 400) * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + doy - 719468
+
+
+cdef inline int _parse_digits(const char* s, int n):
+    cdef int v = 0, i
+    for i in range(n):
+        if s[i] < 48 or s[i] > 57:
+            return -1
+        v = v * 10 + s[i] - 48
+    return v
+
+
+@cython.cdivision(True)
+cdef bint _parse_iso_datetime(const char* s, Py_ssize_t n, long long* seconds, long long* micros,
+                              long long* offset, bint* has_offset):
+    """
+    Parse YYYY-MM-DD[(T| )HH:MM[:SS[.f{1,6}]]][Z|(+|-)HH:MM] into epoch seconds (as if UTC) and microseconds.  Any
+    other form returns False so that the caller can fall back to datetime.fromisoformat
+    """
+    cdef int year, month, day, hour = 0, minute = 0, second = 0, us = 0, digits = 0, off_h, off_m
+    cdef Py_ssize_t pos = 10
+    cdef unsigned short* m_days
+    if n < 10 or s[4] != 45 or s[7] != 45:
+        return False
+    year = _parse_digits(s, 4)
+    month = _parse_digits(s + 5, 2)
+    day = _parse_digits(s + 8, 2)
+    if year < 1 or month < 1 or month > 12 or day < 1:
+        return False
+    m_days = MONTH_DAYS_LEAP if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else MONTH_DAYS
+    if day > m_days[month] - m_days[month - 1]:
+        return False
+    if pos < n and (s[pos] == 84 or s[pos] == 32):
+        if pos + 6 > n or s[pos + 3] != 58:
+            return False
+        hour = _parse_digits(s + pos + 1, 2)
+        minute = _parse_digits(s + pos + 4, 2)
+        pos += 6
+        if pos < n and s[pos] == 58:
+            if pos + 3 > n:
+                return False
+            second = _parse_digits(s + pos + 1, 2)
+            pos += 3
+            if pos < n and s[pos] == 46:
+                pos += 1
+                while pos < n and 48 <= s[pos] <= 57:
+                    if digits == 6:
+                        return False
+                    us = us * 10 + s[pos] - 48
+                    digits += 1
+                    pos += 1
+                if digits == 0:
+                    return False
+                while digits < 6:
+                    us *= 10
+                    digits += 1
+        if hour < 0 or hour > 23 or minute < 0 or minute > 59 or second < 0 or second > 59:
+            return False
+    has_offset[0] = False
+    offset[0] = 0
+    if pos < n:
+        if s[pos] == 90 and pos + 1 == n:
+            has_offset[0] = True
+        elif (s[pos] == 43 or s[pos] == 45) and pos + 6 == n and s[pos + 3] == 58:
+            off_h = _parse_digits(s + pos + 1, 2)
+            off_m = _parse_digits(s + pos + 4, 2)
+            if off_h < 0 or off_h > 23 or off_m < 0 or off_m > 59:
+                return False
+            has_offset[0] = True
+            offset[0] = (off_h * 3600 + off_m * 60) * (-1 if s[pos] == 45 else 1)
+        else:
+            return False
+    seconds[0] = _days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
+    micros[0] = us
+    return True
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def write_datetime_col(column: Sequence, bint nullable, long long prec, object naive_ts, int byte_size,
+                       bytearray dest, object col_name=None):
+    """
+    Encode a column of datetimes or ISO 8601 strings as little endian DateTime seconds (byte_size 4) or DateTime64
+    ticks of 1/prec seconds (byte_size 8).  Epoch seconds are computed directly from the datetime fields.  Naive
+    values are treated as UTC when naive_ts is None, otherwise naive_ts is called with the naive datetime and
+    returns its epoch timestamp.  Falsy values in nullable columns are written as zero
+    """
+    cdef Py_ssize_t num_rows = len(column), str_len, old_size = PyByteArray_GET_SIZE(dest)
+    cdef long long seconds = 0, micros = 0, offset = 0, ticks
+    cdef unsigned long long bits
+    cdef int b
+    cdef bint has_offset, naive
+    cdef const char* str_data
+    cdef unsigned char* out
+    cdef object tz, utc_offset
+    PyByteArray_Resize(dest, old_size + num_rows * byte_size)
+    out = <unsigned char*>PyByteArray_AS_STRING(dest) + old_size
+    for x in column:
+        if nullable and not x:
+            ticks = 0
+        else:
+            if isinstance(x, str):
+                str_data = PyUnicode_AsUTF8AndSize(x, &str_len)
+                if _parse_iso_datetime(str_data, str_len, &seconds, &micros, &offset, &has_offset):
+                    if has_offset:
+                        seconds -= offset
+                    elif naive_ts is not None:
+                        # Naive values in a non UTC zone need the datetime to resolve the local offset
+                        x = datetime.fromisoformat(x)
+                else:
+                    x = datetime.fromisoformat(x)
+            if not isinstance(x, str):
+                # pandas NaT is a datetime subclass that isn't equal to itself, and x.timestamp() below rejects it
+                if PyDateTime_CheckExact(x) or (PyDateTime_Check(x) and x == x):
+                    tz = datetime_tzinfo(x)
+                    utc_offset = None if tz is None or tz is timezone.utc else x.utcoffset()
+                    naive = tz is None or (utc_offset is None and tz is not timezone.utc)
+                    micros = datetime_microsecond(x)
+                    if naive and naive_ts is not None:
+                        seconds = <long long>floor(naive_ts(x))
+                    else:
+                        seconds = _days_from_civil(datetime_year(x), datetime_month(x), datetime_day(x)) * 86400 + \
+                            datetime_hour(x) * 3600 + datetime_minute(x) * 60 + datetime_second(x)
+                        if utc_offset is not None:
+                            seconds -= timedelta_days(utc_offset) * 86400 + timedelta_seconds(utc_offset)
+                            micros -= timedelta_microseconds(utc_offset)
+                            if micros < 0:
+                                micros += 1000000
+                                seconds -= 1
+                else:
+                    # Anything else must provide the datetime interface, which raises for unsupported values
+                    seconds = <long long>floor(x.timestamp())
+                    micros = x.microsecond
+            # Checked before multiplying, since DateTime64 ticks outside the long long range would wrap
+            if seconds > (LLONG_MAX - 999999) // prec or seconds < LLONG_MIN // prec:
+                col_msg = f" for column `{str(col_name)}`" if col_name else ""
+                raise DataError(f"Unable to create native array{col_msg}: value out of range")
+            ticks = seconds * prec + (micros * prec) // 1000000
+        if byte_size == 4:
+            if ticks < 0 or ticks > 0xFFFFFFFF:
+                col_msg = f" for column `{str(col_name)}`" if col_name else ""
+                raise DataError(f"Unable to create native array{col_msg}: value out of range")
+        bits = <unsigned long long>ticks
+        for b in range(byte_size):
+            out[b] = bits & 0xFF
+            bits >>= 8
+        out += byte_size
+    return 0
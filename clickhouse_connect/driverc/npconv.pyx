@@ -3,6 +3,7 @@ import cython
 
 import numpy as np
 
+from clickhouse_connect import common
 from .buffer cimport ResponseBuffer
 
 @cython.boundscheck(False)
@@ -11,7 +12,16 @@ def read_numpy_array(buffer, np_type: str, unsigned long long num_rows):
     dtype = np.dtype(np_type)
     cdef sz = dtype.itemsize * num_rows
     cdef char * source
+    cdef ResponseBuffer rb
+    cdef unsigned long long offset
     if isinstance(buffer, ResponseBuffer):
-        source = (<ResponseBuffer>buffer).read_bytes_c(dtype.itemsize * num_rows)
+        rb = <ResponseBuffer>buffer
+        if sz and rb.buf_loc + sz <= rb.buf_sz and common.get_setting("numpy_zero_copy"):
+            # The column lies entirely within the current response chunk, so return a read-only view
+            # over that chunk instead of copying it
+            offset = rb.buf_loc
+            rb.buf_loc += sz
+            return np.frombuffer(rb.current_chunk, dtype, num_rows, offset)
+        source = rb.read_bytes_c(sz)
         return np.frombuffer(source[:sz], dtype, num_rows)
     return np.frombuffer(buffer.read_bytes(sz), dtype, num_rows)
@@ -25,6 +25,7 @@ from clickhouse_connect.driver.client import Client
 from clickhouse_connect.driver.constants import PROTOCOL_VERSION_WITH_LOW_CARD
 from clickhouse_connect.driver.exceptions import OperationalError, ProgrammingError
 from clickhouse_connect.driver.models import SettingDef
+from clickhouse_connect.driver.schemacache import SchemaCache
 
 PROTOCOL_RESPONSE = b"\x00" * 8 + b"\x01\x01\x05check"
 VERSION_OP = CommandOp("SELECT version(), timezone()", use_database=False)
@@ -224,6 +225,22 @@ def test_insert_context_sequence_describes_table_identically(column_names):
         assert [t.name for t in context.column_types] == ["UInt32", "String"]
 
 
+def test_insert_context_sequence_reuses_cached_schema():
+    cache = SchemaCache(10, 60)
+    backend = FakeSyncExecutor([_describe_rows()])
+
+    def sequence():
+        return insert_context_sequence("target_table", schema_cache=cache, default_database="db1")
+
+    first = run_sync(sequence(), backend.execute)
+    second = asyncio.run(run_async(sequence(), FakeAsyncExecutor([]).execute))
+
+    assert backend.operations == [QueryOp("DESCRIBE TABLE `target_table`")]
+    assert cache.get("`db1`.`target_table`") is not None
+    assert first.column_names == second.column_names == ["user_id", "label"]
+    assert [t.name for t in second.column_types] == ["UInt32", "String"]
+
+
 def test_insert_context_sequence_rejects_empty_column_list():
     with pytest.raises(ValueError, match="Column names must be specified"):
         run_sync(insert_context_sequence("target_table"), FakeSyncExecutor([[]]).execute)
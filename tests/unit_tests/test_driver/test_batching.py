@@ -0,0 +1,147 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from clickhouse_connect.datatypes.registry import get_from_name
+from clickhouse_connect.driver import batching
+from clickhouse_connect.driver.batching import AsyncBatchingInserter, BatchingInserter
+from clickhouse_connect.driver.exceptions import DatabaseError, ProgrammingError
+from clickhouse_connect.driver.insert import InsertContext
+from clickhouse_connect.driver.summary import QuerySummary
+
+
+def _context():
+    return InsertContext("events", ["key", "value"], [get_from_name("UInt32"), get_from_name("String")], column_oriented=True)
+
+
+class RecordingClient:
+    def __init__(self, fail: bool = False, gate: threading.Event | None = None):
+        self.batches = []
+        self.fail = fail
+        self.gate = gate
+
+    def insert(self, data=None, context=None):
+        if self.gate is not None:
+            self.gate.wait()
+        assert context.empty
+        self.batches.append([list(column) for column in data])
+        if self.fail:
+            raise DatabaseError("insert failed")
+        return QuerySummary({"written_rows": len(data[0])})
+
+
+class AsyncRecordingClient(RecordingClient):
+    async def insert(self, data=None, context=None):
+        return RecordingClient.insert(self, data, context)
+
+
+def test_flush_on_row_count():
+    client = RecordingClient()
+    with BatchingInserter(client, _context(), max_rows=3, max_latency=60) as inserter:
+        first = inserter.add([(1, "a"), (2, "b")])
+        second = inserter.add([(3, "c")])
+        assert first is second
+        assert first.result(5).written_rows == 3
+        third = inserter.add([[4], ["d"]], column_oriented=True)
+    assert third.result(0).written_rows == 1
+    assert client.batches == [[[1, 2, 3], ["a", "b", "c"]], [[4], ["d"]]]
+
+
+def test_flush_on_latency_and_bytes():
+    client = RecordingClient()
+    with BatchingInserter(client, _context(), max_latency=0.05) as inserter:
+        assert inserter.add([(1, "a")]).result(5).written_rows == 1
+    client = RecordingClient()
+    with BatchingInserter(client, _context(), max_bytes=20, max_latency=60) as inserter:
+        inserter.add([(1, "abcdefgh")])
+        assert inserter.add([(2, "abcdefgh")]).result(5).written_rows == 2
+
+
+def test_explicit_flush_and_errors():
+    client = RecordingClient(fail=True)
+    inserter = BatchingInserter(client, _context(), max_latency=60)
+    assert inserter.flush() is None
+    future = inserter.add([(1, "a")])
+    assert inserter.flush() is future
+    with pytest.raises(DatabaseError):
+        future.result(5)
+    inserter.close()
+    with pytest.raises(ProgrammingError):
+        inserter.add([(2, "b")])
+    with pytest.raises(ProgrammingError):
+        BatchingInserter(client, _context(), max_rows=0)
+
+
+def test_backpressure():
+    gate = threading.Event()
+    client = RecordingClient(gate=gate)
+    inserter = BatchingInserter(client, _context(), max_rows=1, max_latency=60, max_pending=1)
+    inserter.add([(1, "a")])
+    inserter.add([(2, "b")])
+    blocked = threading.Thread(target=inserter.add, args=([(3, "c")],))
+    blocked.start()
+    blocked.join(0.1)
+    assert blocked.is_alive()
+    gate.set()
+    blocked.join(5)
+    inserter.close()
+    assert [batch[0] for batch in client.batches] == [[1], [2], [3]]
+
+
+class RacingFuture(Future):
+    """Future cancelled just after the inserter checked it"""
+
+    def cancelled(self):
+        return False
+
+
+def test_cancelled_future(monkeypatch):
+    # Cancelling a pending future doesn't stop the background thread, for successful or failed inserts
+    monkeypatch.setattr(batching, "Future", RacingFuture)
+    for fail in (False, True):
+        gate = threading.Event()
+        client = RecordingClient(fail=fail, gate=gate)
+        inserter = BatchingInserter(client, _context(), max_rows=1, max_latency=60)
+        cancelled = inserter.add([(1, "a")])
+        assert cancelled.cancel()
+        gate.set()
+        later = inserter.add([(2, "b")])
+        if fail:
+            assert isinstance(later.exception(5), DatabaseError)
+        else:
+            assert later.result(5).written_rows == 1
+        inserter.close()
+        assert cancelled.done()
+        assert [batch[0] for batch in client.batches] == [[1], [2]]
+
+
+def test_async_cancelled_future():
+    async def run():
+        client = AsyncRecordingClient()
+        async with AsyncBatchingInserter(client, _context(), max_rows=1, max_latency=60) as inserter:
+            cancelled = await inserter.add([(1, "a")])
+            cancelled.cancel()
+            later = await inserter.add([(2, "b")])
+            assert (await later).written_rows == 1
+        assert cancelled.cancelled()
+        return client.batches
+
+    assert [batch[0] for batch in asyncio.run(run())] == [[1], [2]]
+
+
+def test_async_inserter():
+    async def run():
+        client = AsyncRecordingClient()
+        async with AsyncBatchingInserter(client, _context(), max_rows=2, max_latency=60) as inserter:
+            first = await inserter.add([(1, "a"), (2, "b")])
+            assert (await first).written_rows == 2
+            second = await inserter.add([(3, "c")])
+            assert await inserter.flush() is second
+            assert (await second).written_rows == 1
+            late = await inserter.add([(4, "d")])
+        assert (await late).written_rows == 1
+        return client.batches
+
+    assert asyncio.run(run()) == [[[1, 2], ["a", "b"]], [[3], ["c"]], [[4], ["d"]]]
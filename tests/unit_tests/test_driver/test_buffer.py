@@ -73,6 +73,15 @@ def test_read_bytes():
             pass
 
 
+def test_read_str_col_raw():
+    data = "03 41 42 43 00 81 01 " + "58 " * 129 + "01 5a"
+    for cls in CResponseBuffer, PyResponseBuffer:
+        buff = bytes_source(data, chunk_size=7, cls=cls)
+        raw = buff.read_str_col_raw(3)
+        assert raw == bytes.fromhex(data)[:-2]
+        assert list(buff.read_str_col(1, "utf8")) == ["Z"]
+
+
 def test_fixed_string_strips_padding():
     data = bytes.fromhex("41 00 00 00 42 43 00 00")
     expected = ["A", "BC"]
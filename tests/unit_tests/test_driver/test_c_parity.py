@@ -1,16 +1,34 @@
 import array
+import zoneinfo
+from datetime import datetime, timedelta, timezone
 
 import numpy as np
+import pandas as pd
+import pytest
 from clickhouse_connect.driverc.buffer import ResponseBuffer as CResponseBuffer
+from clickhouse_connect.driverc.dataconv import build_lc_keys as c_build_lc_keys
 from clickhouse_connect.driverc.dataconv import build_lc_nullable_column as c_build_lc_nullable_column
 from clickhouse_connect.driverc.dataconv import build_nullable_column as c_build_nullable_column
+from clickhouse_connect.driverc.dataconv import flatten_array_col as c_flatten_array_col
+from clickhouse_connect.driverc.dataconv import read_bigint_col as c_read_bigint_col
 from clickhouse_connect.driverc.dataconv import read_nullable_array as c_read_nullable_array
+from clickhouse_connect.driverc.dataconv import unflatten_array_col as c_unflatten_array_col
+from clickhouse_connect.driverc.dataconv import write_datetime_col as c_write_datetime_col
+from clickhouse_connect.driverc.dataconv import write_bigint_col as c_write_bigint_col
 from clickhouse_connect.driverc.npconv import read_numpy_array as c_read_numpy_array
 
+from clickhouse_connect import common
 from clickhouse_connect.driver.buffer import ResponseBuffer as PyResponseBuffer
+from clickhouse_connect.driver.dataconv import build_lc_keys as py_build_lc_keys
 from clickhouse_connect.driver.dataconv import build_lc_nullable_column as py_build_lc_nullable_column
 from clickhouse_connect.driver.dataconv import build_nullable_column as py_build_nullable_column
+from clickhouse_connect.driver.dataconv import flatten_array_col as py_flatten_array_col
+from clickhouse_connect.driver.dataconv import read_bigint_col as py_read_bigint_col
 from clickhouse_connect.driver.dataconv import read_nullable_array as py_read_nullable_array
+from clickhouse_connect.driver.dataconv import unflatten_array_col as py_unflatten_array_col
+from clickhouse_connect.driver.dataconv import write_datetime_col as py_write_datetime_col
+from clickhouse_connect.driver.exceptions import DataError
+from clickhouse_connect.driver.dataconv import write_bigint_col as py_write_bigint_col
 from clickhouse_connect.driver.npconv import read_numpy_array as py_read_numpy_array
 from tests.helpers import bytes_source
 
@@ -51,6 +69,76 @@ def test_build_lc_nullable_column_parity_with_non_none_null():
     assert c_build_lc_nullable_column(index, keys, "") == expected
 
 
+@pytest.mark.parametrize("nullable", [True, False])
+def test_build_lc_keys_parity(nullable):
+    column = ["beta", "alpha", "beta", 7, "gamma", 7]
+    if nullable:
+        column[2:2] = [None]
+    for build_lc_keys in (py_build_lc_keys, c_build_lc_keys):
+        index, keys = build_lc_keys(column, nullable)
+        assert keys.typecode == "I"
+        assert index == ([None] if nullable else []) + ["beta", "alpha", 7, "gamma"]
+        assert [index[key] for key in keys] == column
+
+
+def test_array_col_parity():
+    column = [["a", "b"], [], ("c",), ["d", None, "f"]]
+    expected_offsets = array.array("Q", [2, 2, 3, 6])
+    for flatten_array_col, unflatten_array_col in (
+        (py_flatten_array_col, py_unflatten_array_col),
+        (c_flatten_array_col, c_unflatten_array_col),
+    ):
+        dest = bytearray(b"x")
+        values = flatten_array_col(column, dest)
+        assert values == ["a", "b", "c", "d", None, "f"]
+        assert dest == b"x" + expected_offsets.tobytes()
+        assert unflatten_array_col(values, expected_offsets) == [list(row) for row in column]
+
+
+@pytest.mark.parametrize("prec", [1, 1000, 10**9])
+def test_write_datetime_col_parity(prec):
+    chicago = zoneinfo.ZoneInfo("America/Chicago")
+    column = [
+        datetime(2024, 2, 29, 23, 59, 59, 999999),
+        datetime(1969, 12, 31, 23, 59, 58, 500000),
+        datetime(2024, 7, 1, 12, tzinfo=timezone.utc),
+        datetime(2024, 7, 1, 12, 0, 0, 250, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+        datetime(2024, 7, 1, 12, tzinfo=chicago),
+        "2024-07-01",
+        "2024-07-01T12:30",
+        "2024-07-01 12:30:15.5",
+        "2024-07-01T12:30:15.123456Z",
+        "2024-07-01T12:30:15+05:30",
+        "2024-07-01T12:30:15.123-08:00",
+        "20240701T123015",
+        None,
+        "",
+    ]
+    for naive_ts in (None, lambda dt: dt.replace(tzinfo=chicago).timestamp()):
+        expected = bytearray()
+        py_write_datetime_col(column, True, prec, naive_ts, 8, expected)
+        dest = bytearray()
+        c_write_datetime_col(column, True, prec, naive_ts, 8, dest)
+        assert dest == expected
+    expected = bytearray()
+    py_write_datetime_col(column[2:], True, 1, None, 4, expected)
+    dest = bytearray()
+    c_write_datetime_col(column[2:], True, 1, None, 4, dest)
+    assert dest == expected
+    for write_datetime_col in (py_write_datetime_col, c_write_datetime_col):
+        with pytest.raises(DataError):
+            write_datetime_col([datetime(1969, 12, 31)], False, 1, None, 4, bytearray(), "col")
+        with pytest.raises(ValueError):
+            write_datetime_col(["2024-02-30"], False, 1, None, 8, bytearray())
+        # DateTime64(9) ticks past 2262 don't fit in 64 bits
+        for value in (datetime(2300, 1, 1), datetime(1600, 1, 1)):
+            with pytest.raises(DataError):
+                write_datetime_col([value], False, 10**9, None, 8, bytearray(), "col")
+        # pandas NaT is a datetime subclass without a timestamp
+        with pytest.raises(ValueError):
+            write_datetime_col([pd.NaT], True, 1, None, 8, bytearray())
+
+
 def test_read_nullable_array_parity():
     payload = bytes([0, 1, 0]) + np.array([10, 20, 30], dtype=np.uint16).tobytes()
     py_source = bytes_source(payload, cls=PyResponseBuffer)
@@ -81,3 +169,57 @@ def test_numpy_read_parity_with_c_buffer():
     c_result = c_read_numpy_array(c_source, "<u2", 4)
 
     assert np.array_equal(py_result, c_result)
+
+
+@pytest.mark.parametrize("buffer_cls, read_numpy_array", [(PyResponseBuffer, py_read_numpy_array), (CResponseBuffer, c_read_numpy_array)])
+def test_numpy_zero_copy_read(buffer_cls, read_numpy_array):
+    first = np.arange(50, dtype=np.uint16)
+    second = np.arange(100, 150, dtype=np.uint16)
+    data = b"\x01" + first.tobytes() + second.tobytes()
+    source = bytes_source(data, chunk_size=128, cls=buffer_cls)
+    common.set_setting("numpy_zero_copy", True)
+    try:
+        assert source.read_byte() == 1
+        view = read_numpy_array(source, "<u2", 50)
+        straddled = read_numpy_array(source, "<u2", 50)
+    finally:
+        common.set_setting("numpy_zero_copy", False)
+    assert np.array_equal(view, first)
+    assert np.array_equal(straddled, second)
+    assert len(view.base) == 128
+    assert not view.flags.writeable
+    assert len(straddled.base) == 100
+
+
+BIGINT_VALUES = {
+    (16, True): [0, 1, -1, 2**63, -(2**63) - 1, 2**127 - 1, -(2**127)],
+    (16, False): [0, 1, 2**64 - 1, 2**64, 0xDEADBEEF << 64 | 0xFEEDFACE, 2**128 - 1],
+    (32, True): [0, -1, 2**200 + 7, -(2**255), 2**255 - 1],
+    (32, False): [0, 2**64, 2**192 + 2**64 + 3, 2**256 - 1],
+}
+
+
+@pytest.mark.parametrize("byte_size, signed", list(BIGINT_VALUES))
+def test_bigint_col_parity(byte_size, signed):
+    values = BIGINT_VALUES[(byte_size, signed)]
+    expected = b"".join(x.to_bytes(byte_size, "little", signed=signed) for x in values)
+    py_dest, c_dest = bytearray(b"\x01"), bytearray(b"\x01")
+    py_write_bigint_col(values, False, byte_size, signed, py_dest)
+    c_write_bigint_col(values, False, byte_size, signed, c_dest)
+    assert py_dest == c_dest == b"\x01" + expected
+
+    py_source = bytes_source(expected, chunk_size=40, cls=PyResponseBuffer)
+    c_source = bytes_source(expected, chunk_size=40, cls=CResponseBuffer)
+    assert list(py_read_bigint_col(py_source, len(values), byte_size, signed)) == values
+    assert list(c_read_bigint_col(c_source, len(values), byte_size, signed)) == values
+
+
+def test_write_bigint_col_conversions():
+    expected = b"".join(x.to_bytes(16, "little", signed=True) for x in (5, 0, -12, 0))
+    for write_bigint_col in (py_write_bigint_col, c_write_bigint_col):
+        dest = bytearray()
+        write_bigint_col(["5", None, np.int64(-12), 0], True, 16, True, dest)
+        assert dest == expected
+        for value, signed in ((2**127, True), (-1, False)):
+            with pytest.raises(OverflowError):
+                write_bigint_col([value], False, 16, signed, bytearray())
@@ -1,11 +1,16 @@
 import logging
+import random
+import threading
+import time
 from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
+from clickhouse_connect import common
 from clickhouse_connect.datatypes.registry import get_from_name
 from clickhouse_connect.dbapi.cursor import Cursor
+from clickhouse_connect.driver.common import StreamContext
 from clickhouse_connect.driver.exceptions import DatabaseError, ProgrammingError
 
 
@@ -637,3 +642,77 @@ def test_executemany_generator_falls_through_to_row_by_row():
 
     client.insert.assert_not_called()
     assert client.query.call_count == 2
+
+
+def create_stream_client(blocks, column_names=("col1", "col2")):
+    """Create a mock client that returns the blocks from query_row_block_stream"""
+    client = Mock()
+    query_result = create_mock_query_result([], list(column_names), [get_from_name("Int32")] * len(column_names))
+
+    def block_gen():
+        yield from blocks
+
+    client.query_row_block_stream.return_value = StreamContext(query_result, block_gen())
+    return client, query_result
+
+
+def test_streaming_cursor_fetches_across_blocks():
+    blocks = [[(1, 2), (3, 4), (5, 6)], [], [(7, 8)], [(9, 10), (11, 12)]]
+    client, query_result = create_stream_client(blocks)
+    cursor = Cursor(client, stream=True)
+    cursor.execute("SELECT * FROM big_table")
+
+    client.query.assert_not_called()
+    assert [d[0] for d in cursor.description] == ["col1", "col2"]
+    assert cursor.rowcount == -1
+    assert cursor.fetchone() == (1, 2)
+    assert cursor.fetchmany(3) == [(3, 4), (5, 6), (7, 8)]
+    assert cursor.fetchmany(0) == []
+    assert cursor.fetchall() == [(9, 10), (11, 12)]
+    assert cursor.fetchone() is None
+    assert cursor.fetchmany(2) == []
+    assert cursor.rowcount == 6
+    query_result.close.assert_called_once()
+
+
+def test_streaming_cursor_iteration_and_early_close():
+    client, query_result = create_stream_client([[(1, 2), (3, 4)], [(5, 6)]])
+    cursor = Cursor(client, stream=True)
+    cursor.execute("SELECT * FROM big_table")
+    assert next(iter(cursor)) == (1, 2)
+    cursor.close()
+    query_result.close.assert_called_once()
+    with pytest.raises(ProgrammingError):
+        cursor.fetchone()
+
+    client, _ = create_stream_client([[(1, 2)], [(3, 4)]])
+    cursor = Cursor(client, stream=True)
+    cursor.execute("SELECT * FROM big_table")
+    assert list(cursor) == [(1, 2), (3, 4)]
+
+
+def test_executemany_pipelines_queries_in_parameter_order():
+    """Without a session, executemany runs the queries on the worker pool and keeps the results in parameter order"""
+
+    def query(_operation, params, **_kwargs):
+        time.sleep(random.random() / 200)
+        return create_mock_query_result([(params["id"], threading.current_thread().name)], ["id", "thread"])
+
+    client = Mock()
+    client.get_client_setting.return_value = None
+    client.query.side_effect = query
+    common.set_setting("executemany_workers", 4)
+    try:
+        cursor = Cursor(client)
+        cursor.executemany("SELECT %(id)s, currentUser()", [{"id": ix} for ix in range(50)])
+        rows = cursor.fetchall()
+        assert [row[0] for row in rows] == list(range(50))
+        assert all(row[1].startswith("ch_executemany_workers") for row in rows)
+        assert cursor.rowcount == 50
+        assert len(cursor.summary) == 50
+
+        client.get_client_setting.return_value = "session_1"
+        cursor.executemany("SELECT %(id)s, currentUser()", [{"id": ix} for ix in range(3)])
+        assert cursor.fetchall() == [(ix, threading.current_thread().name) for ix in range(3)]
+    finally:
+        common.set_setting("executemany_workers", 0)
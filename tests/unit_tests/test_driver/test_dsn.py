@@ -69,3 +69,9 @@ def test_legacy_zero_port_resolves_to_default():
     # 0 was the old default value for port and must keep resolving to the interface default.
     _, _, _, port, _, _ = parse(None, port=0)
     assert port == 8123
+
+
+def test_dsn_multiple_hosts():
+    host, username, _, port, database, _ = parse("http://user@replica1,replica2:8124/mydb")
+    assert host == "replica1,replica2:8124"
+    assert (username, port, database) == ("user", 8123, "mydb")
@@ -0,0 +1,228 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+import pytest
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from clickhouse_connect.driver._backend import endpoints
+from clickhouse_connect.driver._backend.endpoints import EndpointPool, host_port, split_hosts
+from clickhouse_connect.driver._backend.http_async import HttpAsyncBackend
+from clickhouse_connect.driver._backend.http_sync import HttpSyncBackend
+from clickhouse_connect.driver.exceptions import OperationalError, ProgrammingError
+
+URLS = ["http://r1:8123", "http://r2:8123", "http://r3:8123"]
+
+
+def test_split_hosts():
+    assert split_hosts("localhost") == ["localhost"]
+    assert split_hosts("r1, r2:8124,") == ["r1", "r2:8124"]
+    assert split_hosts(("r1", "[::1]:8124")) == ["r1", "[::1]:8124"]
+    with pytest.raises(ProgrammingError):
+        split_hosts(" , ")
+
+
+def test_host_port():
+    assert host_port("r1", 8123) == ("r1", 8123)
+    assert host_port("r1:8124", 8123) == ("r1", 8124)
+    assert host_port("[::1]:8124", 8123) == ("[::1]", 8124)
+    assert host_port("[::1]", 8123) == ("[::1]", 8123)
+    assert host_port("[2001:db8::7]:9000", 8123) == ("[2001:db8::7]", 9000)
+    with pytest.raises(ProgrammingError):
+        host_port("r1:http", 8123)
+    for entry in ("::1", "2001:db8::7:8124", "[::1", "[::1]8124"):
+        with pytest.raises(ProgrammingError):
+            host_port(entry, 8123)
+
+
+def test_round_robin():
+    pool = EndpointPool(URLS)
+    selected = []
+    for _ in range(6):
+        endpoint = pool.select()
+        selected.append(endpoint.url)
+        pool.release(endpoint, 0.01)
+    assert selected == URLS + URLS
+
+
+def test_least_in_flight():
+    pool = EndpointPool(URLS, "least_in_flight")
+    selected = [pool.select() for _ in range(3)]
+    assert len(set(selected)) == 3
+    pool.release(selected[1], 0.01)
+    assert pool.select() is selected[1]
+
+
+def test_ewma():
+    pool = EndpointPool(URLS, "ewma")
+    for latency in (0.5, 0.1, 0.3):
+        pool.release(pool.select(), latency)
+    assert pool.select().url == "http://r2:8123"
+    r2 = pool.endpoints[1]
+    pool.release(r2, 1.1)
+    assert r2.latency == pytest.approx(0.1 + endpoints.EWMA_DECAY * 1.0)
+
+
+def test_invalid_policy():
+    with pytest.raises(ProgrammingError):
+        EndpointPool(URLS, "random")
+
+
+def test_eject_and_readmit(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(endpoints.time, "monotonic", lambda: now[0])
+    pool = EndpointPool(URLS)
+    r1 = pool.endpoints[0]
+    pool.eject(r1)
+    assert [pool.select().url for _ in range(4)] == ["http://r2:8123", "http://r3:8123"] * 2
+    assert not pool.due_probes()
+    now[0] += endpoints.EJECT_BACKOFF_MIN
+    assert pool.due_probes() == [r1]
+    assert not pool.due_probes()
+    pool.readmit(r1, False)
+    assert r1.failures == 2
+    assert r1.ejected_until == now[0] + 2 * endpoints.EJECT_BACKOFF_MIN
+    pool.readmit(r1, True)
+    assert "http://r1:8123" in [pool.select().url for _ in range(3)]
+
+
+def test_all_ejected_and_sticky():
+    pool = EndpointPool(URLS)
+    for endpoint in pool.endpoints:
+        pool.eject(endpoint)
+    pool.endpoints[2].ejected_until = 1.0
+    assert pool.select().url == "http://r3:8123"
+    assert pool.select(exclude=pool.endpoints) is None
+    pool = EndpointPool(URLS)
+    pool.release(pool.select(), 0.01)
+    assert {pool.select(sticky=True).url for _ in range(3)} == {"http://r1:8123"}
+    # Session requests never move to another replica, where the session does not exist
+    pool.eject(pool.endpoints[0])
+    with pytest.raises(OperationalError):
+        pool.select(sticky=True)
+    assert pool.select(pool.endpoints[:1], sticky=True) is None
+
+
+def test_single_endpoint_never_ejected():
+    pool = EndpointPool(URLS[:1])
+    pool.eject(pool.endpoints[0])
+    assert not pool.endpoints[0].ejected_until
+    assert pool.select().url == URLS[0]
+    assert pool.select(exclude=pool.endpoints) is None
+
+
+def make_sync_backend(lb_policy="round_robin"):
+    return HttpSyncBackend(
+        url=URLS[0],
+        urls=URLS,
+        lb_policy=lb_policy,
+        pool_manager=Mock(),
+        owns_pool_manager=False,
+        headers={},
+        params={},
+        timeout=Mock(),
+        server_host_name=None,
+        token_provider=None,
+        autogenerate_query_id=False,
+    )
+
+
+def refused(_method, url, **_kwargs):
+    return MaxRetryError(None, url, NewConnectionError(None, "Connection refused"))
+
+
+def test_sync_failover_on_connect_failure():
+    backend = make_sync_backend()
+    response = SimpleNamespace(status=200, headers={})
+    backend.http.request = Mock(side_effect=[refused("POST", URLS[0]), response])
+    assert backend.request(b"SELECT 1", {}, server_wait=False) is response
+    sent = [call.args[1] for call in backend.http.request.call_args_list]
+    assert sent == ["http://r1:8123/?", "http://r2:8123/?"]
+    assert backend.endpoints.endpoints[0].ejected_until
+    assert all(endpoint.in_flight == 0 for endpoint in backend.endpoints.endpoints)
+
+
+def test_sync_no_failover_mid_flight_without_retries():
+    backend = make_sync_backend()
+    backend.http.request = Mock(side_effect=ProtocolError("Connection aborted"))
+    with pytest.raises(OperationalError):
+        backend.request(b"INSERT", {}, server_wait=False)
+    assert backend.http.request.call_count == 1
+    assert not backend.endpoints.endpoints[0].ejected_until
+
+    response = SimpleNamespace(status=200, headers={})
+    backend.http.request = Mock(side_effect=[ProtocolError("Connection aborted"), response])
+    assert backend.request(b"SELECT 1", {}, retries=2, server_wait=False) is response
+
+
+def test_sync_all_endpoints_refused():
+    def refuse(method, url, **kwargs):
+        raise refused(method, url, **kwargs)
+
+    backend = make_sync_backend()
+    backend.http.request = Mock(side_effect=refuse)
+    with pytest.raises(OperationalError):
+        backend.request(b"SELECT 1", {}, server_wait=False)
+    assert backend.http.request.call_count == 3
+
+
+def test_sync_ping_updates_health():
+    backend = make_sync_backend()
+    backend.endpoints.eject(backend.endpoints.endpoints[1])
+    backend.http.request = Mock(return_value=SimpleNamespace(status=200))
+    assert backend.ping()
+    assert not any(endpoint.ejected_until for endpoint in backend.endpoints.endpoints)
+
+
+def test_sync_ping_is_concurrent():
+    backend = make_sync_backend()
+    release = threading.Barrier(len(URLS), timeout=5)
+
+    def respond(_method, url, **_kwargs):
+        # Every ping must be in flight at once to pass the barrier
+        release.wait()
+        if url.startswith(URLS[0]):
+            raise refused("GET", url)
+        return SimpleNamespace(status=200)
+
+    backend.http.request = Mock(side_effect=respond)
+    assert backend.ping()
+    assert [bool(endpoint.ejected_until) for endpoint in backend.endpoints.endpoints] == [True, False, False]
+
+
+def test_sync_session_request_does_not_fail_over():
+    backend = make_sync_backend()
+    backend.endpoints.eject(backend.endpoints.endpoints[0])
+    backend.http.request = Mock(return_value=SimpleNamespace(status=200, headers={}))
+    with pytest.raises(OperationalError):
+        backend.request(b"SELECT 1", {"session_id": "s1"}, server_wait=False)
+    backend.http.request.assert_not_called()
+    # The failed session request does not leave the session marked as active
+    backend.endpoints.endpoints[0].ejected_until = 0.0
+    backend.request(b"SELECT 1", {"session_id": "s1"}, server_wait=False)
+
+
+@pytest.mark.asyncio
+async def test_async_failover_on_connect_failure():
+    backend = HttpAsyncBackend(
+        url=URLS[0],
+        urls=URLS,
+        headers={},
+        client_settings={},
+        timeout=Mock(),
+        connector_kwargs={},
+        ssl_context=None,
+        proxy_url=None,
+        server_host_name=None,
+        token_provider=None,
+        autogenerate_query_id=False,
+    )
+    response = SimpleNamespace(status=200, headers={})
+    error = aiohttp.ClientConnectorError(Mock(), OSError(111, "Connection refused"))
+    backend.session = SimpleNamespace(closed=False, request=AsyncMock(side_effect=[error, response]))
+    assert await backend.request(b"SELECT 1", {}, server_wait=False) is response
+    sent = [call.kwargs["url"] for call in backend.session.request.call_args_list]
+    assert sent == ["http://r1:8123/", "http://r2:8123/"]
+    assert backend.endpoints.endpoints[0].ejected_until
+    assert all(endpoint.in_flight == 0 for endpoint in backend.endpoints.endpoints)
@@ -1573,7 +1573,7 @@ class TestInsertArrowTransportSettings:
         transport = {"X-Test-Header": "1"}
         with (
             patch("clickhouse_connect.driver.client.check_arrow"),
-            patch("clickhouse_connect.driver.client.arrow_buffer", return_value=(["col_1"], b"block")),
+            patch("clickhouse_connect.driver.client.arrow_stream", return_value=(["col_1"], iter([b"block"]))),
             patch.object(client, "_add_integration_tag"),
             patch.object(client, "raw_insert", return_value=Mock()) as raw_insert,
         ):
@@ -1595,7 +1595,7 @@ class TestInsertArrowTransportSettings:
         transport = {"X-Test-Header": "1"}
         with (
             patch("clickhouse_connect.driver.asyncclient.check_arrow"),
-            patch("clickhouse_connect.driver.asyncclient.arrow_buffer", return_value=(["col_1"], b"block")),
+            patch("clickhouse_connect.driver.asyncclient.arrow_stream", return_value=(["col_1"], iter([b"block"]))),
             patch.object(client, "_add_integration_tag"),
             patch.object(client, "raw_insert", new=AsyncMock(return_value=Mock())) as raw_insert,
         ):
@@ -1,7 +1,18 @@
+import asyncio
 import datetime
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
 
 from clickhouse_connect.datatypes.registry import get_from_name
-from clickhouse_connect.driver.insert import InsertContext
+from clickhouse_connect.driver.asyncclient import AsyncClient, _bridge_async_iterable
+from clickhouse_connect.driver.client import Client
+from clickhouse_connect.driver.exceptions import DatabaseError, PartialInsertError, ProgrammingError
+from clickhouse_connect.driver.insert import InsertContext, slice_insert_data
+from clickhouse_connect.driver.summary import QuerySummary
+from clickhouse_connect.driver.transform import NativeTransform
 from clickhouse_connect.tools.datagen import fixed_len_ascii_str
 
 
@@ -29,3 +40,169 @@ def test_block_size():
         data,
     )
     assert ctx.block_row_count == 8192
+
+
+def _stream_context(data, column_oriented=False, block_size=None):
+    return InsertContext(
+        "fake_table",
+        ["key", "value"],
+        [get_from_name("UInt32"), get_from_name("String")],
+        data,
+        column_oriented=column_oriented,
+        block_size=block_size,
+    )
+
+
+def _insert_body(ctx):
+    return b"".join(NativeTransform.build_insert(ctx))
+
+
+def test_row_stream_blocks():
+    rows = [(x, f"value_{x}") for x in range(1000)]
+    ctx = _stream_context((row for row in rows), block_size=300)
+    assert ctx.streaming
+    assert [block.row_count for block in ctx.next_block()] == [300, 300, 300, 100]
+    assert _insert_body(_stream_context(iter(rows), block_size=300)) == _insert_body(_stream_context(rows, block_size=300))
+
+    ctx = _stream_context(iter(rows))
+    assert [block.row_count for block in ctx.next_block()] == [1000]
+    assert _stream_context(iter([])).empty
+    # A None first row is bad data, not an empty stream
+    with pytest.raises(TypeError):
+        _stream_context(iter([None, (1, "a")]))
+
+
+def test_column_chunk_stream_blocks():
+    chunks = [([x, x + 1], [f"v{x}", f"v{x + 1}"]) for x in range(0, 20, 2)]
+    chunks.append((list(range(20, 40)), [f"v{x}" for x in range(20, 40)]))
+    ctx = _stream_context(iter(chunks), column_oriented=True, block_size=8)
+    blocks = list(ctx.next_block())
+    assert [block.row_count for block in blocks] == [8, 8, 4, 20]
+    assert [list(block.column_data[0]) for block in blocks[:3]] == [list(range(0, 8)), list(range(8, 16)), list(range(16, 20))]
+    assert blocks[3].column_data is chunks[-1]
+    assert blocks[0].prefix.startswith(b"INSERT INTO fake_table")
+    assert not blocks[1].prefix
+
+
+def test_async_iterable_bridge():
+    async def rows(count):
+        for x in range(count):
+            yield x, f"value_{x}"
+
+    async def run():
+        ctx = _stream_context(await _bridge_async_iterable(rows(500)), block_size=200)
+        assert _stream_context(await _bridge_async_iterable(rows(0))).empty
+        # The producer thread reads the remaining rows by scheduling the iteration on the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: [block.row_count for block in ctx.next_block()])
+
+    assert asyncio.run(run()) == [200, 200, 100]
+
+
+def test_slice_insert_data():
+    rows = [(x, f"v{x}") for x in range(10)]
+    assert [len(part) for part in slice_insert_data(rows, 3, ["key", "value"])] == [3, 3, 4]
+    # Empty parts are kept so that the part indexes don't shift
+    assert slice_insert_data(rows[:2], 4, ["key", "value"]) == [[], rows[:1], [], rows[1:2]]
+    columns = [[x % 3 for x in range(10)], [f"v{x}" for x in range(10)]]
+    parts = slice_insert_data(columns, 2, ["key", "value"], column_oriented=True, shard_by="key")
+    assert sorted(value for part in parts for value in part[1]) == sorted(columns[1])
+    assert not set.intersection(*(set(part[0]) for part in parts))
+
+    df = pd.DataFrame({"key": [x % 4 for x in range(100)], "value": range(100)})
+    parts = slice_insert_data(df, 3, ["key", "value"], shard_by="key")
+    assert sum(len(part) for part in parts) == 100
+    assert not set.intersection(*(set(part["key"]) for part in parts))
+    assert [len(part) for part in slice_insert_data(np.arange(20).reshape(10, 2), 4, ["a", "b"])] == [2, 3, 2, 3]
+    assert slice_insert_data([], 4, ["key"]) == [[], [], [], []]
+    assert slice_insert_data([], 2, ["key"], shard_by="key") == [[], []]
+    with pytest.raises(ProgrammingError):
+        slice_insert_data(rows, 2, ["key", "value"], shard_by="missing")
+    with pytest.raises(ProgrammingError):
+        slice_insert_data(iter(rows), 2, ["key", "value"])
+
+
+def test_slice_insert_data_shard_hash():
+    # String keys are hashed the same way in every process and for every form of the data
+    rows = [(f"k{x % 5}", x) for x in range(10)]
+    expected = [[("k3", 3), ("k4", 4), ("k3", 8), ("k4", 9)], [("k0", 0), ("k0", 5)], [("k1", 1), ("k2", 2), ("k1", 6), ("k2", 7)]]
+    assert slice_insert_data(rows, 3, ["key", "value"], shard_by="key") == expected
+    columns = [[row[0] for row in rows], [row[1] for row in rows]]
+    parts = slice_insert_data(columns, 3, ["key", "value"], column_oriented=True, shard_by="key")
+    assert [list(zip(*part)) for part in parts] == expected
+    parts = slice_insert_data(pd.DataFrame(rows, columns=["key", "value"]), 3, ["key", "value"], shard_by="key")
+    assert [list(part.itertuples(index=False, name=None)) for part in parts] == expected
+    parts = slice_insert_data(np.array(rows, dtype=[("key", "U2"), ("value", "<i8")]), 3, ["key", "value"], shard_by="key")
+    assert [part.tolist() for part in parts] == expected
+
+
+class _ParallelClient:
+    insert_parallel = Client.insert_parallel
+
+    def __init__(self, session_id=None, fail_key=None):
+        self.session_id = session_id
+        self.fail_key = fail_key
+        self.threads = set()
+        self.inserted = []
+
+    def get_client_setting(self, _key):
+        return self.session_id
+
+    def create_insert_context(self, table, column_names, database, column_types, column_type_names, column_oriented, settings, **_):
+        return InsertContext(table, ["key", "value"], [get_from_name("UInt32"), get_from_name("String")], column_oriented=column_oriented)
+
+    def insert(self, data=None, context=None):
+        self.threads.add(threading.get_ident())
+        assert context.empty
+        context.data = data
+        if any(row[0] == self.fail_key for row in data):
+            raise DatabaseError("insert failed")
+        self.inserted.append(list(data))
+        return QuerySummary({"written_rows": str(context.row_count), "query_id": "q"})
+
+
+def test_parallel_insert():
+    rows = [(x, f"v{x}") for x in range(10)]
+    client = _ParallelClient()
+    summary = client.insert_parallel("events", rows, slices=3)
+    assert summary.written_rows == 10 and summary.query_id() == "q"
+    assert sorted(row for part in client.inserted for row in part) == rows
+
+    client = _ParallelClient("session")
+    client.insert_parallel("events", rows, slices=3)
+    assert client.threads == {threading.get_ident()}
+
+    client = _ParallelClient(fail_key=0)
+    with pytest.raises(PartialInsertError) as error:
+        client.insert_parallel("events", rows, slices=3)
+    assert list(error.value.errors) == [0]
+    assert error.value.failed_slices == {0: rows[:3]}
+    assert error.value.summary.written_rows == 7
+    assert isinstance(error.value.__cause__, DatabaseError)
+
+    # Empty slices send no insert and keep the indexes of the other slices
+    client = _ParallelClient(fail_key=1)
+    with pytest.raises(PartialInsertError) as error:
+        client.insert_parallel("events", rows[:2], slices=4)
+    assert error.value.failed_slices == {3: rows[1:2]}
+    assert client.inserted == [rows[:1]]
+
+
+def test_async_parallel_insert():
+    class AsyncParallelClient(_ParallelClient):
+        insert_parallel = AsyncClient.insert_parallel
+
+        async def create_insert_context(self, *args, **kwargs):
+            return _ParallelClient.create_insert_context(self, *args, **kwargs)
+
+        async def insert(self, data=None, context=None):
+            await asyncio.sleep(0.01)
+            return _ParallelClient.insert(self, data, context)
+
+    rows = [(x, f"v{x}") for x in range(10)]
+    assert asyncio.run(AsyncParallelClient().insert_parallel("events", rows, slices=4, shard_by="key")).written_rows == 10
+    with pytest.raises(PartialInsertError) as error:
+        asyncio.run(AsyncParallelClient(fail_key=9).insert_parallel("events", rows, slices=2))
+    assert list(error.value.errors) == [1]
+    assert error.value.failed_slices == {1: rows[5:]}
+    assert error.value.summary.written_rows == 5
@@ -3,9 +3,11 @@ import random
 
 from clickhouse_connect.driverc.buffer import ResponseBuffer as CBuff
 
+from clickhouse_connect import common
 from clickhouse_connect.datatypes.registry import get_from_name
+from clickhouse_connect.driver import transform
 from clickhouse_connect.driver.buffer import ResponseBuffer as PyBuff
-from clickhouse_connect.driver.common import coerce_bool
+from clickhouse_connect.driver.common import coerce_bool, worker_pool
 from tests.helpers import bytes_source, native_insert_block, native_transform, random_columns, random_data
 
 TEST_COLUMNS = 12
@@ -47,3 +49,33 @@ def test_native_small():
         assert data_result.column_names == col_names
         assert data_result.column_types == col_types
         assert data_result.result_set == data
+
+
+def test_parallel_decode_round_trips(monkeypatch):
+    monkeypatch.setattr(transform, "PARALLEL_DECODE_MIN_ROWS", 1)
+    common.set_setting("decode_workers", 4)
+    try:
+        for _ in range(50):
+            data_rows = random.randint(1, MAX_DATA_ROWS)
+            col_names, col_types = random_columns(TEST_COLUMNS)
+            data = random_data(col_types, data_rows)
+            col_names = ("row_id",) + col_names
+            col_types = (get_from_name("UInt32"),) + col_types
+            output = native_insert_block(data, column_names=col_names, column_types=col_types)
+            data_result = native_transform.parse_response(bytes_source(output, cls=BuffCls))
+            assert data_result.column_types == col_types
+            assert data_result.result_set == data
+    finally:
+        common.set_setting("decode_workers", 0)
+
+
+def test_replaced_worker_pool_stays_usable():
+    common.set_setting("decode_workers", 2)
+    try:
+        pool = worker_pool("decode_workers")
+        common.set_setting("decode_workers", 3)
+        assert worker_pool("decode_workers") is not pool
+        # A thread that fetched the old pool before the setting changed can still submit to it
+        assert pool.submit(sum, [1, 2]).result() == 3
+    finally:
+        common.set_setting("decode_workers", 0)
@@ -1,11 +1,14 @@
+from datetime import datetime
 from ipaddress import IPv4Address
 from uuid import UUID
 
+import pytest
+
 from clickhouse_connect.datatypes import registry
 from clickhouse_connect.driver.insert import InsertContext
 from clickhouse_connect.driver.query import QueryContext, QueryResult
 from clickhouse_connect.driver.transform import NativeTransform
-from tests.helpers import bytes_source
+from tests.helpers import bytes_source, native_insert_block
 from tests.unit_tests.test_driver.binary import NESTED_BINARY
 
 UINT16_NULLS = """
@@ -128,3 +131,35 @@ def test_first_item_first_row_non_empty_result():
     row_oriented = QueryResult([[1, "a"], [2, "b"]], column_names=columns, column_oriented=False)
     assert row_oriented.first_item == {"id": 1, "name": "a"}
     assert row_oriented.first_row == [1, "a"]
+
+
+def test_decoder_plan_multiple_blocks(monkeypatch):
+    names = ["key", "name", "note", "ts", "score"]
+    types = [registry.get_from_name(name) for name in ("UInt32", "String", "Nullable(String)", "DateTime('UTC')", "Float64")]
+    ts = datetime(2024, 5, 1, 12)
+    rows = [[ix, f"n{ix}", None if ix % 2 else "x", ts, ix / 2] for ix in range(4)]
+    response = native_insert_block(rows[:2], names, types) + native_insert_block(rows[2:], names, types)
+    result = parse_response(bytes_source(bytes(response), chunk_size=32))
+    assert result.result_rows == [tuple(row) for row in rows]
+
+    matches = []
+    match_fmt = QueryContext._match_fmt
+    monkeypatch.setattr(QueryContext, "_match_fmt", lambda ctx, ch_type: matches.append(ch_type) or match_fmt(ctx, ch_type))
+    context = QueryContext(query_formats={"UInt32": "string"}, column_formats={"name": "bytes"})
+    result = parse_response(bytes_source(bytes(response), chunk_size=32), context)
+    assert [row[:2] for row in result.result_rows] == [(str(ix), f"n{ix}".encode()) for ix in range(4)]
+    assert sorted(matches) == sorted(set(matches))
+
+
+def test_low_card_category():
+    pd = pytest.importorskip("pandas")
+    names = ["code", "label"]
+    types = [registry.get_from_name(name) for name in ("LowCardinality(String)", "LowCardinality(Nullable(String))")]
+    rows = [["GSM", "a"], ["CDMA", None], ["GSM", "b"], ["UMTS", "a"], ["LTE", None]]
+    response = native_insert_block(rows[:3], names, types) + native_insert_block(rows[3:], names, types)
+    context = QueryContext(use_numpy=True, as_pandas=True, query_formats={"String": "category"})
+    df = parse_response(bytes_source(bytes(response)), context).df_result
+    for col_num, name in enumerate(names):
+        assert isinstance(df[name].dtype, pd.CategoricalDtype)
+        assert [None if pd.isna(value) else value for value in df[name]] == [row[col_num] for row in rows]
+    assert sorted(df["code"].cat.categories) == ["CDMA", "GSM", "LTE", "UMTS"]
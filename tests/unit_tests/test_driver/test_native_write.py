@@ -1,5 +1,13 @@
+from datetime import datetime, timedelta
+
+import lz4.frame
+import pytest
+
+from clickhouse_connect import common
 from clickhouse_connect.datatypes.registry import get_from_name
-from clickhouse_connect.driver.exceptions import ProgrammingError
+from clickhouse_connect.driver.exceptions import DataError, ProgrammingError
+from clickhouse_connect.driver.insert import InsertContext
+from clickhouse_connect.driver.transform import NativeTransform
 from tests.helpers import native_insert_block, to_bytes
 from tests.unit_tests.test_driver.binary import NESTED_BINARY
 
@@ -138,6 +146,49 @@ def test_low_card_nullable():
     assert bytes(output) == bytes.fromhex(LOW_CARDINALITY_NULLABLE_OUTPUT)
 
 
+def test_low_card_categorical():
+    pd = pytest.importorskip("pandas")
+    values = ["GSM", None, "CDMA", "GSM"]
+    names = ["value"]
+    for type_name in ("LowCardinality(Nullable(String))", "LowCardinality(String)"):
+        types = [get_from_name(type_name)]
+        if "Nullable" not in type_name:
+            values = ["" if value is None else value for value in values]
+        df = pd.DataFrame({"value": pd.Categorical(values, categories=[value for value in ("GSM", "", "CDMA") if value in values])})
+        assert native_insert_block(df, names, types) == native_insert_block([[value] for value in values], names, types)
+
+    with pytest.raises(DataError):
+        get_from_name("LowCardinality(String)").write_column(pd.Categorical(["GSM", None]), bytearray(), InsertContext("", [], []))
+
+
+def test_array_flat_values():
+    np = pytest.importorskip("numpy")
+    pa = pytest.importorskip("pyarrow")
+    names = ["value"]
+
+    def check(type_name, rows, column):
+        types = [get_from_name(type_name)]
+        expected = native_insert_block([[row] for row in rows], names, types)
+        context = InsertContext("table", names, types, [column], column_oriented=True)
+        context.current_block = 1
+        output = bytearray()
+        for chunk in NativeTransform.build_insert(context):
+            output.extend(chunk)
+        assert output == expected
+
+    vectors = np.arange(12, dtype=np.float32).reshape(4, 3)
+    check("Array(Float32)", vectors.tolist(), vectors)
+    check("Array(Array(Int64))", vectors.astype(np.int64).reshape(2, 2, 3).tolist(), vectors.astype(np.int64).reshape(2, 2, 3))
+
+    tags = [["a", "b"], [], ["c"], ["d", "e", "f"]]
+    check("Array(String)", tags[1:], pa.array(tags)[1:])
+    check("Array(String)", tags, pa.chunked_array([pa.array(tags[:2]), pa.array(tags[2:])]))
+    nested = [[[1, 2], []], [[3]], []]
+    check("Array(Array(UInt16))", nested, pa.array(nested, type=pa.large_list(pa.list_(pa.uint16()))))
+    check("Array(Nullable(Int32))", [[1, None], [3]], pa.array([[1, None], [3]]))
+    check("Array(UInt8)", [[1, 2], [3, 4]], pa.array([[1, 2], [3, 4]], type=pa.list_(pa.uint8(), 2)))
+
+
 def test_bad_columns():
     data = [["str"], [3.5]]
     names = ["value"]
@@ -155,3 +206,40 @@ def test_bad_columns():
         native_insert_block(data, names, types)
     except ProgrammingError:
         pass
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd", "gzip"])
+def test_pipelined_insert_matches_serial(compression):
+    names = ["key", "value", "ts"]
+    types = [get_from_name("UInt32"), get_from_name("Nullable(String)"), get_from_name("DateTime")]
+    data = [(x, None if x % 7 == 0 else f"value_{x}", datetime(2024, 1, 1) + timedelta(seconds=x)) for x in range(5000)]
+
+    def build():
+        context = InsertContext("table", names, types, data, compression=compression, block_size=300)
+        return b"".join(NativeTransform.build_insert(context))
+
+    serial = build()
+    common.set_setting("encode_workers", 4)
+    try:
+        pipelined = build()
+    finally:
+        common.set_setting("encode_workers", 0)
+    if compression == "lz4":
+        serial = lz4.frame.decompress(serial)
+        pipelined = lz4.frame.decompress(pipelined)
+    assert pipelined == serial
+
+
+def test_pipelined_insert_error():
+    names = ["value"]
+    types = [get_from_name("Int32")]
+    data = [[x] for x in range(1000)] + [[None]]
+    context = InsertContext("table", names, types, data, block_size=100)
+    common.set_setting("encode_workers", 4)
+    try:
+        chunks = list(NativeTransform.build_insert(context))
+    finally:
+        common.set_setting("encode_workers", 0)
+    assert chunks[-1] == b"INTERNAL EXCEPTION WHILE SERIALIZING"
+    assert len(chunks) == 11
+    assert isinstance(context.insert_exception, TypeError)
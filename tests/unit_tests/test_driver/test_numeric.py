@@ -1,11 +1,17 @@
 import unittest
+from decimal import Decimal
 from unittest.mock import Mock
 
 import numpy as np
 
 from clickhouse_connect.datatypes.base import TypeDef
 from clickhouse_connect.datatypes.numeric import BFloat16
+from clickhouse_connect.datatypes.registry import get_from_name
 from clickhouse_connect.driver.buffer import ResponseBuffer
+from clickhouse_connect.driver.exceptions import DataError
+from clickhouse_connect.driver.insert import InsertContext
+from clickhouse_connect.driver.query import QueryContext
+from tests.helpers import bytes_source
 
 
 def create_test_source(data: bytes):
@@ -101,5 +107,123 @@ class TestBFloat16(unittest.TestCase):
         self.assertEqual(len(dest), 2 * len(sample))
 
 
+class TestBigInt(unittest.TestCase):
+    values = [0, 1, 2**64 + 5, 2**127 - 1, -(2**127)]
+
+    def _write(self, type_name, data):
+        dest = bytearray()
+        get_from_name(type_name).write_column_data(data, dest, InsertContext("table", ["col"], [get_from_name(type_name)]))
+        return bytes(dest)
+
+    def _read(self, type_name, data, num_rows, **ctx_kwargs):
+        ctx = QueryContext(**ctx_kwargs)
+        ctx.start_column("col")
+        return get_from_name(type_name).read_column_data(bytes_source(data), num_rows, ctx, None)
+
+    def test_roundtrip(self):
+        data = self._write("Int128", self.values)
+        self.assertEqual(data, b"".join(x.to_bytes(16, "little", signed=True) for x in self.values))
+        self.assertEqual(list(self._read("Int128", data, 5)), self.values)
+        self.assertEqual(self._read("Int128", data, 5, query_formats={"Int128": "string"}), [str(x) for x in self.values])
+
+    def test_nullable_string_format(self):
+        data = self._write("Nullable(UInt256)", ["7", None, str(2**255)])
+        column = self._read("Nullable(UInt256)", data, 3, query_formats={"UInt256": "string"})
+        self.assertEqual(column, ["7", None, str(2**255)])
+
+    def test_numpy_object_column(self):
+        data = self._write("Int128", self.values)
+        column = self._read("Int128", data, 5, use_numpy=True)
+        self.assertEqual(column.dtype, object)
+        self.assertEqual(column.tolist(), self.values)
+
+    def test_hilo_format(self):
+        data = self._write("Nullable(UInt128)", [2**64 + 5, None, 3])
+        column = self._read("Nullable(UInt128)", data, 3, use_numpy=True, query_formats={"UInt128": "hilo"})
+        self.assertEqual(column["hi"].tolist(), [1, 0, 0])
+        self.assertEqual(column["lo"].tolist(), [5, 0, 3])
+        self.assertEqual(self._write("UInt128", column), data[3:])
+
+        data = self._write("Int128", [-1, -(2**64)])
+        column = self._read("Int128", data, 2, use_numpy=True, query_formats={"Int128": "hilo"})
+        self.assertEqual(column["hi"].tolist(), [-1, -1])
+        self.assertEqual(column["lo"].tolist(), [2**64 - 1, 0])
+
+    def test_hilo_write_field_order(self):
+        # Fields are matched by name, so a hi first array encodes the same values
+        column = np.array([(1, 2), (0, 7)], dtype=[("hi", "<u8"), ("lo", "<u8")])
+        self.assertEqual(self._write("UInt128", column), self._write("UInt128", [2**64 + 2, 7]))
+        column = np.array([(-1, 0)], dtype=[("hi", "<i8"), ("lo", "<u8")])
+        self.assertEqual(self._write("Int128", column), self._write("Int128", [-(2**64)]))
+
+    def test_hilo_write_256_bit(self):
+        # hi and lo only cover 128 bits, so 256 bit columns don't take the structured path
+        column = np.array([(1, 2)], dtype=[("hi", "<u8"), ("lo", "<u8")])
+        for type_name in ("UInt256", "Int256"):
+            with self.assertRaises(TypeError):
+                self._write(type_name, column)
+
+
+class TestDecimal(unittest.TestCase):
+    values = [Decimal("1.25"), Decimal("-3.10"), Decimal("0.29")]
+
+    def _write(self, type_name, data, **ctx_kwargs):
+        dest = bytearray()
+        ctx = InsertContext("table", ["col"], [get_from_name(type_name)], **ctx_kwargs)
+        ctx.start_column("col")
+        get_from_name(type_name).write_column_data(data, dest, ctx)
+        return bytes(dest)
+
+    def _read(self, type_name, data, num_rows, **ctx_kwargs):
+        ctx = QueryContext(**ctx_kwargs)
+        ctx.start_column("col")
+        return get_from_name(type_name).read_column_data(bytes_source(data), num_rows, ctx, None)
+
+    def test_scaled_formats(self):
+        for type_name in ("Decimal(9, 2)", "Decimal(18, 2)", "Decimal(38, 2)", "Decimal(76, 2)"):
+            data = self._write(type_name, self.values)
+            self.assertEqual(list(self._read(type_name, data, 3)), self.values)
+            int_fmt = {"query_formats": {"Decimal*": "int"}}
+            self.assertEqual(list(self._read(type_name, data, 3, **int_fmt)), [125, -310, 29])
+            self.assertEqual(list(self._read(type_name, data, 3, query_formats={"Decimal*": "float"})), [1.25, -3.1, 0.29])
+            column = self._read(type_name, data, 3, use_numpy=True, query_formats={"Decimal*": "float"})
+            self.assertEqual(column.dtype, np.float64)
+            self.assertEqual(column.tolist(), [1.25, -3.1, 0.29])
+            self.assertEqual(self._write(type_name, [125, -310, 29], column_formats={"col": "int"}), data)
+            self.assertEqual(self._write(type_name, np.array([125, -310, 29]), column_formats={"col": "int"}), data)
+            self.assertEqual(self._write(type_name, np.array([1.25, -3.1, 0.29])), data)
+
+    def test_numpy_scaling_range(self):
+        # Scaled NumPy values that don't fit the precision are rejected instead of wrapping in int64
+        for type_name, column in (("Decimal(18, 10)", np.array([10**9])), ("Decimal(9, 2)", np.array([1e7, 1.0]))):
+            with self.assertRaises(DataError):
+                self._write(type_name, column)
+        self.assertEqual(self._write("Decimal(18, 10)", np.array([10**7])), self._write("Decimal(18, 10)", [10**7]))
+        # 128 and 256 bit decimals are scaled as Python ints, and their floats keep every digit
+        for type_name in ("Decimal(38, 20)", "Decimal(76, 40)"):
+            self.assertEqual(self._write(type_name, np.array([3, -2**40])), self._write(type_name, [3, -2**40]))
+            values = [float(Decimal("0.1234567890123456789")), float(Decimal("12345678901234567.5"))]
+            self.assertEqual(self._write(type_name, np.array(values)), self._write(type_name, values))
+        with self.assertRaises(DataError):
+            self._write("Decimal(38, 20)", np.array([10**18]))
+
+    def test_numpy_non_finite(self):
+        # NaN and infinity raise for every width instead of being written as zero
+        for type_name in ("Decimal(9, 2)", "Decimal(18, 4)"):
+            for value in (np.nan, np.inf):
+                with self.assertRaises(DataError):
+                    self._write(type_name, np.array([1.5, value]))
+        with self.assertRaises(ValueError):
+            self._write("Decimal(38, 2)", np.array([1.5, np.nan]))
+
+    def test_nullable_scaled_formats(self):
+        data = self._write("Nullable(Decimal(18, 4))", [Decimal("7.0001"), None])
+        self.assertEqual(self._read("Nullable(Decimal(18, 4))", data, 2, query_formats={"Decimal*": "int"}), [70001, None])
+        self.assertEqual(self._write("Nullable(Decimal(18, 4))", [70001, None], column_formats={"col": "int"}), data)
+        column = self._read("Nullable(Decimal(18, 4))", data, 2, use_numpy=True, use_none=False, query_formats={"Decimal*": "float"})
+        self.assertEqual(column[0], 7.0001)
+        self.assertTrue(np.isnan(column[1]))
+
+
 if __name__ == "__main__":
     unittest.main()
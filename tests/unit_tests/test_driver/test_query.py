@@ -1,3 +1,6 @@
+import asyncio
+import io
+import threading
 import zoneinfo
 from datetime import timedelta, timezone
 
@@ -6,9 +9,12 @@ import pytest
 
 from clickhouse_connect.driver import query as query_module
 from clickhouse_connect.driver import tzutil
-from clickhouse_connect.driver.client import _strip_utc_timezone_from_arrow
+from clickhouse_connect.driver.asyncclient import AsyncClient
+from clickhouse_connect.driver.binding import bind_query
+from clickhouse_connect.driver.client import Client, _strip_utc_timezone_from_arrow
 from clickhouse_connect.driver.exceptions import ProgrammingError
 from clickhouse_connect.driver.query import QueryContext
+from clickhouse_connect.driver.streaming import PrefetchSource
 
 
 def test_copy_context():
@@ -725,3 +731,172 @@ def test_query_context_utc_query_tz_without_tzdata(monkeypatch):
 
     ctx = QueryContext(column_tzs={"ts": "Etc/UTC"})
     assert tzutil_mod.is_utc_timezone(ctx.column_tzs["ts"])
+
+
+def _arrow_stream_table():
+    return pa.table({"key": list(range(100)), "value": [f"value_{x}" for x in range(100)]})
+
+
+@pytest.mark.parametrize("source_type", ["table", "reader", "iterator"])
+def test_arrow_stream_round_trip(monkeypatch, source_type):
+    monkeypatch.setattr(query_module, "ARROW_STREAM_CHUNK_SIZE", 256)
+    table = _arrow_stream_table()
+    batches = table.to_batches(max_chunksize=10)
+    if source_type == "table":
+        source = pa.Table.from_batches(batches)
+    elif source_type == "reader":
+        source = pa.RecordBatchReader.from_batches(table.schema, batches)
+    else:
+        source = iter(batches)
+    column_names, chunks = query_module.arrow_stream(source, "lz4")
+    chunks = list(chunks)
+    assert column_names == ["key", "value"]
+    assert len(chunks) > 2
+    assert pa.ipc.open_stream(b"".join(chunks)).read_all().equals(table)
+
+
+class _ArrowInsertClient:
+    insert_arrow = Client.insert_arrow
+    write_compression = None
+
+    def __init__(self):
+        self.retry_blocks = []
+
+    def _add_integration_tag(self, _name):
+        pass
+
+    def _raw_insert(self, table, column_names, insert_block, settings, fmt, transport_settings, retry_block):
+        self.retry_blocks.append(retry_block)
+        body = b"".join(insert_block)
+        if retry_block is not None:
+            assert b"".join(retry_block()) == body
+        return pa.ipc.open_stream(body).read_all()
+
+    def raw_insert(self, table, column_names, insert_block, settings, fmt, transport_settings=None):
+        return self._raw_insert(table, column_names, insert_block, settings, fmt, transport_settings, None)
+
+
+def test_insert_arrow_retry_block():
+    client = _ArrowInsertClient()
+    table = _arrow_stream_table()
+    assert client.insert_arrow("events", table).equals(table)
+    assert client.insert_arrow("events", table.to_batches()[0]).equals(table)
+    # Readers and iterators are consumed by the first attempt, so they can not be sent again
+    client.insert_arrow("events", pa.RecordBatchReader.from_batches(table.schema, table.to_batches()))
+    client.insert_arrow("events", iter(table.to_batches()))
+    assert [block is not None for block in client.retry_blocks] == [True, True, False, False]
+
+
+def test_async_insert_arrow_retry_block():
+    table = _arrow_stream_table()
+
+    class Backend:
+        async def execute_raw_insert(self, table_name, column_names, body, fmt, compression, runtime, transport_settings, retry_body):
+            first = b"".join([chunk async for chunk in body])
+            # Simulate a connection reset after the body was sent
+            second = b"".join([chunk async for chunk in await retry_body()])
+            assert first == second
+            return {"written_rows": str(pa.ipc.open_stream(second).read_all().num_rows)}
+
+    class AsyncArrowInsertClient(_ArrowInsertClient):
+        insert_arrow = AsyncClient.insert_arrow
+        _raw_insert = AsyncClient._raw_insert
+        database = None
+        _backend = Backend()
+
+        def _validate_settings(self, settings):
+            return settings
+
+    assert asyncio.run(AsyncArrowInsertClient().insert_arrow("events", table)).written_rows == 100
+
+
+def test_arrow_stream_requires_batches():
+    with pytest.raises(ProgrammingError):
+        query_module.arrow_stream(iter([]))
+
+
+def test_read_arrow_stream(monkeypatch):
+    monkeypatch.setattr(PrefetchSource, "READ_BUFFER_SIZE", 64)
+    table = _arrow_stream_table()
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=7):
+            writer.write_batch(batch)
+    stream = io.BytesIO(sink.getvalue())
+    assert query_module.read_arrow_stream(stream).equals(table)
+    assert stream.closed
+
+
+def test_read_arrow_stream_read_error():
+    class FailingStream(io.RawIOBase):
+        def read(self, size=-1):
+            raise OSError("connection reset")
+
+    with pytest.raises(OSError, match="connection reset"):
+        query_module.read_arrow_stream(FailingStream())
+
+
+def test_split_queries():
+    assert query_module.split_queries("SELECT id FROM t -- all rows;\n", "id", 2) == [
+        "SELECT * FROM (\nSELECT id FROM t -- all rows\n) WHERE modulo(cityHash64(id), 2) = 0",
+        "SELECT * FROM (\nSELECT id FROM t -- all rows\n) WHERE modulo(cityHash64(id), 2) = 1",
+    ]
+    assert query_module.split_queries("SELECT id FROM t;", ["id < 10", "id >= 10"], 8) == [
+        "SELECT * FROM (\nSELECT id FROM t\n) WHERE id < 10",
+        "SELECT * FROM (\nSELECT id FROM t\n) WHERE id >= 10",
+    ]
+    with pytest.raises(ProgrammingError):
+        query_module.split_queries("SELECT 1", [], 1)
+    with pytest.raises(ProgrammingError):
+        query_module.split_queries("SELECT 1", "id", 0)
+
+
+def test_split_queries_positional_parameters():
+    # The hash conditions contain no % for client side binding to misread
+    queries = query_module.split_queries("SELECT id FROM t WHERE id > %s", "id", 2)
+    assert [bind_query(split_query, [5])[0] for split_query in queries] == [
+        "SELECT * FROM (\nSELECT id FROM t WHERE id > 5\n) WHERE modulo(cityHash64(id), 2) = 0",
+        "SELECT * FROM (\nSELECT id FROM t WHERE id > 5\n) WHERE modulo(cityHash64(id), 2) = 1",
+    ]
+
+
+class _SplitClient:
+    _parallel_query = Client._parallel_query
+    query_arrow_parallel = Client.query_arrow_parallel
+
+    def __init__(self, session_id=None):
+        self.session_id = session_id
+        self.threads = set()
+
+    def get_client_setting(self, _key):
+        return self.session_id
+
+    def query_arrow(self, query, parameters, settings, use_strings=None):
+        self.threads.add(threading.get_ident())
+        split = int(query.rsplit(" ", 1)[-1])
+        return pa.table({"split": [split, split], "offset": [parameters["offset"]] * 2})
+
+
+def test_parallel_query_order():
+    client = _SplitClient()
+    table = client.query_arrow_parallel("SELECT 1", "id", 3, parameters={"offset": 5}, use_strings=True)
+    assert table.column("split").to_pylist() == [0, 0, 1, 1, 2, 2]
+    assert table.column("offset").to_pylist() == [5] * 6
+
+    client = _SplitClient("session")
+    client.query_arrow_parallel("SELECT 1", "id", 3, parameters={"offset": 5})
+    assert client.threads == {threading.get_ident()}
+
+
+def test_async_parallel_query_order():
+    class AsyncSplitClient(_SplitClient):
+        _parallel_query = AsyncClient._parallel_query
+        query_arrow_parallel = AsyncClient.query_arrow_parallel
+
+        async def query_arrow(self, query, parameters, settings, use_strings=None):
+            # Later splits finish first, but the results keep split order
+            await asyncio.sleep(0.01 * (3 - int(query[-1])))
+            return super().query_arrow(query, parameters, settings)
+
+    table = asyncio.run(AsyncSplitClient().query_arrow_parallel("SELECT 1", ["k = 0", "k = 1", "k = 2"], parameters={"offset": 1}))
+    assert table.column("split").to_pylist() == [0, 0, 1, 1, 2, 2]
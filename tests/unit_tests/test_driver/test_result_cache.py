@@ -0,0 +1,146 @@
+import io
+from datetime import timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from clickhouse_connect.datatypes.registry import get_from_name
+from clickhouse_connect.driver import resultcache
+from clickhouse_connect.driver._backend.models import QueryExecution
+from clickhouse_connect.driver.asyncclient import AsyncClient
+from clickhouse_connect.driver.httpclient import HttpClient
+from clickhouse_connect.driver.resultcache import CachedSource, ResultCache, result_key
+from clickhouse_connect.driver.transform import NativeTransform
+from tests.helpers import native_insert_block
+
+KEY_A = result_key("Native", "db1", "SELECT 1", {}, {})
+KEY_B = result_key("Native", "db1", "SELECT 2", {}, {})
+ROWS = [(1, "one"), (2, "two")]
+
+
+def test_result_key():
+    assert result_key("Native", "db1", "SELECT 1", {"a": "1", "b": "2"}, {"x": "1"}) == result_key(
+        "Native", "db1", "SELECT 1", {"b": "2", "a": "1"}, {"x": "1"}
+    )
+    assert KEY_A != result_key("Native", "db1", "SELECT 1", {}, {"max_threads": "1"})
+    assert KEY_A != result_key("ArrowStream", "db1", "SELECT 1", {}, {})
+
+
+def test_byte_budget_eviction():
+    cache = ResultCache(10, 60)
+    cache.put(KEY_A, (b"1234", b"56"), 6)
+    cache.put(KEY_B, (b"1234",), 4)
+    assert cache.get(KEY_A).chunks == (b"1234", b"56")
+    cache.put("c", (b"123",), 3)
+    assert cache.get(KEY_B) is None
+    assert cache.get(KEY_A) is not None
+    cache.put("d", (b"x" * 11,), 11)
+    assert cache.get("d") is None
+    assert cache.stats() == {"hits": 2, "misses": 2, "entries": 2, "bytes": 9}
+
+
+def test_ttl_expiration(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resultcache.time, "monotonic", lambda: now[0])
+    cache = ResultCache(100, 30)
+    cache.put(KEY_A, (b"abc",), 3)
+    now[0] += 29
+    assert cache.get(KEY_A) is not None
+    now[0] += 1
+    assert cache.get(KEY_A) is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_recorder_stores_complete_responses():
+    cache = ResultCache(10, 60)
+    recorder = cache.recorder(KEY_A, CachedSource((b"123", b"456")), "UTC", {"read_rows": "1"})
+    assert next(recorder.gen) == b"123"
+    assert cache.get(KEY_A) is None
+    assert list(recorder.gen) == [b"456"]
+    cached = cache.get(KEY_A)
+    assert list(cached.replay().gen) == [b"123", b"456"]
+    assert (cached.response_tz_name, cached.summary) == ("UTC", {"read_rows": "1"})
+
+    recorder = cache.recorder(KEY_B, CachedSource((b"123456", b"7890a")))
+    assert list(recorder.gen) == [b"123456", b"7890a"]
+    assert cache.get(KEY_B) is None
+
+
+def native_response():
+    return native_insert_block([[1, "one"], [2, "two"]], ["key", "value"], [get_from_name("UInt32"), get_from_name("String")])
+
+
+def cache_client(client):
+    client._result_cache = ResultCache(1024 * 1024, 60)
+    client._transform = NativeTransform()
+    client._backend = Mock()
+    return client
+
+
+def sync_client():
+    client = cache_client(HttpClient.__new__(HttpClient))
+    client.server_settings = {}
+    client.server_tz = timezone.utc
+    client.query_limit = 0
+    client.query_retries = 2
+    client._reported_libs = set()
+    return client
+
+
+def test_sync_query_cache():
+    client = sync_client()
+    client._backend.execute_query.side_effect = lambda *_args: QueryExecution(source=CachedSource((bytes(native_response()),)))
+    for _ in range(3):
+        assert client.query("SELECT key, value FROM t").result_rows == [(1, "one"), (2, "two")]
+    client.query("SELECT key, value FROM t", settings={"max_threads": 2}).close()
+    assert client._backend.execute_query.call_count == 2
+    assert client.result_cache_stats() == {"hits": 2, "misses": 2, "entries": 1, "bytes": len(native_response())}
+    client.clear_result_cache()
+    assert client.result_cache_stats()["entries"] == 0
+
+
+def test_sync_query_cache_client_settings():
+    client = sync_client()
+    client.params = {"session_id": "s1"}
+    client._backend.execute_query.side_effect = lambda *_args: QueryExecution(source=CachedSource((bytes(native_response()),)))
+    assert client.query("SELECT key, value FROM t").result_rows == ROWS
+    # Client level settings and the session change the response, so they are part of the key
+    client.params["max_result_rows"] = "10"
+    assert client.query("SELECT key, value FROM t").result_rows == ROWS
+    client.params = {"session_id": "s2", "max_result_rows": "10"}
+    assert client.query("SELECT key, value FROM t").result_rows == ROWS
+    assert client._backend.execute_query.call_count == 3
+    assert client.query("SELECT key, value FROM t").result_rows == ROWS
+    assert client._backend.execute_query.call_count == 3
+
+
+def test_sync_query_arrow_cache():
+    pyarrow = pytest.importorskip("pyarrow")
+    table = pyarrow.table({"key": [1, 2, 3]})
+    sink = io.BytesIO()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    client = sync_client()
+    client._backend.execute_raw_stream.side_effect = lambda *_args: io.BytesIO(sink.getvalue())
+    assert client.query_arrow("SELECT key FROM t").equals(table)
+    assert client.query_arrow("SELECT key FROM t").equals(table)
+    assert client._backend.execute_raw_stream.call_count == 1
+    assert client.result_cache_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_query_cache():
+    client = cache_client(AsyncClient(interface="http", host="localhost", port=8123))
+
+    async def execute_query(*_args):
+        source = CachedSource((bytes(native_response()),))
+        source.aclose = AsyncMock()
+        return QueryExecution(source=source)
+
+    client._backend.execute_query = AsyncMock(side_effect=execute_query)
+    for _ in range(2):
+        context = client.create_query_context(query="SELECT key, value FROM t")
+        result = await client._query_with_context(context)
+        assert result.result_rows == [(1, "one"), (2, "two")]
+    assert client._backend.execute_query.call_count == 1
+    assert client.result_cache_stats()["hits"] == 1
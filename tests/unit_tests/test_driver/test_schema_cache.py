@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+from clickhouse_connect.driver import schemacache
+from clickhouse_connect.driver.client import Client
+from clickhouse_connect.driver.exceptions import DatabaseError
+from clickhouse_connect.driver.models import ColumnDef
+from clickhouse_connect.driver.schemacache import SchemaCache, schema_key
+
+COLUMN_DEFS = (ColumnDef("key", "UInt32", "", "", "", "", ""),)
+
+
+def test_schema_key():
+    assert schema_key("`t1`", None) == "`t1`"
+    assert schema_key("`t1`", "db1") == "`db1`.`t1`"
+    assert schema_key("db2.t1", "db1") == "db2.t1"
+
+
+def test_lru_eviction():
+    cache = SchemaCache(2, 60)
+    cache.put("a", COLUMN_DEFS)
+    cache.put("b", COLUMN_DEFS)
+    assert cache.get("a") == COLUMN_DEFS
+    cache.put("c", COLUMN_DEFS)
+    assert cache.get("b") is None
+    assert cache.get("a") == COLUMN_DEFS
+    assert cache.get("c") == COLUMN_DEFS
+    assert len(cache) == 2
+
+
+def test_ttl_expiration(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(schemacache.time, "monotonic", lambda: now[0])
+    cache = SchemaCache(10, 30)
+    cache.put("a", COLUMN_DEFS)
+    now[0] += 29
+    assert cache.get("a") == COLUMN_DEFS
+    now[0] += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_client_invalidation():
+    cache = SchemaCache(10, 60)
+    client = SimpleNamespace(_schema_cache=cache, database="db1")
+    for key in ("`db1`.`t1`", "`db1`.`t2`", "`db2`.`t1`"):
+        cache.put(key, COLUMN_DEFS)
+
+    Client.invalidate_schema_cache(client, "t1")
+    assert cache.get("`db1`.`t1`") is None
+    assert cache.get("`db2`.`t1`") == COLUMN_DEFS
+
+    context = SimpleNamespace(table="`db2`.`t1`")
+    Client._check_schema_mismatch(client, context, DatabaseError("syntax", code=62))
+    assert cache.get("`db2`.`t1`") == COLUMN_DEFS
+    Client._check_schema_mismatch(client, context, DatabaseError("no such column", code=16))
+    assert cache.get("`db2`.`t1`") is None
+
+    Client.invalidate_schema_cache(client)
+    assert len(cache) == 0
@@ -0,0 +1,126 @@
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from clickhouse_connect import common
+from clickhouse_connect.driver import serverinfocache
+from clickhouse_connect.driver._backend.models import ClientConfig, ServerProbe
+from clickhouse_connect.driver._backend.operations import CommandOp
+from clickhouse_connect.driver._backend.orchestration import init_sequence, run_sync
+from clickhouse_connect.driver.exceptions import OperationalError
+from clickhouse_connect.driver.models import SettingDef
+from clickhouse_connect.driver.serverinfocache import ServerInfoCache, server_info_key, shared_server_info_cache
+
+SETTINGS = {"date_time_input_format": SettingDef("date_time_input_format", "basic", 0)}
+PROBE = ServerProbe("25.8.12.129", "Europe/Berlin", SETTINGS, 54405)
+RESPONSES = [("25.8.12.129", "Europe/Berlin"), [{"name": "date_time_input_format", "value": "basic", "readonly": 0}], b""]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(serverinfocache.time, "time", lambda: now[0])
+    return now
+
+
+def _scripted(responses):
+    operations = []
+    remaining = iter(responses)
+
+    def execute(operation):
+        operations.append(operation)
+        response = next(remaining)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return execute, operations
+
+
+def test_server_info_key():
+    key = server_info_key("https://host:8443", "analyst", "secret", {"role": "reader"})
+    assert key.startswith("analyst@https://host:8443#")
+    assert "secret" not in key
+    assert server_info_key("https://host:8443", "analyst", "secret", {"role": "reader"}) == key
+    # Different credentials, settings, or roles never share an entry
+    assert server_info_key("https://host:8443", "analyst", "wrong", {"role": "reader"}) != key
+    assert server_info_key("https://host:8443", "analyst", "secret", {"role": "writer"}) != key
+    assert server_info_key("https://host:8443", "analyst", "secret") != key
+    assert server_info_key("http://host:8123", None).startswith("@http://host:8123#")
+
+
+def test_expired_entry_is_refreshed_once(clock):
+    cache = ServerInfoCache(60)
+    assert cache.get("k") is None
+    cache.put("k", PROBE)
+    clock[0] += 59
+    assert cache.get("k") == PROBE
+
+    clock[0] += 1
+    assert cache.get("k") is None
+    # Clients created while the refresh is in flight keep using the expired entry
+    assert cache.get("k") == PROBE
+    cache.release("k")
+    assert cache.get("k") is None
+    cache.put("k", PROBE)
+    assert cache.get("k") == PROBE
+
+
+def test_file_persistence(tmp_path, clock):
+    path = str(tmp_path / "server_info.json")
+    ServerInfoCache(60, path).put("k", PROBE)
+
+    restored = ServerInfoCache(60, path)
+    assert restored.get("k") == PROBE
+    clock[0] += 60
+    assert restored.get("k") is None
+
+    restored.invalidate("k")
+    assert ServerInfoCache(60, path).get("k") is None
+
+
+def test_unreadable_file_is_ignored(tmp_path):
+    path = tmp_path / "server_info.json"
+    path.write_text("not json", encoding="utf-8")
+    cache = ServerInfoCache(60, str(path))
+    assert cache.get("k") is None
+    cache.put("k", PROBE)
+    assert ServerInfoCache(60, str(path)).get("k") == PROBE
+
+
+def test_init_sequence_uses_cache():
+    cache = ServerInfoCache(60)
+    execute, operations = _scripted(RESPONSES)
+    first = run_sync(init_sequence(ClientConfig(), cache, "k"), execute)
+    assert len(operations) == 3
+
+    execute, operations = _scripted([])
+    second = run_sync(init_sequence(ClientConfig(), cache, "k"), execute)
+    assert not operations
+    assert second == first
+    assert second.server_info.timezone == ZoneInfo("Europe/Berlin")
+    assert second.client_setting_writes == (("date_time_input_format", "best_effort"),)
+
+
+def test_init_sequence_failure_releases_refresh():
+    cache = ServerInfoCache(60)
+    execute, operations = _scripted([OperationalError("connection refused")])
+    with pytest.raises(OperationalError):
+        run_sync(init_sequence(ClientConfig(), cache, "k"), execute)
+    assert operations == [CommandOp("SELECT version(), timezone()", use_database=False)]
+    assert len(cache) == 0
+
+
+def test_shared_cache_settings(tmp_path):
+    assert shared_server_info_cache() is None
+    path = str(tmp_path / "server_info.json")
+    try:
+        common.set_setting("server_info_cache_ttl", 300)
+        cache = shared_server_info_cache()
+        assert cache is not None and cache.ttl == 300 and cache.path is None
+        assert shared_server_info_cache() is cache
+        common.set_setting("server_info_cache_file", path)
+        assert shared_server_info_cache().path == path
+    finally:
+        common.set_setting("server_info_cache_ttl", 0)
+        common.set_setting("server_info_cache_file", "")
@@ -0,0 +1,74 @@
+import asyncio
+import zlib
+
+import lz4.frame
+import pytest
+
+from clickhouse_connect.driver import tools
+from clickhouse_connect.driver.exceptions import ProgrammingError
+from clickhouse_connect.driver.tools import insert_file_async, insert_files_async
+
+
+class _RecordingClient:
+    """Async client stand-in that consumes the raw insert body the way the HTTP backend does"""
+
+    def __init__(self, write_compression=None):
+        self.write_compression = write_compression
+        self.inserts = []
+        self.active = 0
+        self.max_active = 0
+
+    async def raw_insert(self, table, column_names=None, insert_block=None, fmt=None, settings=None, compression=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        chunks = [chunk async for chunk in insert_block]
+        self.active -= 1
+        self.inserts.append((table, fmt, compression, chunks))
+        return len(chunks)
+
+
+def test_insert_file_async_streams_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(tools, "FILE_CHUNK_SIZE", 1000)
+    data = b"".join(f"{ix},name_{ix}\n".encode() for ix in range(1000))
+    file_path = tmp_path / "data.csv"
+    file_path.write_bytes(data)
+
+    client = _RecordingClient()
+    asyncio.run(insert_file_async(client, "test_table", str(file_path), database="db"))
+    table, fmt, compression, chunks = client.inserts[0]
+    assert (table, fmt, compression) == ("`db`.`test_table`", "CSVWithNames", None)
+    assert max(len(chunk) for chunk in chunks) == 1000
+    assert b"".join(chunks) == data
+
+    client = _RecordingClient("lz4")
+    asyncio.run(insert_file_async(client, "test_table", str(file_path)))
+    _, _, compression, chunks = client.inserts[0]
+    assert compression == "lz4"
+    assert len(chunks) > 1
+    assert b"".join(lz4.frame.decompress(chunk) for chunk in chunks) == data
+
+    gz_path = tmp_path / "data.csv.gz"
+    gz_data = zlib.compress(data, wbits=31)
+    gz_path.write_bytes(gz_data)
+    client = _RecordingClient("lz4")
+    asyncio.run(insert_file_async(client, "test_table", str(gz_path)))
+    _, _, compression, chunks = client.inserts[0]
+    assert compression == "gzip"
+    assert b"".join(chunks) == gz_data
+
+
+def test_insert_files_async_limits_concurrency(tmp_path):
+    for ix in range(6):
+        (tmp_path / f"part_{ix}.csv").write_bytes(f"{ix}\n".encode() * 100)
+    client = _RecordingClient()
+    summaries = asyncio.run(insert_files_async(client, "test_table", str(tmp_path), max_concurrency=2))
+    assert summaries == [1] * 6
+    assert sorted(b"".join(insert[3]) for insert in client.inserts) == [f"{ix}\n".encode() * 100 for ix in range(6)]
+    assert client.max_active <= 2
+
+    client = _RecordingClient()
+    asyncio.run(insert_files_async(client, "test_table", str(tmp_path / "part_[12].csv")))
+    assert len(client.inserts) == 2
+
+    with pytest.raises(ProgrammingError):
+        asyncio.run(insert_files_async(client, "test_table", str(tmp_path / "*.parquet")))
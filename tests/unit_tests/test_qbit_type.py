@@ -5,7 +5,10 @@ import pytest
 from clickhouse_connect.datatypes.registry import get_from_name
 from clickhouse_connect.datatypes.vector import QBit
 from clickhouse_connect.driver import options
+from clickhouse_connect.driver.insert import InsertContext
 from clickhouse_connect.driver.options import np
+from clickhouse_connect.driver.query import QueryContext
+from tests.helpers import bytes_source
 
 
 def test_qbit_type_registration():
@@ -667,3 +670,45 @@ def test_untranspose_numpy_vs_pure_python_equivalence():
 
         result_numpy = qbit._untranspose_row_numpy(bit_planes)
         assert len(result_python) == len(result_numpy)
+
+
+@pytest.mark.skipif(np is None, reason="Numpy not available")
+def test_column_numpy_vs_pure_python_equivalence():
+    """Test that whole column transpose writes the same bytes as the pure Python row path and reads them back"""
+    rows = [[float(i * j) / 3 for j in range(20)] for i in range(5)]
+    for elem_type in ("Float32", "Float64", "BFloat16"):
+        for nullable in (False, True):
+            type_name = f"QBit({elem_type}, 20)"
+            qbit = get_from_name(f"Nullable({type_name})" if nullable else type_name)
+            column = [None if nullable and i == 2 else row for i, row in enumerate(rows)]
+
+            original_np = options.np
+            try:
+                options.np = None
+                expected = bytearray()
+                qbit.write_column_data(column, expected, InsertContext("table", [], []))
+                python_read = qbit.read_column(bytes_source(bytes(expected)), len(column), QueryContext())
+            finally:
+                options.np = original_np
+
+            output = bytearray()
+            qbit.write_column_data(column, output, InsertContext("table", [], []))
+            assert output == expected
+            assert qbit.read_column(bytes_source(bytes(output)), len(column), QueryContext()) == python_read
+
+
+@pytest.mark.skipif(np is None, reason="Numpy not available")
+def test_column_numpy_2d_read():
+    """Test that numpy queries read a QBit column into a single 2-D array"""
+    qbit = get_from_name("QBit(Float32, 12)")
+    matrix = np.arange(36, dtype=np.float32).reshape(3, 12) - 7.5
+    output = bytearray()
+    qbit.write_column_data(matrix, output, InsertContext("table", [], []))
+    result = qbit.read_column(bytes_source(bytes(output)), 3, QueryContext(use_numpy=True))
+    assert isinstance(result, np.ndarray)
+    assert result.shape == (3, 12)
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, matrix)
+
+    with pytest.raises(ValueError, match="dimension mismatch"):
+        qbit.write_column_data(matrix[:, :8], bytearray(), InsertContext("table", [], []))
@@ -8,12 +8,18 @@ from unittest.mock import Mock
 import lz4.frame
 import pytest
 
+from clickhouse_connect.datatypes.registry import get_from_name
+from clickhouse_connect.driver.asyncclient import AsyncClient
 from clickhouse_connect.driver.compression import _zstd_compress
+from clickhouse_connect.driver.ctypes import RespBuffCls
 from clickhouse_connect.driver.exceptions import OperationalError
+from clickhouse_connect.driver.query import QueryContext, QueryResult
 from clickhouse_connect.driver.streaming import (
     StreamingInsertSource,
     StreamingResponseSource,
 )
+from clickhouse_connect.driver.transform import NativeTransform
+from tests.helpers import native_insert_block
 
 
 class MockAsyncIterator:
@@ -485,5 +491,49 @@ async def test_streaming_insert_backpressure():
     assert received == chunks
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("flatten", [True, False])
+async def test_queued_result_stream(flatten):
+    """Test that async result streams decode whole blocks off the event loop and yield them through the queue."""
+    names = ["key", "value"]
+    types = [get_from_name("UInt32"), get_from_name("String")]
+    data = [[x, f"value_{x}"] for x in range(50)]
+    block = bytes(native_insert_block(data, names, types))
+    response = MockResponse([block[:40], block[40:], block])
+    source = StreamingResponseSource(response, encoding=None)
+    loop = asyncio.get_running_loop()
+    await source.start_producer(loop)
+
+    result = await loop.run_in_executor(None, lambda: NativeTransform.parse_response(RespBuffCls(source), QueryContext(streaming=True)))
+    result.source = source
+    stream = AsyncClient._queued_result_stream(result, result._row_block_stream, flatten=flatten)
+    assert stream.source is result
+    assert stream.source.column_names == ("key", "value")
+    received = []
+    async with stream:
+        async for item in stream:
+            received.append(item)
+
+    expected = [tuple(row) for row in data] * 2
+    if flatten:
+        assert received == expected
+    else:
+        assert [row for row_block in received for row in row_block] == expected
+
+
+@pytest.mark.asyncio
+async def test_queued_result_stream_starts_on_read():
+    """Test that an async result stream starts no producer until it is read, and still closes its response."""
+    response = MockResponse([b"unread"])
+    source = StreamingResponseSource(response, encoding=None)
+    result = QueryResult(block_gen=(block for block in ()), column_names=("key",), source=source)
+    pumped = []
+    stream = AsyncClient._queued_result_stream(result, lambda: pumped.append(True) or iter([]))
+    async with stream:
+        pass
+    assert not pumped
+    assert result.source is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])